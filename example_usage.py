@@ -19,10 +19,10 @@ laptop_profile = get_profile("laptop")
 
 analyzer = MeetingAnalyzer(
     video_path="path/to/your/meeting.mp4",
-    text_model=laptop_profile["text_model"],
-    vision_model=laptop_profile["vision_model"],
-    whisper_model=laptop_profile["whisper_model"],
-    vision_on_cpu=laptop_profile["vision_on_cpu"],
+    text_model=laptop_profile.text_model,
+    vision_model=laptop_profile.vision_model,
+    whisper_model=laptop_profile.whisper_model,
+    vision_on_cpu=laptop_profile.vision_on_cpu,
     output_dir="output/example1"
 )
 
@@ -40,10 +40,10 @@ pc_profile = get_profile("pc")
 
 analyzer = MeetingAnalyzer(
     video_path="path/to/your/meeting.mp4",
-    text_model=pc_profile["text_model"],
-    vision_model=pc_profile["vision_model"],
-    whisper_model=pc_profile["whisper_model"],
-    vision_on_cpu=pc_profile["vision_on_cpu"],
+    text_model=pc_profile.text_model,
+    vision_model=pc_profile.vision_model,
+    whisper_model=pc_profile.whisper_model,
+    vision_on_cpu=pc_profile.vision_on_cpu,
     output_dir="output/example2"
 )
 
@@ -80,10 +80,10 @@ laptop_profile = get_profile("laptop")
 analyzer = MeetingAnalyzer(
     video_path="path/to/your/meeting.mp4",
     lm_studio_url="http://localhost:1234/v1",
-    text_model=laptop_profile["text_model"],
-    vision_model=laptop_profile["vision_model"],
+    text_model=laptop_profile.text_model,
+    vision_model=laptop_profile.vision_model,
     whisper_model="medium",  # Override: use medium instead of small
-    vision_on_cpu=laptop_profile["vision_on_cpu"],
+    vision_on_cpu=laptop_profile.vision_on_cpu,
     output_dir="output/example4"
 )
 
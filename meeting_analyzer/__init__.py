@@ -6,16 +6,36 @@ Processes video and audio to generate Software Requirements Specification (SRS)
 __version__ = "1.0.0"
 __author__ = "Meeting Analyzer Team"
 
-from .analyzer import MeetingAnalyzer
-from .video_processor import VideoProcessor
-from .audio_processor import AudioProcessor
-from .ai_analyzer import AIAnalyzer
-from .srs_generator import SRSGenerator
+import importlib
 
 __all__ = [
     'MeetingAnalyzer',
+    'MeetingAnalyzerBatch',
     'VideoProcessor',
     'AudioProcessor',
     'AIAnalyzer',
     'SRSGenerator',
 ]
+
+# Public classes are imported on first access (PEP 562), so importing the
+# package does not pull in openai, cv2, faster_whisper, docx, ...
+_LAZY = {
+    'MeetingAnalyzer': 'analyzer',
+    'MeetingAnalyzerBatch': 'analyzer',
+    'VideoProcessor': 'video_processor',
+    'AudioProcessor': 'audio_processor',
+    'AIAnalyzer': 'ai_analyzer',
+    'SRSGenerator': 'srs_generator',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(f".{_LAZY[name]}", __name__), name)
+        globals()[name] = value  # Cache so later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,7 @@
+"""
+Allow running the command-line interface with `python -m meeting_analyzer`
+"""
+
+from .cli import main
+
+main()
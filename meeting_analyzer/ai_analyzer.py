@@ -3,11 +3,332 @@ AI analyzer module for combining visual and audio analysis
 """
 
 import os
-import json
-from typing import List, Dict, Optional
+import io
+import asyncio
+import functools
+import hashlib
+import importlib.util
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Optional
 import base64
 from pathlib import Path
 
+from . import json_utils
+from .file_utils import write_bytes_atomically
+
+logger = logging.getLogger(__name__)
+
+# Sync clients shared by all analyzers pointing at the same endpoint, so they
+# reuse one connection pool instead of opening a new one per instance
+_CLIENT_CACHE: Dict[tuple, "OpenAI"] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+_DATA_URL_PREFIX = b"data:image/jpeg;base64,"
+
+# Rough characters-per-token ratio used when tiktoken is unavailable
+_CHARS_PER_TOKEN = 4
+
+# Invariant instructions are sent as the leading system message, byte-identical
+# on every call, so servers with prefix caching (LM Studio, llama.cpp, vLLM)
+# only process them once. Do not interpolate anything into these.
+VISION_SYSTEM_PROMPT = """Analyze screenshots from a meeting recording.
+Describe what you see including:
+- UI elements, screens, or app interfaces
+- Diagrams, charts, or visual aids
+- Text content visible
+- Any features or functionality being shown
+Be detailed and technical."""
+
+VISION_USER_TEXT = "Analyze this screenshot."
+
+# Changes whenever the vision prompt changes, invalidating cached frame analyses
+_VISION_PROMPT_VERSION = hashlib.blake2b(
+    (VISION_SYSTEM_PROMPT + VISION_USER_TEXT).encode('utf-8'), digest_size=8
+).hexdigest()
+
+SRS_SYSTEM_PROMPT = """You are an expert business analyst creating Software Requirements Specifications.
+
+You are analyzing a meeting recording to create a Software Requirements Specification (SRS).
+The user provides the audio transcript and an analysis of the visual content.
+
+Based on the meeting content, extract and organize the following:
+
+1. PROJECT OVERVIEW
+   - Project name/title
+   - Purpose and objectives
+   - Scope
+
+2. FUNCTIONAL REQUIREMENTS
+   - List all features and functionality mentioned
+   - User stories or use cases
+   - Specific capabilities required
+
+3. NON-FUNCTIONAL REQUIREMENTS
+   - Performance requirements
+   - Security requirements
+   - Usability requirements
+   - Any other quality attributes
+
+4. TECHNICAL REQUIREMENTS
+   - Technologies mentioned
+   - Platforms or frameworks
+   - Integration requirements
+
+5. ISSUES AND CONCERNS
+   - Problems identified
+   - Risks mentioned
+   - Constraints
+
+6. UI/UX REQUIREMENTS
+   - Interface designs or mockups shown
+   - User flow descriptions
+   - Visual design requirements
+
+Provide a comprehensive but concise analysis in JSON format, using the keys
+project_overview, functional_requirements, non_functional_requirements,
+technical_requirements, issues_and_concerns and ui_ux_requirements."""
+
+_STRING = {"type": "string"}
+_STRING_LIST = {"type": "array", "items": _STRING}
+
+
+def _object_schema(properties: Dict) -> Dict:
+    """Build a strict JSON schema object where every property is required"""
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False
+    }
+
+
+# Mirrors the sections of SRS_SYSTEM_PROMPT, using the keys SRSGenerator reads.
+# Servers with constrained decoding (LM Studio, llama.cpp, vLLM) then always
+# return bare, valid JSON.
+SRS_JSON_SCHEMA = _object_schema({
+    "project_overview": _object_schema({
+        "project_name": _STRING,
+        "purpose": _STRING,
+        "scope": _STRING
+    }),
+    "functional_requirements": _STRING_LIST,
+    "non_functional_requirements": _object_schema({
+        "performance": _STRING,
+        "security": _STRING,
+        "usability": _STRING,
+        "other": _STRING
+    }),
+    "technical_requirements": _object_schema({
+        "technologies": _STRING,
+        "platforms": _STRING,
+        "integrations": _STRING
+    }),
+    "issues_and_concerns": _STRING_LIST,
+    "ui_ux_requirements": _STRING
+})
+
+SRS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "srs_requirements",
+        "strict": True,
+        "schema": SRS_JSON_SCHEMA
+    }
+}
+
+# Per-call user message; only the placeholders vary between runs
+SRS_PROMPT_TEMPLATE = """AUDIO TRANSCRIPT:
+{audio_context}
+
+VISUAL CONTENT ANALYSIS:
+{visual_context}"""
+
+TRANSCRIPT_SUMMARY_PROMPT = """You are summarizing one part of a meeting transcript.
+Keep every requirement, feature, decision, technology, constraint and concern
+that is mentioned. Drop small talk and repetition. Reply with the summary only."""
+
+
+@functools.lru_cache(maxsize=16)
+def _encode_file(image_path: str, mtime_ns: int, max_side: Optional[int] = None) -> bytes:
+    """
+    Base64 encode an image, cached per (path, mtime, max_side) so re-runs skip re-encoding
+    
+    Args:
+        image_path: Path to image file
+        mtime_ns: Modification time of the file (part of the cache key)
+        max_side: If set, down-scale so the longest side is at most this many
+            pixels and re-encode as JPEG before encoding
+        
+    Returns:
+        Base64 encoded image as bytes
+    """
+    if max_side:
+        try:
+            from PIL import Image
+        except ImportError:
+            Image = None
+        
+        if Image is not None:
+            with Image.open(image_path) as img:
+                if max(img.size) > max_side:
+                    if img.mode != "RGB":
+                        img = img.convert("RGB")
+                    img.thumbnail((max_side, max_side), Image.LANCZOS)
+                    buffer = io.BytesIO()
+                    img.save(buffer, format="JPEG", quality=85, optimize=True)
+                    return base64.b64encode(buffer.getbuffer())
+    
+    # Read straight into a preallocated buffer to avoid an intermediate copy
+    buffer = bytearray(os.path.getsize(image_path))
+    with open(image_path, "rb") as image_file:
+        image_file.readinto(buffer)
+    return base64.b64encode(buffer)
+
+
+def _size_bucket(image_path: str) -> int:
+    """
+    Classify an image by resolution: 0 (<720p), 1 (720p-1080p), 2 (>1080p)
+    
+    Only the image header is read; pixel data is not decoded.
+    
+    Args:
+        image_path: Path to image file
+        
+    Returns:
+        Bucket index
+    """
+    try:
+        from PIL import Image
+        with Image.open(image_path) as img:
+            height = min(img.size)
+    except Exception:
+        return 0
+    if height < 720:
+        return 0
+    if height <= 1080:
+        return 1
+    return 2
+
+
+@functools.lru_cache(maxsize=None)
+def _import_openai():
+    """
+    Import the OpenAI client library on first use
+    
+    Loading it takes a noticeable part of a second, which the CLI should
+    not pay just to print --help.
+    
+    Returns:
+        The openai module
+    """
+    try:
+        import openai
+    except ImportError:
+        raise ImportError(
+            "OpenAI client library required for LM Studio compatibility. "
+            "Install with: pip install openai"
+        )
+    return openai
+
+
+def _get_client(base_url: str, api_key: str = "lm-studio") -> "OpenAI":
+    """
+    Get a shared OpenAI client for an endpoint
+    
+    Args:
+        base_url: API base URL
+        api_key: API key (placeholder for LM Studio, which does not validate it)
+        
+    Returns:
+        OpenAI client
+    """
+    openai = _import_openai()
+    
+    key = (base_url, api_key)
+    with _CLIENT_CACHE_LOCK:
+        client = _CLIENT_CACHE.get(key)
+        if client is None:
+            client = openai.OpenAI(base_url=base_url, api_key=api_key)
+            _CLIENT_CACHE[key] = client
+    return client
+
+
+@functools.lru_cache(maxsize=None)
+def _get_encoding():
+    """
+    Get the tokenizer used to measure prompts
+    
+    cl100k_base is not the local models' own tokenizer, but it is a close
+    enough proxy for budgeting.
+    
+    Returns:
+        tiktoken Encoding, or None if tiktoken is unavailable
+    """
+    try:
+        import tiktoken  # Imported on first use; it is slow to load
+    except ImportError:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # The encoding file is downloaded on first use, which fails offline
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count (or estimate) the number of tokens in a text
+    
+    Args:
+        text: Text to measure
+        
+    Returns:
+        Token count; estimated from the length if tiktoken is unavailable
+    """
+    enc = _get_encoding()
+    if enc is None:
+        return -(-len(text) // _CHARS_PER_TOKEN)
+    return len(enc.encode(text, disallowed_special=()))
+
+
+def _token_slices(text: str, max_tokens: int) -> List[str]:
+    """
+    Split a text into consecutive slices of at most max_tokens tokens
+    
+    Args:
+        text: Text to split
+        max_tokens: Maximum tokens per slice
+        
+    Returns:
+        List of text slices
+    """
+    enc = _get_encoding()
+    if enc is None:
+        step = max_tokens * _CHARS_PER_TOKEN
+        return [text[i:i + step] for i in range(0, len(text), step)]
+    tokens = enc.encode(text, disallowed_special=())
+    return [enc.decode(tokens[i:i + max_tokens]) for i in range(0, len(tokens), max_tokens)]
+
+
+def _truncate_tokens(text: str, max_tokens: int) -> str:
+    """
+    Truncate a text to at most max_tokens tokens
+    
+    Args:
+        text: Text to truncate
+        max_tokens: Maximum number of tokens to keep
+        
+    Returns:
+        Truncated text
+    """
+    enc = _get_encoding()
+    if enc is None:
+        return text[:max_tokens * _CHARS_PER_TOKEN]
+    tokens = enc.encode(text, disallowed_special=())
+    return text if len(tokens) <= max_tokens else enc.decode(tokens[:max_tokens])
+
 
 class AIAnalyzer:
     """Uses AI to analyze meeting content and extract requirements"""
@@ -16,7 +337,16 @@ class AIAnalyzer:
                  lm_studio_url: str = "http://localhost:1234/v1",
                  text_model: str = "phi-3-mini",
                  vision_model: str = "llava-7b-q4",
-                 vision_on_cpu: bool = False):
+                 vision_on_cpu: bool = False,
+                 max_concurrency: int = 4,
+                 cache_prompt: bool = False,
+                 max_image_side: Optional[int] = 768,
+                 cache_dir: Optional[str] = None,
+                 max_chars_per_frame: Optional[int] = 1500,
+                 max_retries: int = 3,
+                 max_input_tokens: Optional[int] = 6000,
+                 summary_chunk_tokens: int = 2000,
+                 structured_output: bool = True):
         """
         Initialize the AI analyzer with LM Studio
         
@@ -25,105 +355,417 @@ class AIAnalyzer:
             text_model: Text model name (default: phi-3-mini)
             vision_model: Vision model name (default: llava-7b-q4)
             vision_on_cpu: Whether to run vision model on CPU (default: False)
+            max_concurrency: Maximum number of frame requests in flight at once (default: 4)
+            cache_prompt: Ask llama.cpp-based servers to reuse the KV cache of the
+                shared prompt prefix (default: False; vLLM caches prefixes automatically)
+            max_image_side: Down-scale frames so their longest side is at most this
+                many pixels before sending them (default: 768, None sends originals)
+            cache_dir: Directory for caching frame analyses on disk, keyed by image
+                content, vision model and prompt (default: None, no caching)
+            max_chars_per_frame: Truncate each frame analysis to this many characters
+                when building the requirements prompt (default: 1500, None keeps all)
+            max_retries: Retries per frame request on connection errors, rate limits
+                and 5xx responses, with exponential backoff and jitter (default: 3)
+            max_input_tokens: Input token budget for the requirements prompt; longer
+                transcripts are summarized in parts first (default: 6000, None disables)
+            summary_chunk_tokens: Size of the transcript parts summarized when the
+                budget is exceeded (default: 2000)
+            structured_output: Constrain the requirements response to SRS_JSON_SCHEMA;
+                disabled automatically if the server rejects it (default: True)
+            
+        Raises:
+            ValueError: If a model name is empty
         """
+        # Fail fast on a bad model name instead of once per frame request
+        for label, name in (("text_model", text_model), ("vision_model", vision_model)):
+            if not isinstance(name, str) or not name.strip():
+                raise ValueError(f"{label} must be a non-empty model name, got {name!r}")
+        
         self.lm_studio_url = lm_studio_url
-        self.text_model = text_model
-        self.vision_model = vision_model
+        self.text_model = text_model.strip()
+        self.vision_model = vision_model.strip()
         self.vision_on_cpu = vision_on_cpu
+        self.max_concurrency = max(1, max_concurrency)
+        self.cache_prompt = cache_prompt
+        self.max_image_side = max_image_side
+        self.cache_dir = cache_dir
+        self.max_chars_per_frame = max_chars_per_frame
+        self.max_retries = max(0, max_retries)
+        self.max_input_tokens = max_input_tokens
+        self.summary_chunk_tokens = max(1, summary_chunk_tokens)
+        self.structured_output = structured_output
         self._cpu_mode_warned = False  # Track if we've shown the CPU mode message
+        self._aclient = None  # AsyncOpenAI client, created on first use in an event loop
         
-        try:
-            # Use OpenAI client library with LM Studio endpoint
-            from openai import OpenAI
-            self.client = OpenAI(
-                base_url=lm_studio_url,
-                api_key="lm-studio"  # Placeholder, not validated by LM Studio
-            )
-        except ImportError:
-            raise ImportError(
-                "OpenAI client library required for LM Studio compatibility. "
-                "Install with: pip install openai"
-            )
+        # Use OpenAI client library with LM Studio endpoint
+        self.client = _get_client(lm_studio_url)
+    
+    def _extra_body(self) -> Optional[Dict]:
+        """
+        Extra request fields for the chat completion endpoint
+        
+        Returns:
+            Dictionary of extra fields, or None if there are none
+        """
+        if self.cache_prompt:
+            return {"cache_prompt": True}
+        return None
     
-    def encode_image(self, image_path: str) -> str:
+    def encode_image(self, image_path: str, max_side: Optional[int] = None) -> str:
         """
         Encode image to base64
         
         Args:
             image_path: Path to image file
+            max_side: If set, down-scale so the longest side is at most this many
+                pixels (default: None, encode the original file)
             
         Returns:
             Base64 encoded image string
         """
-        with open(image_path, "rb") as image_file:
-            return base64.b64encode(image_file.read()).decode('utf-8')
+        return _encode_file(image_path, os.stat(image_path).st_mtime_ns, max_side).decode('ascii')
+    
+    def image_data_url(self, image_path: str, max_side: Optional[int] = None) -> str:
+        """
+        Build a data: URL for an image, decoding to str only once
+        
+        Args:
+            image_path: Path to image file
+            max_side: If set, down-scale so the longest side is at most this many pixels
+            
+        Returns:
+            data:image/jpeg;base64 URL for the image
+        """
+        encoded = _encode_file(image_path, os.stat(image_path).st_mtime_ns, max_side)
+        return b"".join((_DATA_URL_PREFIX, encoded)).decode('ascii')
+    
+    def _frame_cache_path(self, frame_path: str) -> Optional[str]:
+        """
+        Get the cache file path for a frame analysis
+        
+        Args:
+            frame_path: Path to frame image
+            
+        Returns:
+            Path to the cache entry, or None if caching is disabled
+        """
+        if not self.cache_dir:
+            return None
+        
+        # BLAKE2 is faster than SHA-256 in CPython and the key is not security sensitive
+        digest = hashlib.blake2b(digest_size=16)
+        with open(frame_path, "rb") as image_file:
+            for chunk in iter(lambda: image_file.read(1 << 20), b""):
+                digest.update(chunk)
+        digest.update(
+            f"|{self.vision_model}|{_VISION_PROMPT_VERSION}|{self.max_image_side}".encode('utf-8')
+        )
+        return os.path.join(self.cache_dir, f"{digest.hexdigest()}.json")
+    
+    def _read_frame_cache(self, cache_path: str) -> Optional[str]:
+        """
+        Read a cached frame analysis
+        
+        Args:
+            cache_path: Path to the cache entry
+            
+        Returns:
+            Cached analysis text, or None on a cache miss
+        """
+        try:
+            with open(cache_path, "rb") as f:
+                return json_utils.loads(f.read())["analysis"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
     
-    def analyze_frames(self, frame_paths: List[str]) -> List[Dict]:
+    def _write_frame_cache(self, cache_path: str, analysis: str) -> None:
+        """
+        Atomically write a frame analysis to the cache
+        
+        Args:
+            cache_path: Path to the cache entry
+            analysis: Analysis text to store
+        """
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            write_bytes_atomically(cache_path, json_utils.dumps({
+                "vision_model": self.vision_model,
+                "analysis": analysis
+            }))
+        except OSError as e:
+            logger.warning("    Warning: could not write frame cache: %s", e)
+    
+    def _get_aclient(self):
+        """
+        Get the async client used for frame requests
+        
+        A single AsyncOpenAI client (and its HTTP connection pool) is shared by
+        all requests until aclose() is called.
+        
+        Returns:
+            AsyncOpenAI client
+        """
+        if self._aclient is None:
+            openai = _import_openai()
+            try:
+                import httpx
+            except ImportError:
+                httpx = None
+            
+            http_client = None
+            if httpx is not None and hasattr(openai, "DefaultAsyncHttpxClient"):
+                # Keep a connection per in-flight request alive between frames;
+                # HTTP/2 multiplexes them over one connection when h2 is installed
+                http_client = openai.DefaultAsyncHttpxClient(
+                    limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+                    timeout=httpx.Timeout(600.0 if self.vision_on_cpu else 120.0, connect=5.0),
+                    http2=importlib.util.find_spec("h2") is not None
+                )
+            # The client retries transient failures itself, backing off exponentially
+            self._aclient = openai.AsyncOpenAI(
+                base_url=self.lm_studio_url,
+                api_key="lm-studio",  # Placeholder, not validated by LM Studio
+                max_retries=self.max_retries,
+                http_client=http_client
+            )
+        return self._aclient
+    
+    async def aclose(self):
+        """Close the async client and its pooled connections"""
+        if self._aclient is not None:
+            aclient, self._aclient = self._aclient, None
+            await aclient.close()
+    
+    def close(self):
+        """Close the async client from synchronous code (no-op if already closed)"""
+        if self._aclient is not None:
+            asyncio.run(self.aclose())
+    
+    def _prepare_frame(self, frame_path: str):
+        """
+        Look up the cache and encode a frame (blocking, run in an executor)
+        
+        Args:
+            frame_path: Path to frame image
+            
+        Returns:
+            Tuple of (cache_path, cached_analysis, image_url); image_url is None on a cache hit
+        """
+        cache_path = self._frame_cache_path(frame_path)
+        if cache_path:
+            cached = self._read_frame_cache(cache_path)
+            if cached is not None:
+                return cache_path, cached, None
+        return cache_path, None, self.image_data_url(frame_path, self.max_image_side)
+    
+    async def _analyze_one_frame(self, frame_path: str) -> Dict:
+        """
+        Send a single frame to the vision model
+        
+        Args:
+            frame_path: Path to frame image
+            
+        Returns:
+            Analysis result for the frame; on failure "analysis" is None and
+            "error" holds the reason
+        """
+        try:
+            loop = asyncio.get_running_loop()
+            cache_path, cached, image_url = await loop.run_in_executor(
+                None, self._prepare_frame, frame_path
+            )
+            if cached is not None:
+                return {
+                    "frame": frame_path,
+                    "analysis": cached
+                }
+            
+            # Use the configured vision model (LLaVA, etc.)
+            response = await self._get_aclient().chat.completions.create(
+                model=self.vision_model,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": VISION_SYSTEM_PROMPT
+                    },
+                    {
+                        "role": "user",
+                        "content": [
+                            {
+                                "type": "text",
+                                "text": VISION_USER_TEXT
+                            },
+                            {
+                                "type": "image_url",
+                                "image_url": {
+                                    "url": image_url
+                                }
+                            }
+                        ]
+                    }
+                ],
+                max_tokens=500,
+                extra_body=self._extra_body()
+            )
+            
+            analysis = response.choices[0].message.content
+            if cache_path:
+                self._write_frame_cache(cache_path, analysis)
+            
+            return {
+                "frame": frame_path,
+                "analysis": analysis
+            }
+            
+        except Exception as e:
+            logger.warning("    Error analyzing frame %s: %s", frame_path, e)
+            return {
+                "frame": frame_path,
+                "analysis": None,
+                "error": str(e)
+            }
+    
+    async def analyze_frames_async(self,
+                                   frame_paths: List[str],
+                                   progress_callback: Optional[Callable[[int, int, str], None]] = None) -> List[Dict]:
         """
         Analyze video frames to extract visual information
         
+        Frames are independent, so requests are dispatched concurrently
+        (up to max_concurrency at a time) to keep the backend busy. Frames
+        are submitted grouped by resolution so that requests in flight
+        together have similar shapes, which lets batching backends fuse them.
+        Call aclose() when done to release pooled connections.
+        
         Args:
             frame_paths: List of paths to frame images
+            progress_callback: Optional callback (frames_done, total_frames, message)
+                invoked from the event loop thread as each frame completes
             
         Returns:
-            List of analysis results for each frame
+            List of analysis results for each frame, in input order
         """
-        results = []
+        results: List[Optional[Dict]] = [None] * len(frame_paths)
         
         print(f"Analyzing {len(frame_paths)} frames...")
         if self.vision_on_cpu and not self._cpu_mode_warned:
             print("  Note: Using CPU mode for vision analysis (may be slower)")
             self._cpu_mode_warned = True
         
-        for i, frame_path in enumerate(frame_paths):
-            print(f"  Analyzing frame {i+1}/{len(frame_paths)}: {frame_path}")
+        if not frame_paths:
+            return []
+        
+        # Stable sort keeps temporal order within each resolution bucket
+        buckets = [_size_bucket(frame_path) for frame_path in frame_paths]
+        order = sorted(range(len(frame_paths)), key=buckets.__getitem__)
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def run_one(i: int):
+            async with semaphore:
+                return i, await self._analyze_one_frame(frame_paths[i])
+        
+        tasks = [asyncio.ensure_future(run_one(i)) for i in order]
+        for done, next_result in enumerate(asyncio.as_completed(tasks), 1):
+            i, result = await next_result
+            results[i] = result
+            logger.info("  Analyzed frame %d/%d: %s", done, len(frame_paths), frame_paths[i])
+            if progress_callback:
+                progress_callback(done, len(frame_paths), f"Analyzed frame {done}/{len(frame_paths)}")
+        
+        return results
+    
+    def analyze_frames(self,
+                       frame_paths: List[str],
+                       progress_callback: Optional[Callable[[int, int, str], None]] = None) -> List[Dict]:
+        """
+        Analyze video frames to extract visual information
+        
+        Synchronous wrapper around analyze_frames_async(); must not be called
+        from a running event loop.
+        
+        Args:
+            frame_paths: List of paths to frame images
+            progress_callback: Optional callback (frames_done, total_frames, message)
             
+        Returns:
+            List of analysis results for each frame, in input order
+        """
+        async def run():
             try:
-                base64_image = self.encode_image(frame_path)
-                
-                # Use the configured vision model (LLaVA, etc.)
-                response = self.client.chat.completions.create(
-                    model=self.vision_model,
-                    messages=[
-                        {
-                            "role": "user",
-                            "content": [
-                                {
-                                    "type": "text",
-                                    "text": """Analyze this screenshot from a meeting recording. 
-                                    Describe what you see including:
-                                    - UI elements, screens, or app interfaces
-                                    - Diagrams, charts, or visual aids
-                                    - Text content visible
-                                    - Any features or functionality being shown
-                                    Be detailed and technical."""
-                                },
-                                {
-                                    "type": "image_url",
-                                    "image_url": {
-                                        "url": f"data:image/jpeg;base64,{base64_image}"
-                                    }
-                                }
-                            ]
-                        }
-                    ],
-                    max_tokens=500
-                )
-                
-                analysis = response.choices[0].message.content
-                results.append({
-                    "frame": frame_path,
-                    "analysis": analysis
-                })
-                
-            except Exception as e:
-                print(f"    Error analyzing frame: {str(e)}")
-                results.append({
-                    "frame": frame_path,
-                    "analysis": f"Error: {str(e)}"
-                })
+                return await self.analyze_frames_async(frame_paths, progress_callback)
+            finally:
+                # Connections are bound to this event loop, which asyncio.run closes
+                await self.aclose()
         
-        return results
+        return asyncio.run(run())
+    
+    def _summarize_slice(self, text: str, max_tokens: int) -> str:
+        """
+        Summarize one part of the transcript with the text model
+        
+        Args:
+            text: Transcript slice
+            max_tokens: Maximum length of the summary in tokens
+            
+        Returns:
+            Summary, or the truncated slice if the request fails
+        """
+        try:
+            response = self.client.chat.completions.create(
+                model=self.text_model,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": TRANSCRIPT_SUMMARY_PROMPT
+                    },
+                    {
+                        "role": "user",
+                        "content": text
+                    }
+                ],
+                max_tokens=max_tokens,
+                temperature=0.3,
+                extra_body=self._extra_body()
+            )
+            return response.choices[0].message.content or ""
+        except Exception as e:
+            logger.warning("  Error summarizing transcript part: %s", e)
+            return _truncate_tokens(text, max_tokens)
+    
+    def _fit_transcript(self, transcript: str, visual_context: str) -> str:
+        """
+        Shrink the transcript to fit the requirements prompt's token budget
+        
+        Transcripts over budget are map-reduced: split into parts of
+        summary_chunk_tokens, summarized in parallel by the text model,
+        and the summaries joined in their original order.
+        
+        Args:
+            transcript: Full transcript text
+            visual_context: Frame analyses that share the prompt
+            
+        Returns:
+            The transcript, or a summary of it that fits the budget
+        """
+        if not self.max_input_tokens:
+            return transcript
+        
+        budget = (self.max_input_tokens
+                  - count_tokens(SRS_SYSTEM_PROMPT)
+                  - count_tokens(visual_context))
+        budget = max(budget, 256)  # Always leave room for some of the transcript
+        if count_tokens(transcript) <= budget:
+            return transcript
+        
+        parts = _token_slices(transcript, self.summary_chunk_tokens)
+        summary_tokens = max(64, min(500, budget // len(parts)))
+        print(f"Transcript exceeds the {budget}-token budget, summarizing {len(parts)} parts...")
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(parts))) as pool:
+            summaries = list(pool.map(
+                functools.partial(self._summarize_slice, max_tokens=summary_tokens), parts
+            ))
+        return _truncate_tokens("\n\n".join(summaries), budget)
     
     def generate_requirements(self, 
                             transcription: Dict,
@@ -133,7 +775,8 @@ class AIAnalyzer:
         
         Args:
             transcription: Audio transcription data
-            frame_analyses: Visual frame analysis data
+            frame_analyses: Visual frame analysis data; frames that failed
+                (analysis is None) are skipped
             
         Returns:
             Dictionary containing extracted requirements
@@ -141,63 +784,29 @@ class AIAnalyzer:
         print("Generating requirements from meeting data...")
         
         # Prepare context for AI
-        visual_context = "\n\n".join([
-            f"Frame {i+1}: {analysis['analysis']}"
+        # Cap each frame's contribution: the text model's context is finite and
+        # every extra character costs prefill time
+        limit = self.max_chars_per_frame
+        visual_context = "\n\n".join(
+            f"Frame {i+1}: {analysis['analysis'][:limit] if limit else analysis['analysis']}"
             for i, analysis in enumerate(frame_analyses)
-        ])
+            if analysis.get('analysis')
+        )
         
-        audio_context = transcription.get('text', '')
+        audio_context = self._fit_transcript(transcription.get('text', ''), visual_context)
         
-        prompt = f"""You are analyzing a meeting recording to create a Software Requirements Specification (SRS).
-
-AUDIO TRANSCRIPT:
-{audio_context}
-
-VISUAL CONTENT ANALYSIS:
-{visual_context}
-
-Based on the above meeting content, extract and organize the following:
-
-1. PROJECT OVERVIEW
-   - Project name/title
-   - Purpose and objectives
-   - Scope
-
-2. FUNCTIONAL REQUIREMENTS
-   - List all features and functionality mentioned
-   - User stories or use cases
-   - Specific capabilities required
-
-3. NON-FUNCTIONAL REQUIREMENTS
-   - Performance requirements
-   - Security requirements
-   - Usability requirements
-   - Any other quality attributes
-
-4. TECHNICAL REQUIREMENTS
-   - Technologies mentioned
-   - Platforms or frameworks
-   - Integration requirements
-
-5. ISSUES AND CONCERNS
-   - Problems identified
-   - Risks mentioned
-   - Constraints
-
-6. UI/UX REQUIREMENTS
-   - Interface designs or mockups shown
-   - User flow descriptions
-   - Visual design requirements
-
-Provide a comprehensive but concise analysis in JSON format."""
+        prompt = SRS_PROMPT_TEMPLATE.format_map({
+            "audio_context": audio_context,
+            "visual_context": visual_context
+        })
 
         try:
-            response = self.client.chat.completions.create(
+            request = dict(
                 model=self.text_model,
                 messages=[
                     {
                         "role": "system",
-                        "content": "You are an expert business analyst creating Software Requirements Specifications."
+                        "content": SRS_SYSTEM_PROMPT
                     },
                     {
                         "role": "user",
@@ -205,15 +814,29 @@ Provide a comprehensive but concise analysis in JSON format."""
                     }
                 ],
                 max_tokens=3000,
-                temperature=0.3
+                temperature=0.3,
+                extra_body=self._extra_body()
             )
+            if self.structured_output:
+                try:
+                    response = self.client.chat.completions.create(
+                        response_format=SRS_RESPONSE_FORMAT, **request
+                    )
+                except _import_openai().BadRequestError as e:
+                    # Server without json_schema support; don't ask again
+                    print(f"Note: Structured output not supported, retrying without it ({e})")
+                    self.structured_output = False
+                    response = self.client.chat.completions.create(**request)
+            else:
+                response = self.client.chat.completions.create(**request)
             
             content = response.choices[0].message.content
             
-            # Try to parse as JSON, fallback to text if parsing fails
+            # Guaranteed JSON with structured output; servers that ignore
+            # response_format may still wrap it in prose, so keep the fallback
             try:
-                requirements = json.loads(content)
-            except json.JSONDecodeError as json_error:
+                requirements = json_utils.loads(content)
+            except json_utils.JSONDecodeError as json_error:
                 # JSON parsing failed - provide structured fallback
                 print(f"Note: AI response was not in JSON format, using text format")
                 requirements = {
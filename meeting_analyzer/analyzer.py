@@ -3,78 +3,305 @@ Main meeting analyzer orchestrator
 """
 
 import os
+import math
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Callable
-import json
+from typing import Optional, Callable, Dict, List
 
 from .video_processor import VideoProcessor
 from .audio_processor import AudioProcessor
 from .ai_analyzer import AIAnalyzer
 from .srs_generator import SRSGenerator
+from . import json_utils
+from .file_utils import write_atomically
 
 
 class MeetingAnalyzer:
     """Main orchestrator for meeting analysis"""
     
     def __init__(self, 
-                 video_path: str,
+                 video_path: Optional[str],
                  lm_studio_url: str = "http://localhost:1234/v1",
                  text_model: str = "phi-3-mini",
                  vision_model: str = "llava-7b-q4",
                  whisper_model: str = "small",
+                 whisper_compute_type: Optional[str] = None,
+                 whisper_batch_size: int = 16,
+                 whisper_beam_size: int = 1,
                  vision_on_cpu: bool = False,
+                 keep_audio: bool = False,
+                 ai_concurrency: int = 4,
+                 use_cache: bool = True,
                  output_dir: str = "output",
                  openai_api_key: Optional[str] = None,
                  openai_model: Optional[str] = None,
                  openai_whisper_model: Optional[str] = None,
-                 progress_callback: Optional[Callable[[int, int, str, Optional[str]], None]] = None):
+                 progress_callback: Optional[Callable[[int, int, str, Optional[str]], None]] = None,
+                 stop_event=None):
         """
         Initialize the meeting analyzer
         
         Args:
-            video_path: Path to the meeting video file
+            video_path: Path to the meeting video file, or None to set it later
+                        with set_video()
             lm_studio_url: LM Studio base URL (default: http://localhost:1234/v1)
             text_model: Text model name for LM Studio (default: phi-3-mini)
             vision_model: Vision model name for LM Studio (default: llava-7b-q4)
             whisper_model: Local Whisper model size (default: small)
+            whisper_compute_type: faster-whisper compute type, e.g. int8 or float16
+                                  (default: best supported type for the device)
+            whisper_batch_size: Batch size for faster-whisper batched inference
+                                (default: 16, 1 disables batching)
+            whisper_beam_size: Beam width for Whisper decoding (default: 1, greedy)
             vision_on_cpu: Whether to run vision model on CPU (default: False)
+            keep_audio: Save the extracted audio as a WAV file; otherwise local
+                        transcription reads it from memory (default: False)
+            ai_concurrency: Maximum number of frame analysis requests sent to
+                            LM Studio at once (default: 4)
+            use_cache: Reuse transcripts and frame analyses from earlier runs on
+                       the same inputs, stored under output_dir/.cache (default: True)
             output_dir: Directory for output files
             openai_api_key: OpenAI API key (optional, for backward compatibility)
             openai_model: OpenAI model to use (optional, for backward compatibility)
             openai_whisper_model: OpenAI Whisper model (optional, for backward compatibility)
             progress_callback: Optional callback for progress updates (step, total_steps, message, error)
+            stop_event: Optional threading.Event or multiprocessing.Event; once
+                        set, analyze() raises InterruptedError at the next step
+                        or analyzed frame, without waiting for running
+                        extraction or transcription to finish
         """
         self.video_path = video_path
         self.lm_studio_url = lm_studio_url
         self.text_model = text_model
         self.vision_model = vision_model
         self.whisper_model = whisper_model
+        self.whisper_compute_type = whisper_compute_type
+        self.whisper_batch_size = whisper_batch_size
+        self.whisper_beam_size = whisper_beam_size
         self.vision_on_cpu = vision_on_cpu
+        self.keep_audio = keep_audio
         self.output_dir = output_dir
         self.openai_api_key = openai_api_key
         self.openai_model = openai_model
         self.openai_whisper_model = openai_whisper_model
         self.progress_callback = progress_callback
+        self.stop_event = stop_event
         
         # Create output directories
         os.makedirs(output_dir, exist_ok=True)
         self.frames_dir = os.path.join(output_dir, "frames")
         self.audio_dir = os.path.join(output_dir, "audio")
+        self.cache_dir = os.path.join(output_dir, ".cache") if use_cache else None
         
         # Initialize processors
-        self.video_processor = VideoProcessor(video_path, self.frames_dir)
-        self.audio_processor = AudioProcessor(video_path, self.audio_dir)
-        self.ai_analyzer = AIAnalyzer(lm_studio_url, text_model, vision_model, vision_on_cpu)
+        self.set_video(video_path)
+        self.ai_analyzer = AIAnalyzer(
+            lm_studio_url, text_model, vision_model, vision_on_cpu,
+            max_concurrency=ai_concurrency,
+            cache_dir=os.path.join(self.cache_dir, "frames") if self.cache_dir else None
+        )
         self.srs_generator = SRSGenerator(output_dir)
         
         self.results = {}
     
+    def set_video(self, video_path: str):
+        """
+        Switch to another video, keeping the settings and AI clients
+        
+        Args:
+            video_path: Path to the meeting video file
+        """
+        self.video_path = video_path
+        self.video_processor = VideoProcessor(video_path, self.frames_dir)
+        self.audio_processor = AudioProcessor(video_path, self.audio_dir)
+        self.results = {}
+    
+    def _use_local_whisper(self) -> bool:
+        """Whether transcription runs locally rather than through the OpenAI API"""
+        return not (self.openai_api_key and self.openai_whisper_model)
+    
+    def _transcript_cache_path(self) -> Optional[str]:
+        """
+        Cache location for the transcript of this video with these settings
+        
+        The key covers the video's size and modification time and everything
+        that changes the transcription output.
+        
+        Returns:
+            Path to the cached transcript, or None if caching is disabled
+        """
+        if not self.cache_dir:
+            return None
+        try:
+            stat = os.stat(self.video_path)
+        except OSError:
+            return None
+        
+        if self._use_local_whisper():
+            try:
+                from importlib.metadata import version
+                engine = f"faster-whisper {version('faster-whisper')}"
+            except Exception:
+                engine = "faster-whisper"
+            settings = (engine, self.whisper_model, self.whisper_compute_type,
+                        self.whisper_batch_size, self.whisper_beam_size)
+        else:
+            settings = ("openai", self.openai_whisper_model)
+        
+        # BLAKE2 is fast in pure software, with no dependence on SHA extensions
+        key = hashlib.blake2b(digest_size=16)
+        for part in (stat.st_size, stat.st_mtime_ns) + settings:
+            key.update(f"{part}|".encode('utf-8'))
+        return os.path.join(self.cache_dir, key.hexdigest(), "transcript.json")
+    
+    def _load_cached_transcript(self, cache_path: Optional[str]) -> Optional[dict]:
+        """Load a cached transcript, or None if there is none"""
+        if not cache_path or not os.path.exists(cache_path):
+            return None
+        try:
+            with open(cache_path, 'rb') as f:
+                return json_utils.loads(f.read())
+        except (OSError, json_utils.JSONDecodeError):
+            return None
+    
+    def _save_cached_transcript(self, cache_path: Optional[str], transcription: dict):
+        """Store a transcript in the cache (atomically, so readers never see a partial file)"""
+        if not cache_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            write_atomically(cache_path, lambda tmp_path: json_utils.dump(transcription, tmp_path))
+        except (OSError, TypeError) as e:
+            print(f"⚠ Could not cache transcript: {str(e)}")
+    
+    def _transcribe(self) -> Optional[dict]:
+        """
+        Extract the audio and transcribe it (runs on a worker thread)
+        
+        Returns:
+            Transcription results, or None if no audio could be extracted
+        """
+        if self.keep_audio or not self._use_local_whisper():
+            audio = self.audio_processor.extract_audio()
+        else:
+            audio = self.audio_processor.extract_audio_to_array()
+        if audio is None or len(audio) == 0:
+            return None
+        
+        # Use local whisper by default, fallback to OpenAI if configured
+        if not self._use_local_whisper():
+            print("Using OpenAI Whisper (backward compatibility mode)")
+            return self.audio_processor.transcribe_audio_openai(
+                self.openai_api_key,
+                self.openai_whisper_model
+            )
+        # Spreads the audio over all GPUs; one GPU or CPU is a plain local run
+        return self.audio_processor.transcribe_audio_local_multi(
+            self.whisper_model,
+            compute_type=self.whisper_compute_type,
+            batch_size=self.whisper_batch_size,
+            beam_size=self.whisper_beam_size
+        )
+    
+    def _extract_frames(self, extract_key_frames: bool, max_key_frames: int,
+                        extract_frames_interval: int) -> list:
+        """Extract frames with the configured method (runs on a worker thread)"""
+        if extract_key_frames:
+            return self.video_processor.extract_key_frames(
+                threshold=30.0,
+                max_frames=max_key_frames
+            )
+        # One ffmpeg pass for all timestamps; fall back to decoding in-process
+        duration = self.video_processor.get_video_metadata()["duration_seconds"]
+        timestamps = [
+            float(t) for t in range(0, math.ceil(duration), max(1, extract_frames_interval))
+        ]
+        frame_paths = self.video_processor.extract_frames_batch(timestamps)
+        if frame_paths is not None:
+            return frame_paths
+        return self.video_processor.extract_frames(
+            interval_seconds=extract_frames_interval
+        )
+    
+    def _load_previous_results(self, skip_frames: bool, skip_transcribe: bool,
+                               skip_vision: bool) -> dict:
+        """
+        Load what the skipped steps need from an earlier run in the same output directory
+        
+        Args:
+            skip_frames: Frame extraction is skipped; reuse the frames listed in
+                         the saved results
+            skip_transcribe: Transcription is skipped; reuse the saved transcription
+            skip_vision: Frame analysis is skipped; reuse the saved frame analyses
+            
+        Returns:
+            The earlier analysis_results.json contents (empty if nothing is skipped)
+        """
+        if not (skip_frames or skip_transcribe or skip_vision):
+            return {}
+        
+        results_path = os.path.join(self.output_dir, "analysis_results.json")
+        try:
+            with open(results_path, 'rb') as f:
+                previous = json_utils.loads(f.read())
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Cannot skip steps: no results from an earlier run at {results_path}"
+            ) from None
+        
+        # The output directory may have been used for another video since
+        previous_video = previous.get('video_path')
+        if previous_video is not None and previous_video != os.path.abspath(self.video_path):
+            raise ValueError(
+                f"Cannot skip steps: {results_path} is from another video ({previous_video})"
+            )
+        
+        for skipped, key in ((skip_transcribe, 'transcription'), (skip_vision, 'frame_analyses')):
+            if skipped and key not in previous:
+                raise ValueError(f"Cannot skip steps: {results_path} has no '{key}'")
+        
+        # The frames themselves are only needed to analyze them again
+        if skip_frames and not skip_vision:
+            if 'frame_paths' not in previous:
+                raise ValueError(f"Cannot skip frame extraction: {results_path} has no 'frame_paths'")
+            missing = [path for path in previous['frame_paths'] if not os.path.isfile(path)]
+            if missing:
+                raise FileNotFoundError(
+                    f"Cannot skip frame extraction: {len(missing)} of the frames listed in "
+                    f"{results_path} no longer exist (first: {missing[0]})"
+                )
+        return previous
+    
+    def _check_stop(self):
+        """Raise InterruptedError if a stop was requested through stop_event"""
+        if self.stop_event is not None and self.stop_event.is_set():
+            raise InterruptedError("Analysis stopped by user")
+    
+    def _wait_result(self, future):
+        """Wait for a worker thread's result, giving up as soon as a stop is requested"""
+        if self.stop_event is not None:
+            while not future.done():
+                if self.stop_event.wait(0.1):
+                    raise InterruptedError("Analysis stopped by user")
+        return future.result()
+    
+    def _frame_progress(self, done: int, total: int, message: str):
+        """Forward per-frame progress from the AI analyzer as Step 3 updates"""
+        # Raising here ends the frame analysis and cancels the pending requests
+        self._check_stop()
+        if self.progress_callback:
+            self.progress_callback(3, 5, f"Step 3: {message}", None)
+    
     def analyze(self, 
                 extract_frames_interval: int = 10,
                 extract_key_frames: bool = True,
                 max_key_frames: int = 15,
                 max_frames_to_analyze: int = 10,
-                project_name: str = "Meeting Project") -> dict:
+                project_name: str = "Meeting Project",
+                skip_frames: bool = False,
+                skip_transcribe: bool = False,
+                skip_vision: bool = False) -> dict:
         """
         Run the complete analysis pipeline
         
@@ -84,10 +311,25 @@ class MeetingAnalyzer:
             max_key_frames: Maximum number of key frames to extract
             max_frames_to_analyze: Maximum number of frames to send to AI for analysis
             project_name: Name of the project for SRS document
+            skip_frames: Reuse the frames listed in the previous analysis_results.json
+            skip_transcribe: Reuse the transcription from the previous analysis_results.json
+            skip_vision: Reuse the frame analyses from the previous analysis_results.json
             
         Returns:
             Dictionary with analysis results
+            
+        Raises:
+            FileNotFoundError: A step is skipped but there is no earlier run to reuse
+            ValueError: The earlier run lacks what a skipped step needs
         """
+        if not self.video_path:
+            raise ValueError("No video to analyze. Pass video_path or call set_video() first.")
+        
+        # Fail before doing any work if the skipped steps cannot be filled in
+        previous = self._load_previous_results(skip_frames, skip_transcribe, skip_vision)
+        # Recorded so later runs with skipped steps can tell which video this was
+        self.results['video_path'] = os.path.abspath(self.video_path)
+        
         print("=" * 60)
         print("MEETING ANALYZER - Starting Analysis")
         print("=" * 60)
@@ -100,26 +342,56 @@ class MeetingAnalyzer:
             self.progress_callback(0, 5, "Starting analysis...", None)
         
         # Step 1: Extract video frames
+        self._check_stop()
         print("Step 1: Extracting video frames...")
         print("-" * 60)
         if self.progress_callback:
             self.progress_callback(1, 5, "Step 1: Extracting video frames...", None)
-        try:
-            if extract_key_frames:
-                frame_paths = self.video_processor.extract_key_frames(
-                    threshold=30.0,
-                    max_frames=max_key_frames
+        
+        transcript_cache = None
+        if skip_transcribe:
+            cached_transcription = previous['transcription']
+        else:
+            transcript_cache = self._transcript_cache_path()
+            cached_transcription = self._load_cached_transcript(transcript_cache)
+        
+        # Frame extraction, audio extraction and the Whisper model load use
+        # separate resources, so start all three before waiting on any
+        pool = ThreadPoolExecutor(max_workers=3)
+        frames_future = None
+        if not skip_frames:
+            frames_future = pool.submit(
+                self._extract_frames, extract_key_frames, max_key_frames, extract_frames_interval
+            )
+        transcription_future = None
+        if cached_transcription is None:
+            if self._use_local_whisper():
+                # Errors surface again from transcribe_audio_local()
+                pool.submit(
+                    self.audio_processor.load_model,
+                    self.whisper_model,
+                    compute_type=self.whisper_compute_type
                 )
+            # Transcription starts as soon as the audio is out, while frames
+            # may still be extracting
+            transcription_future = pool.submit(self._transcribe)
+        pool.shutdown(wait=False)
+        
+        frame_paths = []
+        try:
+            if frames_future is None:
+                frame_paths = previous.get('frame_paths', [])
+                print(f"✓ Reusing {len(frame_paths)} previously extracted frames")
             else:
-                frame_paths = self.video_processor.extract_frames(
-                    interval_seconds=extract_frames_interval
-                )
+                frame_paths = self._wait_result(frames_future)
+                print(f"✓ Extracted {len(frame_paths)} frames")
             
             video_metadata = self.video_processor.get_video_metadata()
             self.results['video_metadata'] = video_metadata
             self.results['frame_paths'] = frame_paths
-            print(f"✓ Extracted {len(frame_paths)} frames")
             print()
+        except InterruptedError:
+            raise
         except Exception as e:
             print(f"✗ Error extracting frames: {str(e)}")
             if self.progress_callback:
@@ -127,34 +399,34 @@ class MeetingAnalyzer:
             self.results['frame_paths'] = []
         
         # Step 2: Extract and transcribe audio
+        self._check_stop()
         print("Step 2: Extracting and transcribing audio...")
         print("-" * 60)
         if self.progress_callback:
             self.progress_callback(2, 5, "Step 2: Extracting and transcribing audio...", None)
         try:
-            audio_path = self.audio_processor.extract_audio()
-            
-            if audio_path:
-                # Use local whisper by default, fallback to OpenAI if configured
-                if self.openai_api_key and self.openai_whisper_model:
-                    print("Using OpenAI Whisper (backward compatibility mode)")
-                    transcription = self.audio_processor.transcribe_audio_openai(
-                        self.openai_api_key,
-                        self.openai_whisper_model
-                    )
-                else:
-                    transcription = self.audio_processor.transcribe_audio_local(
-                        self.whisper_model
-                    )
-                self.results['transcription'] = transcription
-                print(f"✓ Transcription complete: {len(transcription['text'])} characters")
+            if skip_transcribe:
+                self.results['transcription'] = cached_transcription
+                print(f"✓ Reusing previous transcription: {len(cached_transcription['text'])} characters")
+            elif cached_transcription is not None:
+                self.results['transcription'] = cached_transcription
+                print(f"✓ Transcription loaded from cache: {len(cached_transcription['text'])} characters")
             else:
-                print("⚠ Audio extraction skipped (ffmpeg not available)")
-                self.results['transcription'] = {
-                    'text': 'Audio transcription not available. Install ffmpeg for audio support.',
-                    'status': 'skipped'
-                }
+                transcription = self._wait_result(transcription_future)
+                
+                if transcription is not None:
+                    self.results['transcription'] = transcription
+                    self._save_cached_transcript(transcript_cache, transcription)
+                    print(f"✓ Transcription complete: {len(transcription['text'])} characters")
+                else:
+                    print("⚠ Audio extraction skipped (ffmpeg not available)")
+                    self.results['transcription'] = {
+                        'text': 'Audio transcription not available. Install ffmpeg for audio support.',
+                        'status': 'skipped'
+                    }
             print()
+        except InterruptedError:
+            raise
         except Exception as e:
             print(f"✗ Error processing audio: {str(e)}")
             if self.progress_callback:
@@ -165,30 +437,49 @@ class MeetingAnalyzer:
             }
         
         # Step 3: Analyze frames with AI
+        self._check_stop()
         print("Step 3: Analyzing visual content with AI...")
         print("-" * 60)
         if self.progress_callback:
             self.progress_callback(3, 5, "Step 3: Analyzing visual content with AI...", None)
         try:
-            if frame_paths:
+            if skip_vision:
+                self.results['frame_analyses'] = previous['frame_analyses']
+                print(f"✓ Reusing {len(self.results['frame_analyses'])} previous frame analyses")
+            elif frame_paths:
                 # Limit frames for efficiency
                 frames_to_analyze = frame_paths[:max_frames_to_analyze]
                 if len(frame_paths) > max_frames_to_analyze:
                     print(f"Note: Analyzing {max_frames_to_analyze} of {len(frame_paths)} frames")
-                frame_analyses = self.ai_analyzer.analyze_frames(frames_to_analyze)
+                frame_analyses = self.ai_analyzer.analyze_frames(
+                    frames_to_analyze,
+                    progress_callback=(
+                        self._frame_progress
+                        if self.progress_callback or self.stop_event is not None else None
+                    )
+                )
                 self.results['frame_analyses'] = frame_analyses
-                print(f"✓ Analyzed {len(frame_analyses)} frames")
+                failed = sum(1 for analysis in frame_analyses if analysis.get('error'))
+                print(f"✓ Analyzed {len(frame_analyses) - failed} frames")
+                if failed:
+                    print(f"⚠ {failed} frame(s) failed and will be left out of the requirements")
             else:
                 print("⚠ No frames to analyze")
                 self.results['frame_analyses'] = []
             print()
+        except InterruptedError:
+            raise
         except Exception as e:
             print(f"✗ Error analyzing frames: {str(e)}")
             if self.progress_callback:
                 self.progress_callback(3, 5, "Error analyzing frames", str(e))
             self.results['frame_analyses'] = []
+        finally:
+            # Release pooled LM Studio connections even if analysis failed
+            self.ai_analyzer.close()
         
         # Step 4: Generate requirements
+        self._check_stop()
         print("Step 4: Generating requirements...")
         print("-" * 60)
         if self.progress_callback:
@@ -208,6 +499,7 @@ class MeetingAnalyzer:
             self.results['requirements'] = {'error': str(e)}
         
         # Step 5: Generate SRS documents
+        self._check_stop()
         print("Step 5: Generating SRS documents...")
         print("-" * 60)
         if self.progress_callback:
@@ -242,14 +534,12 @@ class MeetingAnalyzer:
         
         # Save complete results
         results_path = os.path.join(self.output_dir, "analysis_results.json")
-        with open(results_path, 'w', encoding='utf-8') as f:
-            # Create serializable version of results
-            serializable_results = {
-                k: v for k, v in self.results.items() 
-                if k not in ['frame_paths']  # Exclude large data
-            }
-            serializable_results['frame_count'] = len(self.results.get('frame_paths', []))
-            json.dump(serializable_results, f, indent=2)
+        # Create serializable version of results; frame_paths is kept for
+        # later runs that skip frame extraction
+        serializable_results = dict(self.results)
+        serializable_results['frame_count'] = len(self.results.get('frame_paths', []))
+        # Compact: transcripts make this large, and indentation doubles it
+        json_utils.dump(serializable_results, results_path)
         
         print("=" * 60)
         print("ANALYSIS COMPLETE")
@@ -261,3 +551,65 @@ class MeetingAnalyzer:
             self.progress_callback(5, 5, "Analysis complete!", None)
         
         return self.results
+
+
+class MeetingAnalyzerBatch:
+    """Analyzes several meeting videos with the same settings"""
+    
+    def __init__(self,
+                 video_paths: List[str],
+                 output_dir: str = "output",
+                 max_workers: int = 1,
+                 **analyzer_kwargs):
+        """
+        Initialize the batch analyzer
+        
+        The Whisper model is cached per process, so it is loaded once and
+        reused for every video instead of once per video.
+        
+        Args:
+            video_paths: Paths to the meeting video files
+            output_dir: Base output directory; each video gets a subdirectory
+                        named after the video file
+            max_workers: Number of videos analyzed at the same time (default: 1)
+            **analyzer_kwargs: Settings passed to every MeetingAnalyzer
+        """
+        self.output_dir = output_dir
+        self.max_workers = max(1, max_workers)
+        self.analyzers = []
+        
+        used_names = set()
+        for video_path in video_paths:
+            name = Path(video_path).stem
+            # Keep outputs apart when videos in different folders share a name
+            suffix = 2
+            unique_name = name
+            while unique_name in used_names:
+                unique_name = f"{name}_{suffix}"
+                suffix += 1
+            used_names.add(unique_name)
+            
+            self.analyzers.append(MeetingAnalyzer(
+                video_path=video_path,
+                output_dir=os.path.join(output_dir, unique_name),
+                **analyzer_kwargs
+            ))
+    
+    def analyze(self, **analyze_kwargs) -> Dict[str, dict]:
+        """
+        Run the complete analysis pipeline for every video
+        
+        Args:
+            **analyze_kwargs: Arguments passed to MeetingAnalyzer.analyze()
+            
+        Returns:
+            Dictionary mapping each video path to its analysis results
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            results = list(pool.map(
+                lambda analyzer: analyzer.analyze(**analyze_kwargs), self.analyzers
+            ))
+        return {
+            analyzer.video_path: result
+            for analyzer, result in zip(self.analyzers, results)
+        }
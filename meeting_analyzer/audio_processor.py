@@ -3,26 +3,232 @@ Audio processor module for extracting and transcribing audio from video files
 """
 
 import os
+import math
 import subprocess
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
-import json
+from typing import Dict, List, Optional, Tuple
+from . import json_utils
+
+__all__ = ["AudioProcessor"]
+
+
+SAMPLE_RATE = 16000  # Whisper models expect 16 kHz mono audio
+
+# Neighbouring chunks overlap by this much so words at a boundary are heard in full
+CHUNK_OVERLAP_SECONDS = 5.0
+
+# Audio shorter than this per worker is not worth splitting
+MIN_CHUNK_SECONDS = 60.0
+
+# Keep ffmpeg's stderr down to actual errors so there is little to buffer
+_FFMPEG_QUIET_FLAGS = ["-nostdin", "-hide_banner", "-loglevel", "error", "-nostats"]
+
+
+def _ffmpeg_audio_input(video_path: str) -> List[str]:
+    """
+    ffmpeg arguments that read only the first audio stream, decoding on all cores
+    
+    Args:
+        video_path: Path to the video file
+        
+    Returns:
+        Command prefix up to (and including) the stream selection
+    """
+    threads = str(os.cpu_count() or 4)
+    return [
+        "ffmpeg", *_FFMPEG_QUIET_FLAGS,
+        "-filter_threads", threads, "-filter_complex_threads", threads,
+        "-threads", "0", "-i", video_path,
+        "-map", "0:a:0?", "-vn"  # Skip demuxing the video streams
+    ]
+
+
+# Serializes model loading so concurrent analyses don't load the same weights twice
+_WHISPER_LOCK = threading.Lock()
+
+# Loaded models per (device, device_index), least recently used first. Each
+# device keeps its own few, so a model loaded on every GPU by
+# transcribe_audio_local_multi() does not evict the others however many GPUs
+# there are.
+_WHISPER_MODELS_PER_DEVICE = 4
+_whisper_models: Dict[Tuple[str, int], "OrderedDict[tuple, object]"] = {}
+
+
+def _get_whisper(model: str, device: str, compute_type: str, num_workers: int = 1,
+                 device_index: int = 0):
+    """
+    Get a faster-whisper model, loading it only once per process
+    
+    Args:
+        model: Whisper model size or path
+        device: Device to load the model on ("cuda", "cpu")
+        compute_type: CTranslate2 compute type
+        num_workers: Number of concurrent transcribe() calls the model supports
+        device_index: GPU to load the model on
+        
+    Returns:
+        Shared WhisperModel instance
+    """
+    settings = (model, compute_type, num_workers)
+    with _WHISPER_LOCK:
+        models = _whisper_models.setdefault((device, device_index), OrderedDict())
+        if settings in models:
+            models.move_to_end(settings)
+            return models[settings]
+        
+        from faster_whisper import WhisperModel
+        instance = WhisperModel(model, device=device, device_index=device_index,
+                                compute_type=compute_type, num_workers=num_workers)
+        models[settings] = instance
+        if len(models) > _WHISPER_MODELS_PER_DEVICE:
+            models.popitem(last=False)
+        return instance
+
+
+def _cuda_device_count() -> int:
+    """Number of visible CUDA devices (0 without torch or CUDA)"""
+    try:
+        import torch
+        return torch.cuda.device_count()
+    except Exception:
+        return 0
+
+
+def _silence_split_points(audio, num_parts: int) -> List[int]:
+    """
+    Split audio into roughly equal parts, cutting inside pauses in speech
+    
+    Each cut is moved to the middle of the silence gap nearest to the ideal
+    equal-length boundary, so no word is cut in half. Uses faster-whisper's
+    bundled Silero VAD; without it the cuts fall at the ideal boundaries.
+    
+    Args:
+        audio: 16 kHz mono samples
+        num_parts: Number of parts
+        
+    Returns:
+        Sample indices of the part boundaries, starting with 0 and ending
+        with len(audio)
+    """
+    total = len(audio)
+    ideal = [total * i // num_parts for i in range(1, num_parts)]
+    
+    try:
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+        speech = get_speech_timestamps(audio, VadOptions(min_silence_duration_ms=500))
+    except Exception:
+        speech = []
+    
+    # Midpoints of the pauses between consecutive speech regions
+    gaps = [(prev["end"] + cur["start"]) // 2 for prev, cur in zip(speech, speech[1:])]
+    
+    cuts = []
+    for target in ideal:
+        cut = min(gaps, key=lambda gap: abs(gap - target)) if gaps else target
+        if cuts and cut <= cuts[-1]:
+            cut = target if target > cuts[-1] else cuts[-1]
+        cuts.append(cut)
+    
+    bounds = [0] + cuts + [total]
+    return [b for i, b in enumerate(bounds) if i == 0 or b > bounds[i - 1]]
+
+
+def _best_compute_type(device: str) -> str:
+    """
+    Pick the fastest CTranslate2 compute type for a device
+    
+    int8 weights halve memory traffic compared to float16. On GPUs with
+    compute capability 7.5+ they are paired with float16 activations, and on
+    CPUs int8 uses VNNI where available.
+    
+    Args:
+        device: "cuda" or "cpu"
+        
+    Returns:
+        Compute type name
+    """
+    try:
+        import ctranslate2
+        supported = ctranslate2.get_supported_compute_types(device)
+    except Exception:
+        supported = set()
+    
+    if device == "cuda":
+        try:
+            import torch
+            fast_int8 = torch.cuda.get_device_capability() >= (7, 5)
+        except Exception:
+            fast_int8 = "int8_float16" in supported
+        return "int8_float16" if fast_int8 and "int8_float16" in supported else "float16"
+    
+    return "int8" if not supported or "int8" in supported else "float32"
+
+
+def _transcribe_options(beam_size: int) -> dict:
+    """
+    faster-whisper decoding options shared by every transcription path
+    
+    Args:
+        beam_size: Beam width; 1 decodes greedily
+        
+    Returns:
+        Keyword arguments for transcribe()
+    """
+    options = dict(
+        beam_size=max(1, beam_size),
+        vad_filter=True,  # Voice activity detection
+        vad_parameters=dict(min_silence_duration_ms=500)
+    )
+    if beam_size <= 1:
+        # Plain greedy decoding, without sampling candidates or temperature fallback
+        options.update(best_of=1, temperature=0.0)
+    return options
+
+
+def _collect_segments(segments, offset: float = 0.0) -> List[dict]:
+    """
+    Drain a faster-whisper segment iterator into plain dictionaries
+    
+    Args:
+        segments: Iterable of faster-whisper segments
+        offset: Seconds to add to every timestamp
+        
+    Returns:
+        List of segment dictionaries
+    """
+    return [
+        {
+            "start": segment.start + offset,
+            "end": segment.end + offset,
+            "text": segment.text
+        }
+        for segment in segments
+    ]
 
 
 class AudioProcessor:
     """Processes audio from video files and performs transcription"""
     
-    def __init__(self, video_path: str, output_dir: str = "output/audio"):
+    def __init__(self, video_path: str, output_dir: str = "output/audio", max_parallel_chunks: int = 1):
         """
         Initialize the audio processor
         
         Args:
             video_path: Path to the video file
             output_dir: Directory to save extracted audio
+            max_parallel_chunks: Split long audio into up to this many overlapping
+                chunks and transcribe them concurrently (default: 1, no splitting)
         """
         self.video_path = video_path
         self.output_dir = output_dir
+        self.max_parallel_chunks = max(1, max_parallel_chunks)
         self.audio_path = None
+        self.audio_array = None  # 16 kHz mono float32 samples from extract_audio_to_array()
+        self._audio_size = None  # Size of the extracted WAV, recorded once by extract_audio()
+        self._model = None  # (settings, WhisperModel) from the last local transcription
         
         os.makedirs(output_dir, exist_ok=True)
     
@@ -44,29 +250,31 @@ class AudioProcessor:
         try:
             # Use ffmpeg to extract audio
             cmd = [
-                "ffmpeg", "-y", "-i", self.video_path,
-                "-vn", "-acodec", "pcm_s16le" if audio_format == "wav" else "libmp3lame",
+                *_ffmpeg_audio_input(self.video_path), "-y",
+                "-acodec", "pcm_s16le" if audio_format == "wav" else "libmp3lame",
                 "-ar", "16000",  # 16kHz sample rate for speech
                 "-ac", "1",  # Mono
                 audio_path
             ]
             
-            result = subprocess.run(
+            subprocess.run(
                 cmd,
-                capture_output=True,
-                text=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 check=True
             )
             
             print(f"Audio extracted to: {audio_path}")
             self.audio_path = audio_path
+            self._audio_size = os.path.getsize(audio_path)
             return audio_path
             
         except subprocess.CalledProcessError as e:
             # Audio extraction failed - ffmpeg may not be installed or video may not have audio
             print("Audio extraction failed. Ensure ffmpeg is installed.")
             if e.stderr:
-                print(f"Error details: {e.stderr}")
+                print(f"Error details: {e.stderr.decode('utf-8', errors='replace')}")
             print("Note: Install ffmpeg for audio extraction support")
             return None
         except FileNotFoundError:
@@ -74,82 +282,290 @@ class AudioProcessor:
             print("Note: Install ffmpeg for audio extraction support")
             return None
     
-    def transcribe_audio_local(self, model: str = "small", device: str = "auto") -> dict:
+    def extract_audio_to_array(self):
+        """
+        Decode the audio track straight into memory, without writing a file
+        
+        ffmpeg streams 16 kHz mono PCM to a pipe, which faster-whisper accepts
+        as a float32 array. Use extract_audio() when a file is needed (OpenAI
+        transcription or keeping the audio).
+        
+        Returns:
+            numpy float32 array of samples in [-1, 1), or None if extraction failed
+        """
+        import numpy as np
+        
+        print(f"Extracting audio from video...")
+        
+        cmd = [
+            *_ffmpeg_audio_input(self.video_path),
+            "-f", "s16le", "-acodec", "pcm_s16le",
+            "-ar", str(SAMPLE_RATE),  # 16kHz sample rate for speech
+            "-ac", "1",  # Mono
+            "-"
+        ]
+        
+        try:
+            # communicate() drains stderr too, so a chatty ffmpeg can't block the pipe
+            proc = subprocess.Popen(
+                cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            )
+            pcm, stderr = proc.communicate()
+        except FileNotFoundError:
+            print("ffmpeg not found in PATH")
+            print("Note: Install ffmpeg for audio extraction support")
+            return None
+        
+        if proc.returncode != 0:
+            print("Audio extraction failed. Ensure ffmpeg is installed.")
+            if stderr:
+                print(f"Error details: {stderr.decode('utf-8', errors='replace')}")
+            return None
+        
+        self.audio_array = np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+        print(f"Audio extracted: {len(self.audio_array) / SAMPLE_RATE:.1f}s in memory")
+        return self.audio_array
+    
+    def _transcribe_chunked(self, model_instance, transcribe_kwargs: dict) -> Tuple[List[dict], str, float]:
+        """
+        Transcribe overlapping chunks of the audio concurrently with one model
+        
+        Each chunk owns the span between the midpoints of its overlaps with
+        its neighbours; segments are kept by the chunk that owns their midpoint,
+        which removes the text duplicated by the overlap.
+        
+        Args:
+            model_instance: faster-whisper WhisperModel (created with num_workers > 1)
+            transcribe_kwargs: Keyword arguments passed to transcribe()
+            
+        Returns:
+            Tuple of (segments, language, duration in seconds)
+        """
+        if self.audio_array is not None:
+            audio = self.audio_array
+        else:
+            from faster_whisper import decode_audio
+            audio = decode_audio(self.audio_path, sampling_rate=SAMPLE_RATE)
+        duration = len(audio) / SAMPLE_RATE
+        num_chunks = max(1, min(self.max_parallel_chunks, int(duration // MIN_CHUNK_SECONDS)))
+        chunk_length = math.ceil(duration / num_chunks)
+        half_overlap = CHUNK_OVERLAP_SECONDS / 2
+        
+        print(f"  Splitting {duration:.0f}s of audio into {num_chunks} chunk(s)")
+        
+        def run_chunk(index: int):
+            start = index * chunk_length
+            end = min(duration, start + chunk_length)
+            padded_start = max(0.0, start - half_overlap)
+            padded_end = min(duration, end + half_overlap)
+            samples = audio[int(padded_start * SAMPLE_RATE):int(padded_end * SAMPLE_RATE)]
+            segments, info = model_instance.transcribe(samples, **transcribe_kwargs)
+            owned_end = end if index < num_chunks - 1 else math.inf
+            kept = [
+                segment for segment in _collect_segments(segments, offset=padded_start)
+                if start <= (segment["start"] + segment["end"]) / 2 < owned_end
+            ]
+            return kept, info.language
+        
+        with ThreadPoolExecutor(max_workers=num_chunks) as executor:
+            chunk_results = list(executor.map(run_chunk, range(num_chunks)))
+        
+        segment_list = [segment for kept, _ in chunk_results for segment in kept]
+        return segment_list, chunk_results[0][1], duration
+    
+    def load_model(self, model: str = "small", device: str = "auto",
+                   compute_type: Optional[str] = None):
+        """
+        Load (or reuse) the faster-whisper model used for local transcription
+        
+        Can be called from another thread ahead of transcribe_audio_local()
+        to overlap the model load with other work.
+        
+        Args:
+            model: Whisper model size (tiny, base, small, medium, large)
+            device: Device to use ("auto", "cuda", "cpu")
+            compute_type: CTranslate2 compute type; picked for the device when not given
+            
+        Returns:
+            WhisperModel instance
+        """
+        # Auto-detect device if set to "auto"
+        if device == "auto":
+            try:
+                import torch
+                device = "cuda" if torch.cuda.is_available() else "cpu"
+            except ImportError:
+                device = "cpu"
+        
+        if not compute_type:
+            compute_type = _best_compute_type(device)
+        
+        # One worker per chunk lets transcribe() run concurrently
+        settings = (model, device, compute_type, self.max_parallel_chunks)
+        if self._model is None or self._model[0] != settings:
+            self._model = (settings, _get_whisper(*settings))
+        return self._model[1]
+    
+    def transcribe_audio_local(self, model: str = "small", device: str = "auto",
+                               compute_type: Optional[str] = None,
+                               batch_size: int = 16,
+                               beam_size: int = 1) -> dict:
         """
         Transcribe audio using local faster-whisper
         
         Args:
             model: Whisper model size (tiny, base, small, medium, large)
             device: Device to use ("auto", "cuda", "cpu")
+            compute_type: CTranslate2 compute type ("int8", "int8_float16", "float16", ...);
+                          picked for the device when not given
+            batch_size: Number of VAD chunks decoded together by faster-whisper's
+                        BatchedInferencePipeline (default: 16, 1 disables batching)
+            beam_size: Beam width (default: 1, greedy); 5 is slower but slightly
+                       more accurate on difficult audio
             
         Returns:
             Dictionary with transcription results
         """
-        if not self.audio_path:
-            raise ValueError("No audio file available. Extract audio first.")
+        if self.audio_array is None and not self.audio_path:
+            raise ValueError("No audio available. Extract audio first.")
+        
+        # Prefer the in-memory samples; faster-whisper would decode the file anyway
+        audio = self.audio_array if self.audio_array is not None else self.audio_path
         
         try:
-            from faster_whisper import WhisperModel
-            
             print(f"Transcribing audio using local Whisper ({model} model)...")
             
-            # Auto-detect device if set to "auto"
-            if device == "auto":
+            model_instance = self.load_model(model, device, compute_type)
+            _, device, compute_type, _ = self._model[0]
+            print(f"  Using device: {device} (compute type: {compute_type})")
+            
+            transcribe_kwargs = _transcribe_options(beam_size)
+            
+            pipeline = None
+            if batch_size > 1 and self.max_parallel_chunks == 1:
                 try:
-                    import torch
-                    device = "cuda" if torch.cuda.is_available() else "cpu"
+                    from faster_whisper import BatchedInferencePipeline
+                    pipeline = BatchedInferencePipeline(model=model_instance)
                 except ImportError:
-                    device = "cpu"
+                    print("  Batched inference needs faster-whisper >= 1.1, transcribing sequentially")
             
-            compute_type = "float16" if device == "cuda" else "int8"
-            print(f"  Using device: {device} (compute type: {compute_type})")
+            # Transcribe and collect segments
+            if self.max_parallel_chunks > 1:
+                segment_list, language, duration = self._transcribe_chunked(
+                    model_instance, transcribe_kwargs
+                )
+            elif pipeline is not None:
+                print(f"  Batched inference (batch size: {batch_size})")
+                segments, info = pipeline.transcribe(
+                    audio, batch_size=batch_size, **transcribe_kwargs
+                )
+                segment_list = _collect_segments(segments)
+                language, duration = info.language, info.duration
+            else:
+                segments, info = model_instance.transcribe(audio, **transcribe_kwargs)
+                segment_list = _collect_segments(segments)
+                language, duration = info.language, info.duration
             
-            # Initialize model
-            model_instance = WhisperModel(model, device=device, compute_type=compute_type)
+            return self._save_local_transcription(segment_list, language, duration)
             
-            # Transcribe
-            segments, info = model_instance.transcribe(
-                self.audio_path,
-                beam_size=5,
-                vad_filter=True,  # Voice activity detection
-                vad_parameters=dict(min_silence_duration_ms=500)
-            )
+        except ImportError:
+            raise ImportError("faster-whisper not installed. Install with: pip install faster-whisper")
+        except Exception as e:
+            raise Exception(f"Transcription failed: {str(e)}")
+    
+    def _save_local_transcription(self, segment_list: List[dict], language: str, duration: float) -> dict:
+        """
+        Build the transcription result from local segments and save it as JSON
+        
+        Args:
+            segment_list: Segment dictionaries in time order
+            language: Detected language
+            duration: Audio duration in seconds
             
-            # Collect segments
-            segment_list = []
-            full_text = []
+        Returns:
+            Dictionary with transcription results
+        """
+        result = {
+            # Whisper segment texts carry their own leading space
+            "text": "".join(segment["text"] for segment in segment_list).strip(),
+            "language": language,
+            "duration": duration,
+            "segments": segment_list
+        }
+        
+        print(f"Transcription complete. Length: {len(result['text'])} characters")
+        print(f"  Detected language: {language}")
+        print(f"  Duration: {duration:.2f}s")
+        
+        # Save transcription to file, plus the segments as NDJSON for streaming readers
+        stem = Path(self.video_path).stem
+        transcript_path = os.path.join(self.output_dir, f"{stem}_transcript.json")
+        json_utils.dump(result, transcript_path)
+        json_utils.dump_ndjson(segment_list, os.path.join(self.output_dir, f"{stem}_segments.ndjson"))
+        
+        print(f"Transcription saved to: {transcript_path}")
+        
+        return result
+    
+    def transcribe_audio_local_multi(self, model: str = "small", num_gpus: Optional[int] = None,
+                                     compute_type: Optional[str] = None,
+                                     batch_size: int = 16,
+                                     beam_size: int = 1) -> dict:
+        """
+        Transcribe audio using one faster-whisper model per CUDA device
+        
+        The audio is split into one part per GPU at pauses in speech, the
+        parts are transcribed concurrently and their segments are shifted
+        back to absolute timestamps. With fewer than two GPUs this is the
+        same as transcribe_audio_local().
+        
+        Args:
+            model: Whisper model size (tiny, base, small, medium, large)
+            num_gpus: Number of GPUs to use (default: all visible devices)
+            compute_type: CTranslate2 compute type; picked for CUDA when not given
+            batch_size: Batch size used if this falls back to transcribe_audio_local()
+            beam_size: Beam width (default: 1, greedy)
             
-            for segment in segments:
-                segment_data = {
-                    "start": segment.start,
-                    "end": segment.end,
-                    "text": segment.text
-                }
-                segment_list.append(segment_data)
-                full_text.append(segment.text)
+        Returns:
+            Dictionary with transcription results
+        """
+        available = _cuda_device_count()
+        num_gpus = min(num_gpus or available, available)
+        if num_gpus < 2:
+            return self.transcribe_audio_local(
+                model, compute_type=compute_type, batch_size=batch_size, beam_size=beam_size
+            )
+        
+        if self.audio_array is None and not self.audio_path:
+            raise ValueError("No audio available. Extract audio first.")
+        
+        try:
+            print(f"Transcribing audio using local Whisper ({model} model) on {num_gpus} GPUs...")
             
-            result = {
-                "text": " ".join(full_text),
-                "language": info.language,
-                "duration": info.duration,
-                "segments": segment_list
-            }
+            if self.audio_array is not None:
+                audio = self.audio_array
+            else:
+                from faster_whisper import decode_audio
+                audio = decode_audio(self.audio_path, sampling_rate=SAMPLE_RATE)
             
-            print(f"Transcription complete. Length: {len(result['text'])} characters")
-            print(f"  Detected language: {info.language}")
-            print(f"  Duration: {info.duration:.2f}s")
+            bounds = _silence_split_points(audio, num_gpus)
+            compute_type = compute_type or _best_compute_type("cuda")
+            transcribe_kwargs = _transcribe_options(beam_size)
             
-            # Save transcription to file
-            transcript_path = os.path.join(
-                self.output_dir,
-                f"{Path(self.audio_path).stem}_transcript.json"
-            )
-            with open(transcript_path, 'w') as f:
-                json.dump(result, f, indent=2)
+            def run_part(index: int):
+                start, end = bounds[index], bounds[index + 1]
+                model_instance = _get_whisper(model, "cuda", compute_type, device_index=index)
+                segments, info = model_instance.transcribe(audio[start:end], **transcribe_kwargs)
+                return _collect_segments(segments, offset=start / SAMPLE_RATE), info.language
             
-            print(f"Transcription saved to: {transcript_path}")
+            num_parts = len(bounds) - 1
+            with ThreadPoolExecutor(max_workers=num_parts) as executor:
+                part_results = list(executor.map(run_part, range(num_parts)))
             
-            return result
+            segment_list = [segment for segments, _ in part_results for segment in segments]
+            return self._save_local_transcription(
+                segment_list, part_results[0][1], len(audio) / SAMPLE_RATE
+            )
             
         except ImportError:
             raise ImportError("faster-whisper not installed. Install with: pip install faster-whisper")
@@ -198,8 +614,7 @@ class AudioProcessor:
                 self.output_dir,
                 f"{Path(self.audio_path).stem}_transcript.json"
             )
-            with open(transcript_path, 'w') as f:
-                json.dump(result, f, indent=2)
+            json_utils.dump(result, transcript_path)
             
             print(f"Transcription saved to: {transcript_path}")
             
@@ -217,7 +632,19 @@ class AudioProcessor:
         Returns:
             Dictionary with audio metadata
         """
+        if self.audio_path and self._audio_size is not None:
+            return {
+                "path": self.audio_path,
+                "size_bytes": self._audio_size,
+                "format": Path(self.audio_path).suffix[1:]
+            }
+        
         if not self.audio_path or not os.path.exists(self.audio_path):
+            if self.audio_array is not None:
+                return {
+                    "status": "in_memory",
+                    "duration": len(self.audio_array) / SAMPLE_RATE
+                }
             return {"status": "no_audio_file"}
         
         # Basic metadata
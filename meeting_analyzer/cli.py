@@ -2,22 +2,64 @@
 Command-line interface for Meeting Analyzer
 """
 
-import argparse
+import functools
+import logging
 import os
+import stat
 import sys
-from pathlib import Path
-from dotenv import load_dotenv
+from types import SimpleNamespace
+from typing import List, Optional
 
-from .analyzer import MeetingAnalyzer
-from .profiles import get_profile, list_profiles, get_profile_description
 
+# Fast-path option table: option -> (destination, kind), where kind is str,
+# int, bool (store_true) or list (one or more values). Must describe the same
+# options and defaults as _build_parser(); tests/test_cli.py checks both agree.
+_FAST_OPTIONS = {
+    "--video": ("video", list),
+    "--profile": ("profile", str),
+    "--lm-studio-url": ("lm_studio_url", str),
+    "--text-model": ("text_model", str),
+    "--vision-model": ("vision_model", str),
+    "--whisper-model": ("whisper_model", str),
+    "--whisper-compute-type": ("whisper_compute_type", str),
+    "--whisper-batch-size": ("whisper_batch_size", int),
+    "--whisper-beam-size": ("whisper_beam_size", int),
+    "--project": ("project", str),
+    "--output": ("output", str),
+    "--interval": ("interval", int),
+    "--no-key-frames": ("no_key_frames", bool),
+    "--max-frames": ("max_frames", int),
+    "--max-analyze": ("max_analyze", int),
+    "--ai-concurrency": ("ai_concurrency", int),
+    "--no-cache": ("no_cache", bool),
+    "--keep-audio": ("keep_audio", bool),
+    "--skip-frames": ("skip_frames", bool),
+    "--skip-transcribe": ("skip_transcribe", bool),
+    "--skip-vision": ("skip_vision", bool),
+    "--from-cache": ("from_cache", bool),
+    "--api-key": ("api_key", str),
+    "--model": ("model", str),
+    "--openai-whisper-model": ("openai_whisper_model", str),
+    "--debug": ("debug", bool),
+}
 
-def main():
-    """Main CLI entry point"""
-    parser = argparse.ArgumentParser(
-        description="Meeting Analyzer - AI-powered tool to analyze meeting videos and generate SRS documentation",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_FAST_DEFAULTS = {
+    "whisper_batch_size": 16,
+    "whisper_beam_size": 1,
+    "project": "Meeting Project",
+    "output": "output",
+    "interval": 10,
+    "max_frames": 15,
+    "max_analyze": 10,
+    "ai_concurrency": 4,
+}
+
+_PROFILE_CHOICES = ("laptop", "pc", "custom")
+_PROFILE_CHOICES_SET = frozenset(_PROFILE_CHOICES)
+
+_DESCRIPTION = "Meeting Analyzer - AI-powered tool to analyze meeting videos and generate SRS documentation"
+
+_EPILOG = """
 Examples:
   # Basic usage with local models (default)
   meeting-analyzer --video meeting.mp4
@@ -37,6 +79,10 @@ Examples:
   # Use different local Whisper model
   meeting-analyzer --video meeting.mp4 --whisper-model medium
   
+  # Beam search for the most accurate transcript (greedy decoding, the default,
+  # is several times faster and nearly as accurate on typical meeting audio)
+  meeting-analyzer --video meeting.mp4 --whisper-beam-size 5
+  
   # Specify custom text and vision models
   meeting-analyzer --video meeting.mp4 --text-model llama-3.2-3b --vision-model llava-7b
   
@@ -45,20 +91,131 @@ Examples:
   
   # Extract frames at 5-second intervals instead of key frames
   meeting-analyzer --video meeting.mp4 --interval 5 --no-key-frames
+  
+  # Regenerate the SRS from an earlier run's transcript and frame analyses
+  meeting-analyzer --video meeting.mp4 --from-cache
+  
+  # Keep the models loaded between runs; later runs are handed to this server
+  meeting-analyzer daemon start
         """
+
+# Generated files reported after a run, as (results key, label)
+_OUTPUT_LABELS = (
+    ("srs_markdown", "SRS (Markdown)"),
+    ("srs_docx", "SRS (DOCX)"),
+    ("requirements_json", "Requirements (JSON)"),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_dotenv():
+    """Load environment variables from the .env file, once"""
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+def _env(name: str, default: Optional[str] = None) -> Optional[str]:
+    """
+    Look up a setting in the environment, reading .env on the first lookup
+    
+    Settings are only looked up when the command line and profile leave them
+    unset, so runs that give every setting never read .env.
+    
+    Args:
+        name: Environment variable name
+        default: Value when the variable is not set
+        
+    Returns:
+        The variable's value, or default
+    """
+    _load_dotenv()
+    return os.environ.get(name, default)
+
+
+def _fast_parse(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Parse well-formed command lines without importing argparse
+    
+    Args:
+        argv: Command-line arguments, without the program name
+        
+    Returns:
+        Parsed arguments, or None for anything the fast path does not handle
+        (help, unknown options, bad values); argparse then parses and reports it
+    """
+    values = {
+        dest: (False if kind is bool else _FAST_DEFAULTS.get(dest))
+        for dest, kind in _FAST_OPTIONS.values()
+    }
+    
+    i = 0
+    while i < len(argv):
+        option, has_value, inline_value = argv[i].partition("=")
+        spec = _FAST_OPTIONS.get(option)
+        if spec is None:
+            return None
+        dest, kind = spec
+        i += 1
+        
+        if kind is bool:
+            if has_value:
+                return None
+            values[dest] = True
+        elif kind is list:
+            items = [inline_value] if has_value else []
+            while i < len(argv) and not argv[i].startswith("-"):
+                items.append(argv[i])
+                i += 1
+            if not items:
+                return None
+            values[dest] = items
+        else:
+            if has_value:
+                value = inline_value
+            elif i < len(argv) and not argv[i].startswith("-"):
+                value = argv[i]
+                i += 1
+            else:
+                return None
+            if kind is int:
+                try:
+                    value = int(value)
+                except ValueError:
+                    return None
+            values[dest] = value
+    
+    if values["video"] is None:
+        return None
+    if values["profile"] is not None and values["profile"] not in _PROFILE_CHOICES_SET:
+        return None
+    return SimpleNamespace(**values)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> "argparse.ArgumentParser":
+    """Build the argument parser (once per process)"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        prog="meeting-analyzer",  # Same usage line for python -m meeting_analyzer
+        description=_DESCRIPTION,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
     )
     
     # Required arguments
     parser.add_argument(
         "--video",
         required=True,
-        help="Path to the meeting video file"
+        nargs="+",
+        help="Path to the meeting video file; several files are analyzed in one run, "
+             "each into its own subdirectory of --output"
     )
     
     # Hardware profile
     parser.add_argument(
         "--profile",
-        choices=["laptop", "pc", "custom"],
+        choices=_PROFILE_CHOICES,
         help="Hardware profile: laptop (4GB VRAM), pc (24GB VRAM), or custom (manual settings)"
     )
     
@@ -83,6 +240,26 @@ Examples:
         help="Local Whisper model size: tiny, base, small, medium, large (default: small or WHISPER_MODEL env var)"
     )
     
+    parser.add_argument(
+        "--whisper-compute-type",
+        help="faster-whisper compute type, e.g. int8, int8_float16, float16 (default: from profile or auto-detected)"
+    )
+    
+    parser.add_argument(
+        "--whisper-batch-size",
+        type=int,
+        default=16,
+        help="Audio chunks decoded together by batched Whisper inference; 1 disables batching (default: 16)"
+    )
+    
+    parser.add_argument(
+        "--whisper-beam-size",
+        type=int,
+        default=1,
+        help="Beam width for Whisper decoding; 1 is greedy and fastest, 5 trades speed for "
+             "slightly better accuracy (default: 1)"
+    )
+    
     # Output options
     parser.add_argument(
         "--project",
@@ -124,6 +301,51 @@ Examples:
         help="Maximum number of frames to analyze with AI (default: 10)"
     )
     
+    parser.add_argument(
+        "--ai-concurrency",
+        type=int,
+        default=4,
+        help="Maximum number of frames analyzed by LM Studio at once (default: 4)"
+    )
+    
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached transcripts and frame analyses from earlier runs"
+    )
+    
+    parser.add_argument(
+        "--keep-audio",
+        action="store_true",
+        help="Save the extracted audio as a WAV file in the output directory"
+    )
+    
+    # Partial runs: reuse the output of an earlier run in the same --output directory
+    parser.add_argument(
+        "--skip-frames",
+        action="store_true",
+        help="Reuse the frames extracted by an earlier run instead of extracting them again"
+    )
+    
+    parser.add_argument(
+        "--skip-transcribe",
+        action="store_true",
+        help="Reuse the transcription from an earlier run's analysis_results.json"
+    )
+    
+    parser.add_argument(
+        "--skip-vision",
+        action="store_true",
+        help="Reuse the frame analyses from an earlier run's analysis_results.json"
+    )
+    
+    parser.add_argument(
+        "--from-cache",
+        action="store_true",
+        help="Skip Steps 1-3 and only regenerate the requirements and SRS documents "
+             "(same as --skip-frames --skip-transcribe --skip-vision)"
+    )
+    
     # Backward compatibility: OpenAI options (optional)
     parser.add_argument(
         "--api-key",
@@ -140,104 +362,240 @@ Examples:
         help="OpenAI Whisper model name to use instead of local (requires --api-key)"
     )
     
-    args = parser.parse_args()
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Print the full traceback when the analysis fails"
+    )
     
-    # Load environment variables from .env file
-    load_dotenv()
+    return parser
+
+
+@functools.lru_cache(maxsize=4)
+def _get_analyzer(output_dir: str, settings: tuple):
+    """
+    Get an analyzer for these settings, reused by later calls in the same process
+    
+    Keeps the LM Studio client and frame cache between runs of the analysis
+    server; the caller picks the video with set_video().
+    
+    Args:
+        output_dir: Output directory
+        settings: MeetingAnalyzer keyword arguments as sorted (name, value) pairs
+        
+    Returns:
+        MeetingAnalyzer instance
+    """
+    from .analyzer import MeetingAnalyzer
+    return MeetingAnalyzer(video_path=None, output_dir=output_dir, **dict(settings))
+
+
+def _analyze_videos(video_paths: List[str], output_dir: str,
+                    analyzer_kwargs: dict, analyze_kwargs: dict) -> dict:
+    """
+    Analyze the videos in this process
+    
+    Args:
+        video_paths: Paths to the meeting video files
+        output_dir: Output directory; with several videos each gets a subdirectory
+        analyzer_kwargs: Settings for each MeetingAnalyzer
+        analyze_kwargs: Arguments for MeetingAnalyzer.analyze()
+        
+    Returns:
+        Results keyed by video path
+    """
+    from .analyzer import MeetingAnalyzerBatch
+    
+    if len(video_paths) == 1:
+        analyzer = _get_analyzer(output_dir, tuple(sorted(analyzer_kwargs.items())))
+        analyzer.set_video(video_paths[0])
+        return {video_paths[0]: analyzer.analyze(**analyze_kwargs)}
+    # One process for all videos, so the Whisper model is loaded once
+    batch = MeetingAnalyzerBatch(video_paths, output_dir=output_dir, **analyzer_kwargs)
+    return batch.analyze(**analyze_kwargs)
+
+
+def _configure_logging():
+    """
+    Print the package's progress messages to stdout
+    
+    Only the meeting_analyzer logger gets the handler; the root logger is
+    left alone so INFO records of httpx, openai and faster_whisper stay
+    hidden.
+    """
+    package_logger = logging.getLogger("meeting_analyzer")
+    if not package_logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        package_logger.addHandler(handler)
+    package_logger.setLevel(logging.INFO)
+    package_logger.propagate = False
+
+
+def _daemon_main(argv: List[str]):
+    """Entry point for `meeting-analyzer daemon start`"""
+    if argv != ["start"]:
+        print("Usage: meeting-analyzer daemon start")
+        sys.exit(2)
+    
+    from . import daemon
+    _configure_logging()
+    # Import the analyzer stack now rather than on the first request
+    from . import analyzer  # noqa: F401
+    # Requests do not carry the OpenAI API key; it comes from here
+    _load_dotenv()
+    
+    try:
+        daemon.serve(_analyze_videos)
+    except (RuntimeError, OSError) as e:
+        print(f"Error: {str(e)}")
+        sys.exit(1)
+
+
+def main():
+    """Main CLI entry point"""
+    if sys.argv[1:2] == ["daemon"]:
+        _daemon_main(sys.argv[2:])
+        return
+    
+    # argparse only for help and for reporting malformed command lines
+    args = _fast_parse(sys.argv[1:]) or _build_parser().parse_args()
     
-    # Get profile from args or environment
-    profile_name = args.profile or os.getenv("HARDWARE_PROFILE")
+    # Per-frame progress from the analyzer modules is reported through logging
+    _configure_logging()
+    
+    # Imported only now so --help and argument errors return immediately
+    from .profiles import get_profile
+    
+    # Get profile from args or environment; .env is only read once a
+    # setting is missing from both args and profile (see _env())
+    profile_name = args.profile or _env("HARDWARE_PROFILE")
     
     # Validate profile name if provided via environment variable
-    if profile_name and not args.profile and profile_name not in ["laptop", "pc", "custom"]:
+    if profile_name and not args.profile and profile_name not in _PROFILE_CHOICES_SET:
         print(f"Warning: Invalid profile '{profile_name}' in HARDWARE_PROFILE environment variable.")
-        print(f"  Valid profiles: laptop, pc, custom")
+        print(f"  Valid profiles: {', '.join(_PROFILE_CHOICES)}")
         print("  Continuing with default settings")
         profile_name = None
     
     # Load profile settings if specified
-    profile_settings = {}
+    # The profile is reported once, in the configuration banner
+    profile = None
+    profile_description = None
     if profile_name and profile_name != "custom":
         try:
-            profile_settings = get_profile(profile_name)
-            print(f"Using hardware profile: {profile_name}")
-            print(f"  Description: {get_profile_description(profile_name)}")
+            profile = get_profile(profile_name)
+            profile_description = profile.description
         except ValueError as e:
             print(f"Warning: {str(e)}")
             print("Continuing with default/custom settings")
     
     # Get configuration from args or profile or environment variables
     # Priority: CLI args > profile settings > environment variables > defaults
-    lm_studio_url = args.lm_studio_url or os.getenv("LM_STUDIO_URL", "http://localhost:1234/v1")
-    text_model = args.text_model or profile_settings.get("text_model") or os.getenv("LM_STUDIO_MODEL", "phi-3-mini")
-    vision_model = args.vision_model or profile_settings.get("vision_model") or os.getenv("LM_STUDIO_VISION_MODEL", "llava-7b-q4")
-    whisper_model = args.whisper_model or profile_settings.get("whisper_model") or os.getenv("WHISPER_MODEL", "small")
-    vision_on_cpu = profile_settings.get("vision_on_cpu", False)
+    # (with no profile, getattr falls back to None)
+    lm_studio_url = args.lm_studio_url or _env("LM_STUDIO_URL", "http://localhost:1234/v1")
+    text_model = args.text_model or getattr(profile, "text_model", None) or _env("LM_STUDIO_MODEL", "phi-3-mini")
+    vision_model = args.vision_model or getattr(profile, "vision_model", None) or _env("LM_STUDIO_VISION_MODEL", "llava-7b-q4")
+    whisper_model = args.whisper_model or getattr(profile, "whisper_model", None) or _env("WHISPER_MODEL", "small")
+    whisper_compute_type = args.whisper_compute_type or getattr(profile, "compute_type", None) or _env("WHISPER_COMPUTE_TYPE")
+    vision_on_cpu = getattr(profile, "vision_on_cpu", False)
     
     # OpenAI backward compatibility
-    api_key = args.api_key or os.getenv("OPENAI_API_KEY")
-    openai_model = args.model or os.getenv("OPENAI_MODEL")
+    api_key = args.api_key or _env("OPENAI_API_KEY")
+    openai_model = args.model or _env("OPENAI_MODEL")
     openai_whisper = args.openai_whisper_model
     
-    # Check if video file exists
-    if not os.path.exists(args.video):
-        print(f"Error: Video file not found: {args.video}")
-        sys.exit(1)
+    # Check that the videos are regular files; one stat each, which also gives the size
+    video_sizes = {}
+    for video in args.video:
+        try:
+            st = os.stat(video)
+        except OSError:
+            print(f"Error: Video file not found: {video}")
+            sys.exit(1)
+        if not stat.S_ISREG(st.st_mode):
+            print(f"Error: Not a video file: {video}")
+            sys.exit(1)
+        video_sizes[video] = st.st_size
     
     # Create analyzer and run
     try:
-        print("=" * 60)
-        print("Meeting Analyzer - Local AI Analysis")
-        print("=" * 60)
-        if profile_name and profile_name != "custom":
-            print(f"Hardware Profile: {profile_name}")
-            print(f"  {get_profile_description(profile_name)}")
-        print(f"Configuration:")
-        print(f"  LM Studio URL: {lm_studio_url}")
-        print(f"  Text Model: {text_model}")
-        print(f"  Vision Model: {vision_model} {'(CPU mode)' if vision_on_cpu else '(GPU mode)'}")
-        print(f"  Whisper Model: {whisper_model}")
+        # Built up and written at once rather than line by line
+        lines = ["=" * 60, "Meeting Analyzer - Local AI Analysis", "=" * 60]
+        if profile_description is not None:
+            lines += [f"Hardware Profile: {profile_name}", f"  {profile_description}"]
+        lines += [
+            f"Video: {video} ({size / (1024 * 1024):.1f} MB)" for video, size in video_sizes.items()
+        ]
+        lines += [
+            "Configuration:",
+            f"  LM Studio URL: {lm_studio_url}",
+            f"  Text Model: {text_model}",
+            f"  Vision Model: {vision_model} {'(CPU mode)' if vision_on_cpu else '(GPU mode)'}",
+            f"  Whisper Model: {whisper_model}",
+        ]
         if api_key and openai_model:
-            print(f"  OpenAI Fallback: Enabled (using {openai_model})")
-        print()
+            lines.append(f"  OpenAI Fallback: Enabled (using {openai_model})")
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
         
-        analyzer = MeetingAnalyzer(
-            video_path=args.video,
+        analyzer_kwargs = dict(
             lm_studio_url=lm_studio_url,
             text_model=text_model,
             vision_model=vision_model,
             whisper_model=whisper_model,
+            whisper_compute_type=whisper_compute_type,
+            whisper_batch_size=args.whisper_batch_size,
+            whisper_beam_size=args.whisper_beam_size,
             vision_on_cpu=vision_on_cpu,
-            output_dir=args.output,
+            keep_audio=args.keep_audio,
+            ai_concurrency=args.ai_concurrency,
+            use_cache=not args.no_cache,
             openai_api_key=api_key,
             openai_model=openai_model,
             openai_whisper_model=openai_whisper
         )
-        
-        results = analyzer.analyze(
+        analyze_kwargs = dict(
             extract_frames_interval=args.interval,
             extract_key_frames=not args.no_key_frames,
             max_key_frames=args.max_frames,
             max_frames_to_analyze=args.max_analyze,
-            project_name=args.project
+            project_name=args.project,
+            skip_frames=args.skip_frames or args.from_cache,
+            skip_transcribe=args.skip_transcribe or args.from_cache,
+            skip_vision=args.skip_vision or args.from_cache
         )
         
-        print("\n✓ Analysis complete!")
-        print(f"\nGenerated files:")
-        if 'srs_markdown' in results:
-            print(f"  - SRS (Markdown): {results['srs_markdown']}")
-        if 'srs_docx' in results:
-            print(f"  - SRS (DOCX): {results['srs_docx']}")
-        if 'requirements_json' in results:
-            print(f"  - Requirements (JSON): {results['requirements_json']}")
+        # A running `meeting-analyzer daemon start` already has the analyzer
+        # stack imported and the Whisper model loaded. It uses the API key from
+        # its own environment, so a key given with --api-key is only used here.
+        all_results = None
+        if not args.api_key:
+            from . import daemon
+            all_results = daemon.request_analysis(args.video, args.output, analyzer_kwargs, analyze_kwargs)
+        if all_results is None:
+            # The analyzer stack is the slow part of startup, imported only here
+            all_results = _analyze_videos(args.video, args.output, analyzer_kwargs, analyze_kwargs)
+        
+        lines = ["", "✓ Analysis complete!"]
+        for video, results in all_results.items():
+            lines += ["", f"Generated files{f' for {video}' if len(all_results) > 1 else ''}:"]
+            for key, label in _OUTPUT_LABELS:
+                path = results.get(key)
+                if path:
+                    lines.append(f"  - {label}: {path}")
+        sys.stdout.write("\n".join(lines) + "\n")
         
     except KeyboardInterrupt:
         print("\n\nAnalysis interrupted by user")
         sys.exit(1)
     except Exception as e:
         print(f"\nError: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        if args.debug:
+            import traceback
+            traceback.print_exc()
+        else:
+            print("Run again with --debug for the full traceback")
         sys.exit(1)
 
 
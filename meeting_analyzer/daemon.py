@@ -0,0 +1,210 @@
+"""
+Long-running analysis server for the command-line interface
+
+`meeting-analyzer daemon start` keeps one Python process with the analyzer
+stack imported and the Whisper model cached. Later `meeting-analyzer` runs
+hand their analysis to it over a UNIX socket instead of paying the startup
+and model load again, and fall back to analyzing in-process when no server
+is listening.
+
+Only the user who started the server can reach it: the socket lives in a
+directory closed to other users, and clients check that the socket is theirs
+before sending anything. The OpenAI API key is never sent over the socket;
+the server uses the one in its own environment.
+"""
+
+import os
+import socket
+import stat
+import tempfile
+from typing import Callable, Dict, List, Optional
+
+from . import json_utils
+
+
+SOCKET_NAME = "meeting-analyzer.sock"
+
+# Analyzer settings the server takes from its own environment instead of the
+# request, so secrets never pass through the socket
+_SERVER_ENV_SETTINGS = {"openai_api_key": "OPENAI_API_KEY"}
+
+
+def _uid() -> int:
+    """Current user ID (0 where there are no user IDs)"""
+    return os.getuid() if hasattr(os, "getuid") else 0
+
+
+def socket_path() -> str:
+    """
+    Location of the server socket
+    
+    Returns:
+        Path in $XDG_RUNTIME_DIR, or in a per-user directory in the temp directory
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if not runtime_dir:
+        runtime_dir = os.path.join(tempfile.gettempdir(), f"meeting-analyzer-{_uid()}")
+    return os.path.join(runtime_dir, SOCKET_NAME)
+
+
+def _is_private_dir(path: str) -> bool:
+    """Check that path is a directory (not a symlink) of this user that others cannot access"""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISDIR(st.st_mode) and st.st_uid == _uid() and not st.st_mode & 0o077
+
+
+def _is_own_socket(path: str) -> bool:
+    """Check that path is a socket (not a symlink) created by this user"""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(st.st_mode) and st.st_uid == _uid()
+
+
+def _send(conn: socket.socket, message: dict):
+    """Send one newline-terminated JSON message"""
+    conn.sendall(json_utils.dumps(message) + b"\n")
+
+
+def _receive(conn: socket.socket) -> Optional[dict]:
+    """Read one newline-terminated JSON message, or None if the peer hung up"""
+    with conn.makefile("rb") as stream:
+        line = stream.readline()
+    return json_utils.loads(line) if line else None
+
+
+def request_analysis(video_paths: List[str], output_dir: str,
+                     analyzer_kwargs: dict, analyze_kwargs: dict) -> Optional[Dict[str, dict]]:
+    """
+    Run an analysis on the server, if one is running
+    
+    Args:
+        video_paths: Paths to the meeting video files
+        output_dir: Output directory, as given on the command line
+        analyzer_kwargs: Settings for each MeetingAnalyzer; the OpenAI API
+                         key is left out and taken from the server's environment
+        analyze_kwargs: Arguments for MeetingAnalyzer.analyze()
+    
+    Returns:
+        Results keyed by the given video paths, or None if no server of this
+        user is listening
+    
+    Raises:
+        RuntimeError: The server accepted the request but the analysis failed
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    path = socket_path()
+    # Anyone can create files in the temp directory, so only talk to a socket
+    # this user created, in a directory no one else can change
+    if not _is_private_dir(os.path.dirname(path)) or not _is_own_socket(path):
+        return None
+    
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            conn.connect(path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            # Stale socket left by a server that exited
+            return None
+        
+        print(f"Sending analysis to the running server ({path})")
+        absolute_paths = {os.path.abspath(video): video for video in video_paths}
+        # The server has its own working directory, so send absolute paths
+        _send(conn, {
+            "video_paths": list(absolute_paths),
+            "output_dir": os.path.abspath(output_dir),
+            "analyzer_kwargs": {
+                name: value for name, value in analyzer_kwargs.items()
+                if name not in _SERVER_ENV_SETTINGS
+            },
+            "analyze_kwargs": analyze_kwargs,
+        })
+        response = _receive(conn)
+    finally:
+        conn.close()
+    
+    if response is None:
+        raise RuntimeError("Analysis server closed the connection")
+    if "error" in response:
+        raise RuntimeError(f"Analysis server error: {response['error']}")
+    return {
+        absolute_paths.get(video, video): results
+        for video, results in response["results"].items()
+    }
+
+
+def serve(handler: Callable[[List[str], str, dict, dict], Dict[str, dict]]):
+    """
+    Serve analysis requests until interrupted
+    
+    Requests are handled one at a time; they compete for the same GPU anyway.
+    
+    Args:
+        handler: Runs one analysis, called with the video paths, output
+                 directory, analyzer settings and analyze() arguments
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise RuntimeError("The analysis server needs UNIX socket support")
+    
+    path = socket_path()
+    directory = os.path.dirname(path)
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    if not _is_private_dir(directory):
+        raise RuntimeError(f"{directory} must be a directory of the current user "
+                           f"that other users cannot access")
+    if os.path.lexists(path):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+        except ConnectionRefusedError:
+            os.remove(path)  # Left behind by a server that did not shut down cleanly
+        else:
+            raise RuntimeError(f"An analysis server is already running at {path}")
+        finally:
+            probe.close()
+    
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # Only the current user may connect
+    old_umask = os.umask(0o177)
+    try:
+        server.bind(path)
+    finally:
+        os.umask(old_umask)
+    server.listen()
+    print(f"Analysis server listening on {path} (Ctrl+C to stop)")
+    
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                try:
+                    request = _receive(conn)
+                    if request is None:
+                        continue
+                    analyzer_kwargs = dict(request["analyzer_kwargs"])
+                    for name, variable in _SERVER_ENV_SETTINGS.items():
+                        analyzer_kwargs[name] = os.environ.get(variable)
+                    results = handler(
+                        request["video_paths"],
+                        request["output_dir"],
+                        analyzer_kwargs,
+                        request["analyze_kwargs"]
+                    )
+                    _send(conn, {"results": results})
+                except Exception as e:
+                    print(f"✗ Request failed: {str(e)}")
+                    try:
+                        _send(conn, {"error": str(e)})
+                    except OSError:
+                        pass  # Client already gone
+    except KeyboardInterrupt:
+        print("\nAnalysis server stopped")
+    finally:
+        server.close()
+        if os.path.exists(path):
+            os.remove(path)
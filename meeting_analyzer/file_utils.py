@@ -0,0 +1,47 @@
+"""
+File helpers shared by the output and cache writers
+"""
+
+import os
+import threading
+from typing import Callable
+
+
+def write_atomically(path: str, write: Callable[[str], None]) -> None:
+    """
+    Write a file so that readers see either the old or the complete new file
+    
+    The file is written next to its final path and moved into place with
+    os.replace(); if either step fails, the partial file is removed and the
+    error re-raised.
+    
+    Args:
+        path: Output file path
+        write: Writes the complete file to the path it is given
+    """
+    # Unique per thread, as caches are written from worker threads
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_bytes_atomically(path: str, data: bytes) -> None:
+    """
+    Write bytes to a file atomically (see write_atomically())
+    
+    Args:
+        path: Output file path
+        data: File contents
+    """
+    def write(tmp_path):
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+    
+    write_atomically(path, write)
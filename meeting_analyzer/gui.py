@@ -6,16 +6,111 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import threading
 import queue
+import multiprocessing
 import os
-import sys
+from collections import deque
 import platform
 import subprocess
-from pathlib import Path
-from typing import Optional
 from dotenv import load_dotenv
 
-from .analyzer import MeetingAnalyzer
-from .profiles import list_profiles, get_profile_description
+from . import json_utils
+from .file_utils import write_atomically
+from .profiles import list_profiles, get_profile, get_profile_description
+
+
+# Lines kept in the log widget; older ones are dropped so inserts stay cheap.
+# The widget is trimmed in batches of _LOG_TRIM_LINES rather than per insert.
+_LOG_MAX_LINES = 2000
+_LOG_TRIM_LINES = 200
+
+# Lines kept for "Save Log"
+_LOG_HISTORY_LINES = 5000
+
+# Command that opens a file with its default application, chosen once
+_IS_WINDOWS = platform.system() == "Windows"
+_OPEN_COMMAND = "open" if platform.system() == "Darwin" else "xdg-open"
+
+# LM Studio entry rows: (label, StringVar attribute, environment variable, default)
+_LM_STUDIO_FIELDS = (
+    ("LM Studio URL:", "lm_studio_url_var", "LM_STUDIO_URL", "http://localhost:1234/v1"),
+    ("Text Model:", "text_model_var", "LM_STUDIO_MODEL", "phi-3-mini"),
+    ("Vision Model:", "vision_model_var", "LM_STUDIO_VISION_MODEL", "llava-7b-q4"),
+)
+
+# Frame limit spinbox rows: (label, IntVar attribute, default, maximum)
+_FRAME_LIMIT_FIELDS = (
+    ("Max Key Frames:", "max_key_frames_var", 15, 100),
+    ("Max Frames to Analyze:", "max_frames_analyze_var", 10, 50),
+)
+
+# How long notifications stay up, in milliseconds
+_TOAST_MS = 4000
+_ERROR_TOAST_MS = 10000
+
+# Last directory of each file dialog, kept in the user config directory
+_DIALOG_PATHS_FILE = "dialog_paths.json"
+
+# Messages after which the analysis process sends nothing more
+_FINAL_MESSAGES = ("complete", "error", "stopped")
+
+
+def _config_dir():
+    """Per-user configuration directory for the GUI"""
+    try:
+        import platformdirs
+        return platformdirs.user_config_dir("meeting_analyzer")
+    except ImportError:
+        base = os.environ.get("APPDATA") or os.environ.get("XDG_CONFIG_HOME")
+        return os.path.join(base or os.path.expanduser(os.path.join("~", ".config")), "meeting_analyzer")
+
+
+def _open_path(path):
+    """Open a file or folder with the system default application, without waiting for it"""
+    if _IS_WINDOWS:
+        os.startfile(path)
+    else:
+        subprocess.Popen([_OPEN_COMMAND, path])
+
+
+def _run_analysis_worker(analyzer_kwargs, analyze_kwargs, message_queue, stop_event):
+    """
+    Run one analysis in the worker process
+    
+    Runs at module level so the spawn start method can pickle it. Progress
+    goes back as ("progress", ...) tuples on message_queue, followed by one
+    "complete", "error" or "stopped" message.
+    
+    Args:
+        analyzer_kwargs: Settings for MeetingAnalyzer
+        analyze_kwargs: Arguments for MeetingAnalyzer.analyze()
+        message_queue: multiprocessing.Queue read by the GUI
+        stop_event: multiprocessing.Event set when the user asks to stop
+    """
+    from .analyzer import MeetingAnalyzer
+    
+    def progress_callback(step, total_steps, message, error=None):
+        # Check if stop requested
+        if stop_event.is_set():
+            raise InterruptedError("Analysis stopped by user")
+        message_queue.put(("progress", (step, total_steps, message, error)))
+    
+    try:
+        analyzer = MeetingAnalyzer(
+            progress_callback=progress_callback, stop_event=stop_event, **analyzer_kwargs
+        )
+        results = analyzer.analyze(**analyze_kwargs)
+        
+        # Check if stopped
+        if stop_event.is_set():
+            raise InterruptedError("Analysis stopped by user")
+        
+        message_queue.put(("complete", results))
+        
+    except InterruptedError:
+        message_queue.put(("status", "Analysis stopped by user"))
+        message_queue.put(("stopped", None))
+    except Exception as e:
+        message_queue.put(("error", str(e)))
 
 
 class MeetingAnalyzerGUI:
@@ -30,14 +125,32 @@ class MeetingAnalyzerGUI:
         # Set minimum size
         self.root.minsize(800, 600)
         
-        # Analysis state
-        self.analyzer = None
-        self.analysis_thread = None
-        self.stop_requested = False
+        # Analysis state; the analysis runs in its own process so its
+        # Python work never competes with the event loop for the GIL.
+        # Spawn rather than fork: a forked child would share Tk's state.
+        self._mp_context = multiprocessing.get_context("spawn")
+        self.analysis_proc = None
+        self.stop_event = None
         self.results = {}
+        self._log_history = deque(maxlen=_LOG_HISTORY_LINES)
+        self._log_scroll_pending = False
+        
+        # Profile descriptions, looked up on every profile change
+        self._profile_descs = {name: get_profile_description(name) for name in list_profiles()}
         
-        # Message queue for thread communication
-        self.message_queue = queue.Queue()
+        # Last directory used by each file dialog
+        self._last_dirs = self._load_dialog_dirs()
+        
+        # Notification currently shown, if any
+        self._toast = None
+        
+        # Message queue for thread communication; posting a message wakes
+        # the event loop, so nothing polls while the GUI is idle. One thread
+        # appends and the Tk thread pops; deque does both atomically without
+        # the locking of queue.Queue.
+        self.message_queue = deque()
+        self._wake_fds = None
+        self._setup_wakeup()
         
         # Load environment variables
         load_dotenv()
@@ -47,10 +160,59 @@ class MeetingAnalyzerGUI:
         
         # Load saved settings
         self.load_settings()
-        
-        # Start queue processor
+    
+    def _setup_wakeup(self):
+        """Register a pipe with the Tk event loop to be woken by _post()"""
+        if not hasattr(self.root.tk, "createfilehandler"):
+            return  # Windows: _post() schedules the drain through Tk instead
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        os.set_blocking(write_fd, False)
+        self.root.tk.createfilehandler(read_fd, tk.READABLE, self._on_wakeup)
+        self._wake_fds = (read_fd, write_fd)
+    
+    def close_wakeup(self):
+        """Unregister and close the wake-up pipe"""
+        if self._wake_fds is not None:
+            read_fd, write_fd = self._wake_fds
+            self._wake_fds = None
+            self.root.tk.deletefilehandler(read_fd)
+            os.close(read_fd)
+            os.close(write_fd)
+    
+    def _on_wakeup(self, fd, mask):
+        """Drain the wake-up pipe, then the message queue"""
+        try:
+            while os.read(fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
         self.process_queue()
     
+    def _post(self, msg_type, data=None):
+        """
+        Queue a message for the GUI thread and wake it (called from the relay thread)
+        
+        Args:
+            msg_type: Message type handled by process_queue()
+            data: Message payload
+        """
+        self.message_queue.append((msg_type, data))
+        wake_fds = self._wake_fds
+        if wake_fds is not None:
+            try:
+                os.write(wake_fds[1], b"\0")
+            except BlockingIOError:
+                pass  # Pipe full, so a wake-up is already pending
+            except OSError:
+                pass  # Closed while the window shuts down
+        else:
+            try:
+                # Threaded Tcl runs this on the GUI thread
+                self.root.after(0, self.process_queue)
+            except (RuntimeError, tk.TclError):
+                pass  # Main loop already gone
+    
     def setup_ui(self):
         """Create all GUI elements"""
         # Create main container with scrollbar
@@ -84,6 +246,32 @@ class MeetingAnalyzerGUI:
             main_frame.rowconfigure(i, weight=0)
         main_frame.rowconfigure(4, weight=1)  # Progress section should expand
     
+    @staticmethod
+    def _add_entry_row(section, row, label, variable, columnspan=2):
+        """
+        Add a label and a text entry to a section
+        
+        Returns:
+            The entry widget
+        """
+        ttk.Label(section, text=label).grid(row=row, column=0, sticky=tk.W, pady=2)
+        entry = ttk.Entry(section, textvariable=variable, width=50)
+        entry.grid(row=row, column=1, sticky=(tk.W, tk.E), padx=5, pady=2, columnspan=columnspan)
+        return entry
+    
+    @staticmethod
+    def _add_spinbox_row(section, row, label, variable, maximum, **options):
+        """
+        Add a label and a numeric spinbox (from 1 to maximum) to a section
+        
+        Returns:
+            The spinbox widget
+        """
+        ttk.Label(section, text=label).grid(row=row, column=0, sticky=tk.W, pady=2)
+        spinbox = ttk.Spinbox(section, from_=1, to=maximum, textvariable=variable, width=10, **options)
+        spinbox.grid(row=row, column=1, sticky=tk.W, padx=5, pady=2)
+        return spinbox
+    
     def create_input_section(self, parent, row):
         """Create input parameters section"""
         # Section frame
@@ -92,10 +280,8 @@ class MeetingAnalyzerGUI:
         section.columnconfigure(1, weight=1)
         
         # Video file selection
-        ttk.Label(section, text="Video File:").grid(row=0, column=0, sticky=tk.W, pady=2)
         self.video_path_var = tk.StringVar()
-        video_entry = ttk.Entry(section, textvariable=self.video_path_var, width=50)
-        video_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=5, pady=2)
+        self._add_entry_row(section, 0, "Video File:", self.video_path_var, columnspan=1)
         ttk.Button(section, text="Browse...", command=self.browse_video).grid(
             row=0, column=2, pady=2
         )
@@ -131,28 +317,11 @@ class MeetingAnalyzerGUI:
             row=4, column=0, columnspan=3, sticky=tk.W, pady=2
         )
         
-        # LM Studio URL
-        ttk.Label(section, text="LM Studio URL:").grid(row=5, column=0, sticky=tk.W, pady=2)
-        self.lm_studio_url_var = tk.StringVar(
-            value=os.getenv("LM_STUDIO_URL", "http://localhost:1234/v1")
-        )
-        ttk.Entry(section, textvariable=self.lm_studio_url_var, width=50).grid(
-            row=5, column=1, sticky=(tk.W, tk.E), padx=5, pady=2, columnspan=2
-        )
-        
-        # Text model
-        ttk.Label(section, text="Text Model:").grid(row=6, column=0, sticky=tk.W, pady=2)
-        self.text_model_var = tk.StringVar(value=os.getenv("LM_STUDIO_MODEL", "phi-3-mini"))
-        ttk.Entry(section, textvariable=self.text_model_var, width=50).grid(
-            row=6, column=1, sticky=(tk.W, tk.E), padx=5, pady=2, columnspan=2
-        )
-        
-        # Vision model
-        ttk.Label(section, text="Vision Model:").grid(row=7, column=0, sticky=tk.W, pady=2)
-        self.vision_model_var = tk.StringVar(value=os.getenv("LM_STUDIO_VISION_MODEL", "llava-7b-q4"))
-        ttk.Entry(section, textvariable=self.vision_model_var, width=50).grid(
-            row=7, column=1, sticky=(tk.W, tk.E), padx=5, pady=2, columnspan=2
-        )
+        # LM Studio URL, text model and vision model
+        for field_row, (label, attribute, env_var, default) in enumerate(_LM_STUDIO_FIELDS, start=5):
+            variable = tk.StringVar(value=os.getenv(env_var, default))
+            setattr(self, attribute, variable)
+            self._add_entry_row(section, field_row, label, variable)
         
         # Whisper model
         ttk.Label(section, text="Whisper Model:").grid(row=8, column=0, sticky=tk.W, pady=2)
@@ -175,18 +344,12 @@ class MeetingAnalyzerGUI:
         section.columnconfigure(1, weight=1)
         
         # Project name
-        ttk.Label(section, text="Project Name:").grid(row=0, column=0, sticky=tk.W, pady=2)
         self.project_name_var = tk.StringVar(value="Meeting Project")
-        ttk.Entry(section, textvariable=self.project_name_var, width=50).grid(
-            row=0, column=1, sticky=(tk.W, tk.E), padx=5, pady=2, columnspan=2
-        )
+        self._add_entry_row(section, 0, "Project Name:", self.project_name_var)
         
         # Output directory
-        ttk.Label(section, text="Output Directory:").grid(row=1, column=0, sticky=tk.W, pady=2)
         self.output_dir_var = tk.StringVar(value="./output")
-        ttk.Entry(section, textvariable=self.output_dir_var, width=50).grid(
-            row=1, column=1, sticky=(tk.W, tk.E), padx=5, pady=2
-        )
+        self._add_entry_row(section, 1, "Output Directory:", self.output_dir_var, columnspan=1)
         ttk.Button(section, text="Browse...", command=self.browse_output).grid(
             row=1, column=2, pady=2
         )
@@ -209,41 +372,16 @@ class MeetingAnalyzerGUI:
         ).grid(row=0, column=0, columnspan=3, sticky=tk.W, pady=2)
         
         # Extraction interval
-        ttk.Label(section, text="Extraction Interval (seconds):").grid(
-            row=1, column=0, sticky=tk.W, pady=2
-        )
         self.interval_var = tk.IntVar(value=10)
-        self.interval_spinbox = ttk.Spinbox(
-            section,
-            from_=1,
-            to=60,
-            textvariable=self.interval_var,
-            width=10,
-            state="disabled"
+        self.interval_spinbox = self._add_spinbox_row(
+            section, 1, "Extraction Interval (seconds):", self.interval_var, 60, state="disabled"
         )
-        self.interval_spinbox.grid(row=1, column=1, sticky=tk.W, padx=5, pady=2)
         
-        # Max key frames
-        ttk.Label(section, text="Max Key Frames:").grid(row=2, column=0, sticky=tk.W, pady=2)
-        self.max_key_frames_var = tk.IntVar(value=15)
-        ttk.Spinbox(
-            section,
-            from_=1,
-            to=100,
-            textvariable=self.max_key_frames_var,
-            width=10
-        ).grid(row=2, column=1, sticky=tk.W, padx=5, pady=2)
-        
-        # Max frames to analyze
-        ttk.Label(section, text="Max Frames to Analyze:").grid(row=3, column=0, sticky=tk.W, pady=2)
-        self.max_frames_analyze_var = tk.IntVar(value=10)
-        ttk.Spinbox(
-            section,
-            from_=1,
-            to=50,
-            textvariable=self.max_frames_analyze_var,
-            width=10
-        ).grid(row=3, column=1, sticky=tk.W, padx=5, pady=2)
+        # Max key frames and max frames to analyze
+        for field_row, (label, attribute, default, maximum) in enumerate(_FRAME_LIMIT_FIELDS, start=2):
+            variable = tk.IntVar(value=default)
+            setattr(self, attribute, variable)
+            self._add_spinbox_row(section, field_row, label, variable, maximum)
         
         return row + 1
     
@@ -300,6 +438,7 @@ class MeetingAnalyzerGUI:
         button_frame.columnconfigure(1, weight=1)
         button_frame.columnconfigure(2, weight=1)
         button_frame.columnconfigure(3, weight=1)
+        button_frame.columnconfigure(4, weight=1)
         
         # Start button
         self.start_button = ttk.Button(
@@ -327,13 +466,21 @@ class MeetingAnalyzerGUI:
         )
         self.clear_button.grid(row=0, column=2, padx=5, sticky=(tk.W, tk.E))
         
+        # Save log button
+        self.save_log_button = ttk.Button(
+            button_frame,
+            text="Save Log",
+            command=self.save_log
+        )
+        self.save_log_button.grid(row=0, column=3, padx=5, sticky=(tk.W, tk.E))
+        
         # Open output folder button
         self.open_output_button = ttk.Button(
             button_frame,
             text="Open Output Folder",
             command=self.open_output_folder
         )
-        self.open_output_button.grid(row=0, column=3, padx=5, sticky=(tk.W, tk.E))
+        self.open_output_button.grid(row=0, column=4, padx=5, sticky=(tk.W, tk.E))
         
         return row + 1
     
@@ -387,10 +534,46 @@ class MeetingAnalyzerGUI:
         
         return row + 1
     
+    def _load_dialog_dirs(self):
+        """Load the last directory of each file dialog, or {} if none were saved"""
+        try:
+            with open(os.path.join(_config_dir(), _DIALOG_PATHS_FILE), "rb") as f:
+                dirs = json_utils.loads(f.read())
+        except (OSError, json_utils.JSONDecodeError):
+            return {}
+        return dirs if isinstance(dirs, dict) else {}
+    
+    def _initial_dir(self, dialog, current_path):
+        """
+        Directory a file dialog should open in
+        
+        Args:
+            dialog: Dialog name, e.g. "video" or "output"
+            current_path: Directory to use if the dialog has not been used yet
+        """
+        directory = self._last_dirs.get(dialog) or current_path
+        if directory and os.path.isdir(directory):
+            return directory
+        return os.path.expanduser("~")
+    
+    def _remember_dialog_dir(self, dialog, directory):
+        """Save the directory a file dialog was last used in"""
+        if self._last_dirs.get(dialog) == directory:
+            return
+        self._last_dirs[dialog] = directory
+        config_dir = _config_dir()
+        path = os.path.join(config_dir, _DIALOG_PATHS_FILE)
+        try:
+            os.makedirs(config_dir, exist_ok=True)
+            write_atomically(path, lambda tmp_path: json_utils.dump(self._last_dirs, tmp_path))
+        except OSError as e:
+            self.log_message(f"Could not save dialog directories: {str(e)}", "error")
+    
     def browse_video(self):
         """Open file browser for video selection"""
         filename = filedialog.askopenfilename(
             title="Select Video File",
+            initialdir=self._initial_dir("video", os.path.dirname(self.video_path_var.get())),
             filetypes=[
                 ("Video Files", "*.mp4 *.avi *.mov *.mkv *.webm"),
                 ("All Files", "*.*")
@@ -398,12 +581,17 @@ class MeetingAnalyzerGUI:
         )
         if filename:
             self.video_path_var.set(filename)
+            self._remember_dialog_dir("video", os.path.dirname(filename))
     
     def browse_output(self):
         """Open directory browser for output directory"""
-        directory = filedialog.askdirectory(title="Select Output Directory")
+        directory = filedialog.askdirectory(
+            title="Select Output Directory",
+            initialdir=self._initial_dir("output", self.output_dir_var.get())
+        )
         if directory:
             self.output_dir_var.set(directory)
+            self._remember_dialog_dir("output", directory)
     
     def on_profile_change(self):
         """Handle hardware profile change"""
@@ -411,8 +599,8 @@ class MeetingAnalyzerGUI:
         if profile == "custom":
             self.profile_desc_var.set("Custom settings - configure models manually")
         else:
-            desc = get_profile_description(profile)
-            self.profile_desc_var.set(f"{desc}")
+            desc = self._profile_descs.get(profile) or get_profile_description(profile)
+            self.profile_desc_var.set(desc)
     
     def on_key_frames_toggle(self):
         """Handle key frames checkbox toggle"""
@@ -424,35 +612,145 @@ class MeetingAnalyzerGUI:
     def clear_log(self):
         """Clear the log text area"""
         self.log_text.delete(1.0, tk.END)
+        self._log_history.clear()
+    
+    def save_log(self):
+        """Save the recent log lines, including those no longer shown, to a file"""
+        filename = filedialog.asksaveasfilename(
+            title="Save Log",
+            initialdir=self._initial_dir("log", self.output_dir_var.get()),
+            initialfile="meeting_analyzer.log",
+            defaultextension=".log",
+            filetypes=[("Log Files", "*.log"), ("All Files", "*.*")]
+        )
+        if not filename:
+            return
+        self._remember_dialog_dir("log", os.path.dirname(filename))
+        
+        try:
+            with open(filename, "w", encoding="utf-8") as f:
+                f.writelines(message + "\n" for message, _ in self._log_history)
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to save log:\n{str(e)}")
+    
+    def _append_log(self, entries):
+        """
+        Append lines to the log in a single insert, dropping the oldest past the cap
+        
+        Args:
+            entries: (message, tag) pairs; tag may be None
+        """
+        self._log_history.extend(entries)
+        
+        args = []
+        for message, tag in entries[-_LOG_MAX_LINES:]:
+            args += [message + "\n", tag or ()]
+        self.log_text.insert(tk.END, *args)
+        
+        line_count = int(self.log_text.index("end-1c").split(".")[0])
+        if line_count > _LOG_MAX_LINES + _LOG_TRIM_LINES:
+            self.log_text.delete("1.0", f"end-{_LOG_MAX_LINES}l")
+        
+        # Scroll once per idle pass, however many appends happen before it
+        if not self._log_scroll_pending:
+            self._log_scroll_pending = True
+            self.root.after_idle(self._scroll_log_to_end)
+    
+    def _scroll_log_to_end(self):
+        """Show the newest log line (runs when Tk is idle)"""
+        self._log_scroll_pending = False
+        self.log_text.see(tk.END)
     
     def log_message(self, message, tag=None):
         """Add a message to the log"""
-        self.log_text.insert(tk.END, message + "\n", tag)
-        self.log_text.see(tk.END)
-        self.log_text.update_idletasks()
+        self._append_log([(message, tag)])
     
-    def update_progress(self, step, total_steps, message, error=None):
-        """Update progress bar and status"""
+    @staticmethod
+    def _progress_log_entry(message, error=None):
+        """(message, tag) log entry for a progress update"""
+        if error:
+            return f"ERROR: {message} - {error}", "error"
+        return message, "info"
+    
+    def _apply_progress(self, step, total_steps, message, error=None):
+        """Update progress bar and status, without logging"""
         # Calculate percentage
         percent = (step / total_steps) * 100
         self.progress_var.set(percent)
         
         # Update status
-        if error:
-            self.status_var.set(f"Error: {message}")
-            self.log_message(f"ERROR: {message} - {error}", "error")
-        else:
-            self.status_var.set(message)
-            self.log_message(message, "info")
+        self.status_var.set(f"Error: {message}" if error else message)
+    
+    def update_progress(self, step, total_steps, message, error=None):
+        """Update progress bar and status"""
+        self._apply_progress(step, total_steps, message, error)
+        self.log_message(*self._progress_log_entry(message, error))
+    
+    def show_toast(self, message, error=False, details=None):
+        """
+        Show a notification in the bottom-right corner of the window
+        
+        Unlike a message box, this does not start a nested event loop, so
+        queued messages keep being processed while it is visible.
+        
+        Args:
+            message: Text to show
+            error: Show as an error, and keep it up longer
+            details: Text for a "Details..." button that opens a dialog
+        """
+        self._dismiss_toast()
+        
+        background = "#c62828" if error else "#2e7d32"
+        toast = tk.Toplevel(self.root, background=background)
+        toast.overrideredirect(True)
+        label = tk.Label(
+            toast,
+            text=message,
+            background=background,
+            foreground="white",
+            wraplength=320,
+            justify=tk.LEFT,
+            padx=12,
+            pady=8
+        )
+        label.pack(side=tk.LEFT)
+        if details:
+            ttk.Button(
+                toast,
+                text="Details...",
+                command=lambda: messagebox.showerror("Error", details, parent=self.root)
+            ).pack(side=tk.RIGHT, padx=8, pady=8)
+        # Click to dismiss
+        label.bind("<Button-1>", lambda event: self._dismiss_toast())
+        
+        toast.update_idletasks()
+        x = self.root.winfo_rootx() + self.root.winfo_width() - toast.winfo_reqwidth() - 20
+        y = self.root.winfo_rooty() + self.root.winfo_height() - toast.winfo_reqheight() - 20
+        toast.geometry(f"+{x}+{y}")
+        
+        self._toast = toast
+        toast.after(_ERROR_TOAST_MS if error else _TOAST_MS, lambda: self._dismiss_toast(toast))
+    
+    def _dismiss_toast(self, toast=None):
+        """
+        Close the current notification, if any
+        
+        Args:
+            toast: Close only if this is still the current notification
+        """
+        if self._toast is None or toast not in (None, self._toast):
+            return
+        self._toast.destroy()
+        self._toast = None
     
     def show_error(self, error_message):
         """Display error in GUI"""
         self.status_var.set(f"Error: {error_message}")
         self.log_message(f"ERROR: {error_message}", "error")
-        messagebox.showerror("Error", error_message)
+        self.show_toast(error_message, error=True)
     
     def start_analysis(self):
-        """Start the analysis in a background thread"""
+        """Start the analysis in a worker process"""
         # Validate inputs
         video_path = self.video_path_var.get()
         if not video_path:
@@ -464,7 +762,6 @@ class MeetingAnalyzerGUI:
             return
         
         # Reset state
-        self.stop_requested = False
         self.results = {}
         
         # Update UI state
@@ -481,106 +778,126 @@ class MeetingAnalyzerGUI:
         self.srs_docx_button.config(state="disabled")
         self.requirements_json_button.config(state="disabled")
         
-        # Start analysis thread
-        self.analysis_thread = threading.Thread(target=self._run_analysis, daemon=True)
-        self.analysis_thread.start()
+        # Start the analysis process, and a thread relaying its messages
+        analyzer_kwargs, analyze_kwargs = self._analysis_config()
+        mp_queue = self._mp_context.Queue()
+        self.stop_event = self._mp_context.Event()
+        self.analysis_proc = self._mp_context.Process(
+            target=_run_analysis_worker,
+            args=(analyzer_kwargs, analyze_kwargs, mp_queue, self.stop_event),
+            daemon=True
+        )
+        self.analysis_proc.start()
+        threading.Thread(
+            target=self._forward_messages, args=(self.analysis_proc, mp_queue), daemon=True
+        ).start()
     
     def stop_analysis(self):
         """Request to stop the ongoing analysis"""
-        self.stop_requested = True
+        if self.stop_event is not None:
+            self.stop_event.set()
         self.status_var.set("Stopping analysis...")
         self.log_message("Stop requested by user", "info")
     
-    def _run_analysis(self):
-        """Run analysis in background thread"""
-        try:
-            # Get configuration from GUI
-            video_path = self.video_path_var.get()
-            output_dir = self.output_dir_var.get()
-            project_name = self.project_name_var.get()
-            lm_studio_url = self.lm_studio_url_var.get()
-            text_model = self.text_model_var.get()
-            vision_model = self.vision_model_var.get()
-            whisper_model = self.whisper_model_var.get()
-            
-            # Get profile settings
-            profile = self.profile_var.get()
-            vision_on_cpu = False
-            if profile == "laptop":
-                vision_on_cpu = True
-            elif profile == "pc":
-                vision_on_cpu = False
-            
-            # Create analyzer with progress callback
-            self.analyzer = MeetingAnalyzer(
-                video_path=video_path,
-                lm_studio_url=lm_studio_url,
-                text_model=text_model,
-                vision_model=vision_model,
-                whisper_model=whisper_model,
-                vision_on_cpu=vision_on_cpu,
-                output_dir=output_dir,
-                progress_callback=self._progress_callback
-            )
-            
-            # Run analysis with frame extraction settings
-            results = self.analyzer.analyze(
-                extract_frames_interval=self.interval_var.get(),
-                extract_key_frames=self.use_key_frames_var.get(),
-                max_key_frames=self.max_key_frames_var.get(),
-                max_frames_to_analyze=self.max_frames_analyze_var.get(),
-                project_name=project_name
-            )
-            
-            # Check if stopped
-            if self.stop_requested:
-                self.message_queue.put(("status", "Analysis stopped by user"))
-                self.message_queue.put(("stopped", None))
+    def is_analysis_running(self):
+        """Whether an analysis process is still running"""
+        return self.analysis_proc is not None and self.analysis_proc.is_alive()
+    
+    def _analysis_config(self):
+        """
+        Read the analysis settings from the form
+        
+        Returns:
+            (analyzer_kwargs, analyze_kwargs) for the worker process
+        """
+        # Get profile settings
+        profile_name = self.profile_var.get()
+        vision_on_cpu = False
+        whisper_compute_type = None
+        if profile_name in self._profile_descs:
+            profile = get_profile(profile_name)
+            vision_on_cpu = profile.vision_on_cpu
+            whisper_compute_type = profile.compute_type
+        
+        analyzer_kwargs = {
+            "video_path": self.video_path_var.get(),
+            "lm_studio_url": self.lm_studio_url_var.get(),
+            "text_model": self.text_model_var.get(),
+            "vision_model": self.vision_model_var.get(),
+            "whisper_model": self.whisper_model_var.get(),
+            "whisper_compute_type": whisper_compute_type,
+            "vision_on_cpu": vision_on_cpu,
+            "output_dir": self.output_dir_var.get(),
+        }
+        analyze_kwargs = {
+            "extract_frames_interval": self.interval_var.get(),
+            "extract_key_frames": self.use_key_frames_var.get(),
+            "max_key_frames": self.max_key_frames_var.get(),
+            "max_frames_to_analyze": self.max_frames_analyze_var.get(),
+            "project_name": self.project_name_var.get(),
+        }
+        return analyzer_kwargs, analyze_kwargs
+    
+    def _forward_messages(self, process, mp_queue):
+        """Relay messages from the analysis process to the GUI (runs on a helper thread)"""
+        while True:
+            try:
+                msg_type, data = mp_queue.get(timeout=1)
+            except queue.Empty:
+                if process.is_alive():
+                    continue
+                self._post("error", f"Analysis process exited unexpectedly (exit code {process.exitcode})")
                 return
             
-            # Send completion message
-            self.message_queue.put(("complete", results))
-            
-        except Exception as e:
-            # Send error message
-            self.message_queue.put(("error", str(e)))
-    
-    def _progress_callback(self, step, total_steps, message, error=None):
-        """Progress callback for analyzer (called from background thread)"""
-        # Check if stop requested
-        if self.stop_requested:
-            raise InterruptedError("Analysis stopped by user")
-        
-        # Send progress update to main thread
-        self.message_queue.put(("progress", (step, total_steps, message, error)))
+            self._post(msg_type, data)
+            if msg_type in _FINAL_MESSAGES:
+                # A stopped run may leave extraction or transcription threads
+                # behind, which would keep the process alive until they finish
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+                return
     
     def process_queue(self):
-        """Process messages from background thread"""
+        """
+        Process all pending messages relayed from the analysis process
+        
+        Updates are coalesced: the progress bar and status show the latest
+        progress message, and all log lines go in with one insert. Completion,
+        error and stop messages are handled after that, in order.
+        """
+        latest_progress = None
+        log_entries = []
+        final_messages = []
         try:
             while True:
-                msg_type, data = self.message_queue.get_nowait()
+                msg_type, data = self.message_queue.popleft()
                 
                 if msg_type == "progress":
-                    step, total_steps, message, error = data
-                    self.update_progress(step, total_steps, message, error)
-                
-                elif msg_type == "complete":
-                    self.analysis_complete(data)
-                
-                elif msg_type == "error":
-                    self.analysis_error(data)
-                
-                elif msg_type == "stopped":
-                    self.analysis_stopped()
+                    latest_progress = data
+                    log_entries.append(self._progress_log_entry(*data[2:]))
                 
                 elif msg_type == "status":
-                    self.log_message(data, "info")
+                    log_entries.append((data, "info"))
+                
+                else:
+                    final_messages.append((msg_type, data))
         
-        except queue.Empty:
+        except IndexError:
             pass
         
-        # Schedule next check
-        self.root.after(100, self.process_queue)
+        if latest_progress is not None:
+            self._apply_progress(*latest_progress)
+        if log_entries:
+            self._append_log(log_entries)
+        
+        for msg_type, data in final_messages:
+            if msg_type == "complete":
+                self.analysis_complete(data)
+            elif msg_type == "error":
+                self.analysis_error(data)
+            elif msg_type == "stopped":
+                self.analysis_stopped()
     
     def analysis_complete(self, results):
         """Handle analysis completion"""
@@ -613,9 +930,8 @@ class MeetingAnalyzerGUI:
             self.requirements_json_button.config(state="normal")
             self.log_message(f"✓ Requirements JSON: {results['requirements_json']}", "success")
         
-        # Show completion dialog
-        messagebox.showinfo(
-            "Analysis Complete",
+        # Notify without blocking the event loop
+        self.show_toast(
             "Meeting analysis completed successfully!\n\nGenerated files are available in the Results section."
         )
     
@@ -628,7 +944,7 @@ class MeetingAnalyzerGUI:
         self.log_message(f"ANALYSIS FAILED: {error_message}", "error")
         self.log_message("=" * 60, "error")
         
-        messagebox.showerror("Analysis Failed", f"An error occurred:\n\n{error_message}")
+        self.show_toast("Analysis failed", error=True, details=f"An error occurred:\n\n{error_message}")
     
     def analysis_stopped(self):
         """Handle analysis stopped by user"""
@@ -644,12 +960,7 @@ class MeetingAnalyzerGUI:
             return
         
         try:
-            if platform.system() == "Darwin":  # macOS
-                subprocess.run(["open", filepath])
-            elif platform.system() == "Windows":
-                os.startfile(filepath)
-            else:  # Linux
-                subprocess.run(["xdg-open", filepath])
+            _open_path(filepath)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open file:\n{str(e)}")
     
@@ -662,12 +973,7 @@ class MeetingAnalyzerGUI:
             os.makedirs(output_dir, exist_ok=True)
         
         try:
-            if platform.system() == "Darwin":  # macOS
-                subprocess.run(["open", output_dir])
-            elif platform.system() == "Windows":
-                os.startfile(output_dir)
-            else:  # Linux
-                subprocess.run(["xdg-open", output_dir])
+            _open_path(output_dir)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open folder:\n{str(e)}")
     
@@ -692,11 +998,14 @@ def main():
     
     # Handle window close
     def on_closing():
-        if app.analysis_thread and app.analysis_thread.is_alive():
+        if app.is_analysis_running():
             if messagebox.askokcancel("Quit", "Analysis is running. Do you want to quit?"):
-                app.stop_requested = True
+                app.stop_event.set()
+                app.analysis_proc.terminate()
+                app.close_wakeup()
                 root.destroy()
         else:
+            app.close_wakeup()
             root.destroy()
     
     root.protocol("WM_DELETE_WINDOW", on_closing)
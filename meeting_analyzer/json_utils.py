@@ -0,0 +1,96 @@
+"""
+JSON helpers that use orjson when it is available
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can catch
+# this regardless of which backend is active
+JSONDecodeError = orjson.JSONDecodeError if orjson is not None else json.JSONDecodeError
+
+# OPT_NON_STR_KEYS stringifies integer keys (e.g. frame indices) like the json module
+_ORJSON_OPTIONS = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if orjson is not None else 0
+
+
+def _default(obj):
+    """Serialize NumPy scalars and arrays, which turn up in timing data"""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def loads(data):
+    """
+    Parse a JSON document
+    
+    Args:
+        data: JSON text as str or bytes
+        
+    Returns:
+        Parsed Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, sort_keys: bool = False) -> bytes:
+    """
+    Serialize an object to compact UTF-8 encoded JSON
+    
+    Args:
+        obj: JSON-serializable object
+        sort_keys: Sort object keys, so equal objects serialize identically
+        
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        option = _ORJSON_OPTIONS | orjson.OPT_SORT_KEYS if sort_keys else _ORJSON_OPTIONS
+        return orjson.dumps(obj, default=_default, option=option)
+    return json.dumps(obj, ensure_ascii=False, default=_default, sort_keys=sort_keys).encode('utf-8')
+
+
+def dump(obj, path: str, indent: bool = False) -> None:
+    """
+    Write an object to a file as JSON followed by a newline
+    
+    Args:
+        obj: JSON-serializable object
+        path: Output file path
+        indent: Indent by two spaces for human readers (default: False, compact)
+    """
+    if orjson is not None:
+        option = _ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        data = orjson.dumps(obj, default=_default, option=option)
+    else:
+        # Serialize up front: json.dump() would issue a write per token
+        text = json.dumps(obj, ensure_ascii=False, default=_default, indent=2 if indent else None)
+        data = (text + '\n').encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def dump_ndjson(items, path: str) -> None:
+    """
+    Write items to a file as newline-delimited JSON, one item per line
+    
+    Items are serialized one at a time, so consumers can stream the file
+    and the full document is never built in memory.
+    
+    Args:
+        items: Iterable of JSON-serializable objects
+        path: Output file path
+    """
+    with open(path, 'wb') as f:
+        for item in items:
+            f.write(dumps(item))
+            f.write(b'\n')
@@ -0,0 +1,31 @@
+"""
+Numba-compiled kernels for video processing
+
+Imported lazily by video_processor only when numba is installed.
+"""
+
+import numba
+import numpy as np
+
+
+@numba.njit(cache=True, fastmath=True, parallel=True)
+def mean_abs_diff(frame: np.ndarray, prev_frame: np.ndarray) -> float:
+    """
+    Mean absolute difference between two grayscale frames
+    
+    Args:
+        frame: Current frame as a 2-D uint8 array
+        prev_frame: Previous frame as a 2-D uint8 array of the same shape
+        
+    Returns:
+        Mean absolute per-pixel difference
+    """
+    rows, cols = frame.shape
+    total = 0.0
+    for r in numba.prange(rows):
+        row_sum = 0
+        for c in range(cols):
+            d = np.int32(frame[r, c]) - np.int32(prev_frame[r, c])
+            row_sum += d if d >= 0 else -d
+        total += row_sum
+    return total / (rows * cols)
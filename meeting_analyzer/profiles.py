@@ -2,25 +2,48 @@
 Hardware profile configuration for Meeting Analyzer
 """
 
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Profile:
+    """Settings for one hardware profile (immutable, so it is shared by all callers)"""
+    
+    # Declared by hand; dataclass(slots=True) needs Python 3.10
+    __slots__ = ("whisper_model", "compute_type", "vision_model", "text_model",
+                 "vision_on_cpu", "description")
+    
+    whisper_model: str
+    compute_type: str
+    vision_model: str
+    text_model: str
+    vision_on_cpu: bool
+    description: str
+
+
 PROFILES = {
-    "laptop": {
-        "whisper_model": "small",
-        "vision_model": "llava-v1.6-mistral-7b",  # LM Studio model name
-        "text_model": "phi-3-mini-4k-instruct",
-        "vision_on_cpu": True,
-        "description": "GTX 1050 Ti (4GB VRAM), 48GB RAM"
-    },
-    "pc": {
-        "whisper_model": "large-v3",
-        "vision_model": "llava-v1.6-34b",
-        "text_model": "llama-3.1-70b-instruct",
-        "vision_on_cpu": False,
-        "description": "RTX 4090 (24GB VRAM), 96GB RAM"
-    }
+    "laptop": Profile(
+        whisper_model="small",
+        compute_type="int8",
+        vision_model="llava-v1.6-mistral-7b",  # LM Studio model name
+        text_model="phi-3-mini-4k-instruct",
+        vision_on_cpu=True,
+        description="GTX 1050 Ti (4GB VRAM), 48GB RAM"
+    ),
+    "pc": Profile(
+        whisper_model="large-v3",
+        compute_type="float16",
+        vision_model="llava-v1.6-34b",
+        text_model="llama-3.1-70b-instruct",
+        vision_on_cpu=False,
+        description="RTX 4090 (24GB VRAM), 96GB RAM"
+    )
 }
 
+_PROFILE_NAMES = tuple(PROFILES)
+
 
-def get_profile(profile_name: str) -> dict:
+def get_profile(profile_name: str) -> Profile:
     """
     Get profile settings by name
     
@@ -28,17 +51,18 @@ def get_profile(profile_name: str) -> dict:
         profile_name: Name of the profile (laptop, pc)
         
     Returns:
-        Dictionary with profile settings
+        Profile settings
         
     Raises:
         ValueError: If profile name is not recognized
     """
-    if profile_name not in PROFILES:
+    profile = PROFILES.get(profile_name)
+    if profile is None:
         raise ValueError(
             f"Unknown profile: {profile_name}. "
-            f"Available profiles: {', '.join(PROFILES.keys())}"
+            f"Available profiles: {', '.join(_PROFILE_NAMES)}"
         )
-    return PROFILES[profile_name].copy()
+    return profile
 
 
 def list_profiles() -> list:
@@ -48,7 +72,7 @@ def list_profiles() -> list:
     Returns:
         List of profile names
     """
-    return list(PROFILES.keys())
+    return list(_PROFILE_NAMES)
 
 
 def get_profile_description(profile_name: str) -> str:
@@ -61,6 +85,7 @@ def get_profile_description(profile_name: str) -> str:
     Returns:
         Description string
     """
-    if profile_name not in PROFILES:
+    profile = PROFILES.get(profile_name)
+    if profile is None:
         return f"Unknown profile: {profile_name}"
-    return PROFILES[profile_name].get("description", "No description")
+    return profile.description
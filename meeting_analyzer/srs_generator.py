@@ -2,11 +2,106 @@
 SRS document generator module
 """
 
+import hashlib
 import os
 from datetime import datetime
-from typing import Dict, List
-from pathlib import Path
-import json
+from typing import Dict, Tuple
+
+from . import json_utils
+from .file_utils import write_atomically, write_bytes_atomically
+
+# Fixed opening of the Markdown document, filled with (project name, timestamp)
+_MD_HEADER_TMPL = """# Software Requirements Specification (SRS)
+
+**Project:** %s  
+**Date Generated:** %s  
+**Version:** 1.0
+
+---
+
+## Table of Contents
+
+1. [Introduction](#introduction)
+2. [Project Overview](#project-overview)
+3. [Functional Requirements](#functional-requirements)
+4. [Non-Functional Requirements](#non-functional-requirements)
+5. [Technical Requirements](#technical-requirements)
+6. [UI/UX Requirements](#ui-ux-requirements)
+7. [Issues and Concerns](#issues-and-concerns)
+
+---
+
+## 1. Introduction
+
+This Software Requirements Specification (SRS) document was automatically generated from meeting recordings using AI-powered analysis. It combines audio transcription and visual content analysis to extract comprehensive project requirements.
+
+---
+
+"""
+
+_MD_APPENDIX = """---
+
+## Appendix
+
+### Document Information
+
+- **Generated By:** Meeting Analyzer Tool
+- **Source:** Automated analysis of meeting video and audio
+- **Analysis Method:** AI-powered transcription and visual content analysis
+
+### Notes
+
+This document was automatically generated and should be reviewed and refined by the project team.
+"""
+
+# Per-item Markdown templates, filled with % in the generate_markdown() loops
+_FR_TMPL = "### FR-%03d\n\n%s\n\n"
+_H3_TMPL = "### %s\n\n%s\n\n"
+_BOLD_KV_TMPL = "**%s:** %s\n\n"
+_BULLET_TMPL = "- %s\n"
+
+
+# Marks a section missing from the requirements (None is a valid value)
+_MISSING = object()
+
+
+def _first_present(requirements: Dict, keys: Tuple[str, ...]):
+    """
+    Value of the first of keys found in requirements
+    
+    The AI model names sections either in upper case or in snake case.
+    
+    Args:
+        requirements: Requirements data
+        keys: Alternative names of one section, in order of preference
+        
+    Returns:
+        The section's value, or _MISSING
+    """
+    for key in keys:
+        if key in requirements:
+            return requirements[key]
+    return _MISSING
+
+
+# Suffix of the file next to a DOCX holding the digest of its inputs
+_DIGEST_SUFFIX = ".digest"
+
+
+# (heading, requirements key, text used when the key is missing) for each
+# DOCX section
+_DOCX_SECTIONS = tuple(
+    (title, key, f"{title} will be extracted from meeting analysis.")
+    for title, key in (
+        ("Introduction", "introduction"),
+        ("Project Overview", "project_overview"),
+        ("Functional Requirements", "functional_requirements"),
+        ("Non-Functional Requirements", "non_functional_requirements"),
+        ("Technical Requirements", "technical_requirements"),
+        ("UI/UX Requirements", "ui_ux_requirements"),
+        ("Issues and Concerns", "issues_and_concerns"),
+    )
+)
 
 
 class SRSGenerator:
@@ -20,8 +115,27 @@ class SRSGenerator:
             output_dir: Directory to save generated documents
         """
         self.output_dir = output_dir
+        # Output path -> digest of the inputs it was last generated from
+        self._cache: Dict[str, str] = {}
         os.makedirs(output_dir, exist_ok=True)
     
+    def _check_cache(self, output_path: str, requirements: Dict, project_name: str) -> Tuple[str, bool]:
+        """
+        Check whether a file was already generated from these inputs
+        
+        Args:
+            output_path: Path of the file to generate
+            requirements: Requirements data
+            project_name: Name of the project
+            
+        Returns:
+            (digest of the inputs, True if the file is up to date)
+        """
+        # Names differing only in spaces and underscores share an output path
+        data = json_utils.dumps(requirements, sort_keys=True) + b"\0" + project_name.encode('utf-8')
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        return digest, self._cache.get(output_path) == digest and os.path.exists(output_path)
+    
     def generate_markdown(self, requirements: Dict, project_name: str = "Project") -> str:
         """
         Generate SRS document in Markdown format
@@ -33,140 +147,106 @@ class SRSGenerator:
         Returns:
             Path to generated Markdown file
         """
+        output_path = os.path.join(self.output_dir, f"SRS_{project_name.replace(' ', '_')}.md")
+        digest, up_to_date = self._check_cache(output_path, requirements, project_name)
+        if up_to_date:
+            print(f"SRS document (Markdown) unchanged: {output_path}")
+            return output_path
+        
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
-        # Start building the markdown content
-        content = f"""# Software Requirements Specification (SRS)
-
-**Project:** {project_name}  
-**Date Generated:** {timestamp}  
-**Version:** 1.0
-
----
-
-## Table of Contents
-
-1. [Introduction](#introduction)
-2. [Project Overview](#project-overview)
-3. [Functional Requirements](#functional-requirements)
-4. [Non-Functional Requirements](#non-functional-requirements)
-5. [Technical Requirements](#technical-requirements)
-6. [UI/UX Requirements](#ui-ux-requirements)
-7. [Issues and Concerns](#issues-and-concerns)
-
----
-
-## 1. Introduction
-
-This Software Requirements Specification (SRS) document was automatically generated from meeting recordings using AI-powered analysis. It combines audio transcription and visual content analysis to extract comprehensive project requirements.
-
----
-
-"""
+        # Collect the document in pieces and join once; repeated += on a str
+        # copies everything written so far
+        parts = [_MD_HEADER_TMPL % (project_name, timestamp)]
         
         # Add sections based on requirements data
         if isinstance(requirements, dict):
             # Project Overview
-            content += "## 2. Project Overview\n\n"
-            if "PROJECT OVERVIEW" in requirements or "project_overview" in requirements:
-                overview = requirements.get("PROJECT OVERVIEW", requirements.get("project_overview", {}))
+            parts.append("## 2. Project Overview\n\n")
+            overview = _first_present(requirements, ("PROJECT OVERVIEW", "project_overview"))
+            if overview is not _MISSING:
                 if isinstance(overview, dict):
                     for key, value in overview.items():
-                        content += f"**{key.replace('_', ' ').title()}:** {value}\n\n"
+                        parts.append(_BOLD_KV_TMPL % (key.replace('_', ' ').title(), value))
                 else:
-                    content += f"{overview}\n\n"
+                    parts.append(f"{overview}\n\n")
             else:
-                content += "*To be determined based on meeting analysis.*\n\n"
+                parts.append("*To be determined based on meeting analysis.*\n\n")
             
             # Functional Requirements
-            content += "## 3. Functional Requirements\n\n"
-            if "FUNCTIONAL REQUIREMENTS" in requirements or "functional_requirements" in requirements:
-                func_reqs = requirements.get("FUNCTIONAL REQUIREMENTS", requirements.get("functional_requirements", []))
+            parts.append("## 3. Functional Requirements\n\n")
+            func_reqs = _first_present(requirements, ("FUNCTIONAL REQUIREMENTS", "functional_requirements"))
+            if func_reqs is not _MISSING:
                 if isinstance(func_reqs, list):
-                    for i, req in enumerate(func_reqs, 1):
-                        content += f"### FR-{i:03d}\n\n{req}\n\n"
+                    parts.extend(_FR_TMPL % (i, req) for i, req in enumerate(func_reqs, 1))
                 elif isinstance(func_reqs, dict):
                     for key, value in func_reqs.items():
-                        content += f"### {key}\n\n{value}\n\n"
+                        parts.append(_H3_TMPL % (key, value))
                 else:
-                    content += f"{func_reqs}\n\n"
+                    parts.append(f"{func_reqs}\n\n")
             else:
-                content += "*Functional requirements will be extracted from meeting analysis.*\n\n"
+                parts.append("*Functional requirements will be extracted from meeting analysis.*\n\n")
             
             # Non-Functional Requirements
-            content += "## 4. Non-Functional Requirements\n\n"
-            if "NON-FUNCTIONAL REQUIREMENTS" in requirements or "non_functional_requirements" in requirements:
-                nfr = requirements.get("NON-FUNCTIONAL REQUIREMENTS", requirements.get("non_functional_requirements", {}))
+            parts.append("## 4. Non-Functional Requirements\n\n")
+            nfr = _first_present(requirements, ("NON-FUNCTIONAL REQUIREMENTS", "non_functional_requirements"))
+            if nfr is not _MISSING:
                 if isinstance(nfr, dict):
                     for key, value in nfr.items():
-                        content += f"### {key.replace('_', ' ').title()}\n\n{value}\n\n"
+                        parts.append(_H3_TMPL % (key.replace('_', ' ').title(), value))
                 else:
-                    content += f"{nfr}\n\n"
+                    parts.append(f"{nfr}\n\n")
             else:
-                content += "*Non-functional requirements will be extracted from meeting analysis.*\n\n"
+                parts.append("*Non-functional requirements will be extracted from meeting analysis.*\n\n")
             
             # Technical Requirements
-            content += "## 5. Technical Requirements\n\n"
-            if "TECHNICAL REQUIREMENTS" in requirements or "technical_requirements" in requirements:
-                tech_reqs = requirements.get("TECHNICAL REQUIREMENTS", requirements.get("technical_requirements", {}))
+            parts.append("## 5. Technical Requirements\n\n")
+            tech_reqs = _first_present(requirements, ("TECHNICAL REQUIREMENTS", "technical_requirements"))
+            if tech_reqs is not _MISSING:
                 if isinstance(tech_reqs, dict):
                     for key, value in tech_reqs.items():
-                        content += f"**{key.replace('_', ' ').title()}:** {value}\n\n"
+                        parts.append(_BOLD_KV_TMPL % (key.replace('_', ' ').title(), value))
                 else:
-                    content += f"{tech_reqs}\n\n"
+                    parts.append(f"{tech_reqs}\n\n")
             else:
-                content += "*Technical requirements will be extracted from meeting analysis.*\n\n"
+                parts.append("*Technical requirements will be extracted from meeting analysis.*\n\n")
             
             # UI/UX Requirements
-            content += "## 6. UI/UX Requirements\n\n"
-            if "UI/UX REQUIREMENTS" in requirements or "ui_ux_requirements" in requirements:
-                ui_reqs = requirements.get("UI/UX REQUIREMENTS", requirements.get("ui_ux_requirements", ""))
-                content += f"{ui_reqs}\n\n"
+            parts.append("## 6. UI/UX Requirements\n\n")
+            ui_reqs = _first_present(requirements, ("UI/UX REQUIREMENTS", "ui_ux_requirements"))
+            if ui_reqs is not _MISSING:
+                parts.append(f"{ui_reqs}\n\n")
             else:
-                content += "*UI/UX requirements will be extracted from visual analysis.*\n\n"
+                parts.append("*UI/UX requirements will be extracted from visual analysis.*\n\n")
             
             # Issues and Concerns
-            content += "## 7. Issues and Concerns\n\n"
-            if "ISSUES AND CONCERNS" in requirements or "issues_and_concerns" in requirements:
-                issues = requirements.get("ISSUES AND CONCERNS", requirements.get("issues_and_concerns", []))
+            parts.append("## 7. Issues and Concerns\n\n")
+            issues = _first_present(requirements, ("ISSUES AND CONCERNS", "issues_and_concerns"))
+            if issues is not _MISSING:
                 if isinstance(issues, list):
-                    for issue in issues:
-                        content += f"- {issue}\n"
+                    parts.extend(_BULLET_TMPL % (issue,) for issue in issues)
                 else:
-                    content += f"{issues}\n"
-                content += "\n"
+                    parts.append(f"{issues}\n")
+                parts.append("\n")
             else:
-                content += "*Issues and concerns will be extracted from meeting discussion.*\n\n"
+                parts.append("*Issues and concerns will be extracted from meeting discussion.*\n\n")
             
             # Add raw analysis if present
             if "raw_analysis" in requirements:
-                content += "---\n\n## Raw Analysis\n\n"
-                content += f"{requirements['raw_analysis']}\n\n"
+                parts.append("---\n\n## Raw Analysis\n\n")
+                parts.append(f"{requirements['raw_analysis']}\n\n")
         
         else:
-            content += f"\n{requirements}\n\n"
+            parts.append(f"\n{requirements}\n\n")
         
         # Add appendix
-        content += """---
-
-## Appendix
-
-### Document Information
-
-- **Generated By:** Meeting Analyzer Tool
-- **Source:** Automated analysis of meeting video and audio
-- **Analysis Method:** AI-powered transcription and visual content analysis
-
-### Notes
-
-This document was automatically generated and should be reviewed and refined by the project team.
-"""
+        parts.append(_MD_APPENDIX)
+        content = "".join(parts)
         
         # Save to file
-        output_path = os.path.join(self.output_dir, f"SRS_{project_name.replace(' ', '_')}.md")
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        write_bytes_atomically(output_path, content.encode('utf-8'))
         
+        self._cache[output_path] = digest
         print(f"SRS document (Markdown) generated: {output_path}")
         return output_path
     
@@ -181,6 +261,22 @@ This document was automatically generated and should be reviewed and refined by
         Returns:
             Path to generated DOCX file
         """
+        output_path = os.path.join(self.output_dir, f"SRS_{project_name.replace(' ', '_')}.docx")
+        digest, up_to_date = self._check_cache(output_path, requirements, project_name)
+        # Building the document takes long enough to also skip it across runs,
+        # so the digest is kept on disk as well
+        digest_path = output_path + _DIGEST_SUFFIX
+        if not up_to_date and os.path.exists(output_path):
+            try:
+                with open(digest_path, 'r', encoding='utf-8') as f:
+                    up_to_date = f.read() == digest
+            except OSError:
+                pass
+        if up_to_date:
+            self._cache[output_path] = digest
+            print(f"SRS document (DOCX) unchanged: {output_path}")
+            return output_path
+        
         try:
             from docx import Document
             from docx.shared import Inches, Pt, RGBColor
@@ -200,17 +296,7 @@ This document was automatically generated and should be reviewed and refined by
             doc.add_page_break()
             
             # Add content sections
-            sections = [
-                ("Introduction", "introduction"),
-                ("Project Overview", "project_overview"),
-                ("Functional Requirements", "functional_requirements"),
-                ("Non-Functional Requirements", "non_functional_requirements"),
-                ("Technical Requirements", "technical_requirements"),
-                ("UI/UX Requirements", "ui_ux_requirements"),
-                ("Issues and Concerns", "issues_and_concerns")
-            ]
-            
-            for section_title, section_key in sections:
+            for section_title, section_key, fallback in _DOCX_SECTIONS:
                 doc.add_heading(section_title, 1)
                 
                 if isinstance(requirements, dict) and section_key in requirements:
@@ -225,13 +311,17 @@ This document was automatically generated and should be reviewed and refined by
                     else:
                         doc.add_paragraph(str(data))
                 else:
-                    doc.add_paragraph(f"{section_title} will be extracted from meeting analysis.")
+                    doc.add_paragraph(fallback)
                 
                 doc.add_paragraph()
             
-            # Save document
-            output_path = os.path.join(self.output_dir, f"SRS_{project_name.replace(' ', '_')}.docx")
-            doc.save(output_path)
+            # Save document; the old digest goes first so that it never
+            # vouches for a document written from other inputs
+            if os.path.exists(digest_path):
+                os.remove(digest_path)
+            write_atomically(output_path, doc.save)
+            write_bytes_atomically(digest_path, digest.encode('utf-8'))
+            self._cache[output_path] = digest
             
             print(f"SRS document (DOCX) generated: {output_path}")
             return output_path
@@ -253,9 +343,14 @@ This document was automatically generated and should be reviewed and refined by
             Path to JSON file
         """
         output_path = os.path.join(self.output_dir, f"requirements_{project_name.replace(' ', '_')}.json")
+        digest, up_to_date = self._check_cache(output_path, requirements, project_name)
+        if up_to_date:
+            print(f"Requirements JSON unchanged: {output_path}")
+            return output_path
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(requirements, f, indent=2, ensure_ascii=False)
+        # Indented: this file is meant to be read and edited by people
+        write_atomically(output_path, lambda tmp_path: json_utils.dump(requirements, tmp_path, indent=True))
+        self._cache[output_path] = digest
         
         print(f"Requirements JSON saved: {output_path}")
         return output_path
@@ -2,12 +2,253 @@
 Video processor module for extracting frames and screenshots from video files
 """
 
-import cv2
 import os
-from typing import List, Tuple
+import json
+import shutil
+import subprocess
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
 from pathlib import Path
 import numpy as np
-from PIL import Image
+from .audio_processor import _FFMPEG_QUIET_FLAGS
+
+# cv2 is imported where it is used: it takes most of a second to load, and
+# the package is imported by runs that never decode video (e.g. --help)
+if TYPE_CHECKING:
+    import cv2
+
+
+_scene_score_impl = None
+
+# Targets closer than this to the last decoded frame are reached by decoding
+# forward; farther ones by seeking to the preceding keyframe
+_SEEK_MIN_GAP_SECONDS = 2.0
+
+# Frames are compared for scene changes at this size: scene changes survive
+# the downscale, and sensor noise mostly averages out
+_SCENE_THUMB_SIZE = (160, 90)
+
+# Key frame detection splits the video into windows scanned in parallel;
+# shorter windows are not worth their extra seek and decoder
+_MIN_SCAN_WINDOW_FRAMES = 1800
+
+# Frames waiting to be encoded before extraction blocks on the oldest one
+_MAX_PENDING_WRITES = 8
+
+
+def _open_video_capture(video_path: str) -> "cv2.VideoCapture":
+    """
+    Open a video with OpenCV, using hardware decoding when available
+    
+    Args:
+        video_path: Path to the video file
+        
+    Returns:
+        Opened capture; the caller releases it
+    """
+    import cv2
+    
+    # Let the FFmpeg backend decode on the GPU (NVDEC, VAAPI, D3D11,
+    # VideoToolbox, ...) where one is available; it decodes in software otherwise
+    if hasattr(cv2, "VIDEO_ACCELERATION_ANY"):
+        hw_decode_params = [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+        cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG, hw_decode_params)
+        if cap.isOpened():
+            return cap
+        cap.release()
+    
+    # Other backends, or OpenCV builds without the FFmpeg backend
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise ValueError(f"Unable to open video file: {video_path}")
+    return cap
+
+
+def _cv2_mean_abs_diff(gray: np.ndarray, prev_gray: np.ndarray) -> float:
+    """Mean absolute difference between two grayscale frames (fallback without numba)"""
+    import cv2
+    diff = cv2.absdiff(gray, prev_gray)
+    # sumElems() skips the mask handling of cv2.mean(); one divide at the end
+    return cv2.sumElems(diff)[0] / diff.size
+
+
+def _scene_thumbnail(image: np.ndarray, out: Optional[np.ndarray] = None,
+                     gray: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Downscale a frame to the grayscale thumbnail used for scene scoring
+    
+    Args:
+        image: Frame in BGR or grayscale
+        out: Optional buffer of the thumbnail's shape to write the result to
+        gray: Optional buffer of the frame's height and width for the
+              full-size grayscale conversion
+        
+    Returns:
+        Grayscale image of _SCENE_THUMB_SIZE (out, when given)
+    """
+    import cv2
+    # Converting first is cheaper: INTER_AREA then averages one channel, not three
+    if image.ndim != 2:
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=gray)
+    return cv2.resize(image, _SCENE_THUMB_SIZE, dst=out, interpolation=cv2.INTER_AREA)
+
+
+def _scene_score(gray: np.ndarray, prev_gray: np.ndarray) -> float:
+    """
+    Scene-change score between two scene thumbnails (mean absolute difference)
+    
+    Uses a compiled numba kernel when numba is installed, OpenCV otherwise.
+    The numba import is deferred to the first call so it is only paid when
+    key frames are actually extracted.
+    
+    Args:
+        gray: Current frame's thumbnail from _scene_thumbnail()
+        prev_gray: Previous frame's thumbnail
+        
+    Returns:
+        Mean absolute per-pixel difference
+    """
+    global _scene_score_impl
+    if _scene_score_impl is None:
+        try:
+            from .numba_kernels import mean_abs_diff
+            _scene_score_impl = mean_abs_diff
+        except ImportError:
+            _scene_score_impl = _cv2_mean_abs_diff
+    return float(_scene_score_impl(gray, prev_gray))
+
+
+def _write_jpeg(frame: np.ndarray, path: str):
+    """Encode a frame as JPEG and write it in one call"""
+    import cv2
+    ok, encoded = cv2.imencode(".jpg", frame)
+    if not ok:
+        raise ValueError(f"Could not encode frame {path}")
+    with open(path, "wb") as f:
+        f.write(encoded)
+
+
+def _scan_scene_changes(video_path: str, start_frame: int, end_frame: Optional[int],
+                        threshold: float, max_frames: int) -> List[Tuple[int, float, np.ndarray]]:
+    """
+    Find scene changes in one window of a video (runs on a worker thread)
+    
+    Each call opens its own capture; OpenCV releases the GIL while decoding,
+    so windows are decoded in parallel.
+    
+    Args:
+        video_path: Path to the video file
+        start_frame: First frame index of the window
+        end_frame: Frame index after the window, or None to scan to the end
+        threshold: Threshold for detecting scene changes
+        max_frames: Stop after this many scene changes
+        
+    Returns:
+        (frame index, score, JPEG-encoded frame) for each scene change, in order
+    """
+    import cv2
+    
+    cap = _open_video_capture(video_path)
+    
+    hits = []
+    try:
+        # The frame before the window is the reference for its first frame
+        frame_index = max(0, start_frame - 1)
+        if frame_index:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+        # Decode, convert and downscale into the same buffers for every frame
+        # instead of allocating three images per frame
+        frame = None
+        full_gray = None
+        gray = np.empty(_SCENE_THUMB_SIZE[::-1], np.uint8)
+        prev_gray = np.empty_like(gray)
+        have_prev = False
+        
+        while len(hits) < max_frames and (end_frame is None or frame_index < end_frame):
+            ret, frame = cap.read(frame)
+            if not ret:
+                break
+            if full_gray is None:
+                full_gray = np.empty(frame.shape[:2], np.uint8)
+            
+            _scene_thumbnail(frame, out=gray, gray=full_gray)
+            if have_prev:
+                diff_score = _scene_score(gray, prev_gray)
+                if diff_score > threshold:
+                    ok, encoded = cv2.imencode(".jpg", frame)
+                    if ok:
+                        hits.append((frame_index, diff_score, encoded))
+            
+            # The old reference becomes the next frame's output buffer
+            gray, prev_gray = prev_gray, gray
+            have_prev = True
+            frame_index += 1
+    finally:
+        cap.release()
+    return hits
+
+
+class _JpegWriter:
+    """
+    Saves frames as JPEG on background threads
+    
+    OpenCV releases the GIL while encoding, so decoding the next frame
+    overlaps with encoding and writing the previous ones. At most
+    _MAX_PENDING_WRITES frames are held in memory at a time.
+    
+    Saved frames are handed back in queue order by written() and flush().
+    """
+    
+    def __init__(self):
+        self._pool = ThreadPoolExecutor(max_workers=2)
+        # (timestamp, path, future) of frames not yet handed back
+        self._pending = deque()
+    
+    def write(self, frame: np.ndarray, path: str, timestamp: float):
+        """Queue a frame to be saved; the caller must not modify it afterwards"""
+        self._pending.append((timestamp, path, self._pool.submit(_write_jpeg, frame, path)))
+        if len(self._pending) > _MAX_PENDING_WRITES:
+            self._pending[0][2].result()
+    
+    def written(self) -> Iterator[Tuple[float, str]]:
+        """
+        Hand back the frames saved so far, stopping at the first one still queued
+        
+        Yields:
+            (timestamp, path) of each saved frame, in queue order
+        """
+        while self._pending and self._pending[0][2].done():
+            timestamp, path, future = self._pending.popleft()
+            future.result()
+            yield timestamp, path
+    
+    def flush(self) -> Iterator[Tuple[float, str]]:
+        """
+        Wait for the queued frames and hand them back
+        
+        Yields:
+            (timestamp, path) of each saved frame, in queue order
+        """
+        while self._pending:
+            timestamp, path, future = self._pending.popleft()
+            future.result()
+            yield timestamp, path
+    
+    def close(self):
+        """Wait for all queued frames to be written, raising the first write error"""
+        try:
+            while self._pending:
+                self._pending.popleft()[2].result()
+        finally:
+            self._pool.shutdown()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
 
 class VideoProcessor:
@@ -23,58 +264,375 @@ class VideoProcessor:
         """
         self.video_path = video_path
         self.output_dir = output_dir
-        self.frames = []
+        # Paths of the frames saved by the last extraction; the images stay on
+        # disk rather than in memory (see iter_saved_frames())
+        self.saved_frames: List[str] = []
+        # Filled in by the first _open_capture(); the properties cannot change
+        self._metadata: Optional[dict] = None
         
         os.makedirs(output_dir, exist_ok=True)
     
+    def _open_capture(self) -> "cv2.VideoCapture":
+        """
+        Open the video with OpenCV, recording its metadata on first use
+        
+        Returns:
+            Opened capture; the caller releases it
+        """
+        import cv2
+        
+        cap = _open_video_capture(self.video_path)
+        
+        if self._metadata is None:
+            fps = cap.get(cv2.CAP_PROP_FPS)
+            frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            self._metadata = {
+                "fps": fps,
+                "frame_count": frame_count,
+                "width": int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                "height": int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+                # Handle zero FPS
+                "duration_seconds": frame_count / fps if fps > 0 else 0,
+            }
+        return cap
+    
+    def iter_saved_frames(self) -> Iterator[np.ndarray]:
+        """
+        Load the frames saved by the last extraction, one at a time
+        
+        Yields:
+            Each frame as a BGR image, in extraction order
+        """
+        import cv2
+        
+        for frame_path in self.saved_frames:
+            yield cv2.imread(frame_path)
+    
+    def _iter_frames_pyav(self, interval_seconds: int) -> Optional[Iterator[Tuple[float, str]]]:
+        """
+        Extract frames at intervals by seeking to keyframes with PyAV
+        
+        Only frames near each target timestamp are decoded, instead of every
+        frame in the video.
+        
+        Args:
+            interval_seconds: Time interval between frame extractions
+            
+        Returns:
+            Iterator over (timestamp, path) of the extracted frames, or None if
+            PyAV is not installed or the video is not constant frame rate
+        """
+        try:
+            import av
+        except ImportError:
+            return None
+        
+        try:
+            container = av.open(self.video_path)
+        except Exception:
+            return None
+        
+        stream = container.streams.video[0] if container.streams.video else None
+        # Timestamp seeking is only exact for constant frame rate video
+        if (stream is None or not stream.average_rate or stream.average_rate != stream.guessed_rate
+                or container.duration is None or stream.time_base is None):
+            container.close()
+            return None
+        
+        fps = float(stream.average_rate)
+        total_frames = int(container.duration / av.time_base * fps)
+        return self._seek_frames_pyav(container, stream, fps, total_frames, interval_seconds)
+    
+    def _seek_frames_pyav(self, container, stream, fps: float, total_frames: int,
+                          interval_seconds: int) -> Iterator[Tuple[float, str]]:
+        """Generator behind _iter_frames_pyav(); closes the container when done"""
+        frame_interval = max(1, int(fps * interval_seconds))
+        
+        # Leaving the block waits for the queued frames to be written
+        with container, _JpegWriter() as writer:
+            print(f"Extracting frames from video (FPS: {fps}, Interval: {interval_seconds}s, keyframe seek)...")
+            
+            decoder = None
+            last_time = None
+            for frame_index in range(0, total_frames, frame_interval):
+                target = frame_index / fps
+                if decoder is None or last_time is None or target - last_time > _SEEK_MIN_GAP_SECONDS:
+                    container.seek(int(target / stream.time_base), stream=stream,
+                                   any_frame=False, backward=True)
+                    decoder = container.decode(stream)
+                
+                for frame in decoder:
+                    if frame.time is None:
+                        continue
+                    last_time = frame.time
+                    if frame.time >= target - 0.5 / fps:
+                        image = frame.to_ndarray(format="bgr24")
+                        frame_path = os.path.join(
+                            self.output_dir,
+                            f"frame_{frame_index:06d}.jpg"
+                        )
+                        writer.write(image, frame_path, target)
+                        print(f"  Extracted frame at {target:.2f}s")
+                        break
+                else:
+                    break  # End of stream
+                
+                yield from writer.written()
+            
+            yield from writer.flush()
+    
+    def _iter_frames_opencv(self, interval_seconds: int) -> Iterator[Tuple[float, str]]:
+        """
+        Extract frames at intervals with OpenCV
+        
+        Frames that are far apart are reached by seeking; otherwise the frames
+        in between are grabbed (decoded without converting).
+        
+        Args:
+            interval_seconds: Time interval between frame extractions
+            
+        Yields:
+            (timestamp, path) of each extracted frame
+        """
+        import cv2
+        
+        cap = self._open_capture()
+        try:
+            fps = self._metadata["fps"]
+            frame_interval = max(1, int(fps * interval_seconds))
+            seek = interval_seconds >= _SEEK_MIN_GAP_SECONDS
+            frame_count = 0
+            
+            print(f"Extracting frames from video (FPS: {fps}, Interval: {interval_seconds}s)...")
+            
+            with _JpegWriter() as writer:
+                while True:
+                    ret, frame = cap.read()
+                    
+                    if not ret:
+                        break
+                    
+                    frame_path = os.path.join(
+                        self.output_dir, 
+                        f"frame_{frame_count:06d}.jpg"
+                    )
+                    writer.write(frame, frame_path, frame_count / fps)
+                    print(f"  Extracted frame at {frame_count/fps:.2f}s")
+                    yield from writer.written()
+                    
+                    frame_count += frame_interval
+                    if seek:
+                        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_count)
+                    # grab() decodes without the color conversion and copy of read()
+                    elif not all(cap.grab() for _ in range(frame_interval - 1)):
+                        break
+                
+                yield from writer.flush()
+        finally:
+            cap.release()
+    
+    def iter_frames(self, interval_seconds: int = 5) -> Iterator[Tuple[float, str]]:
+        """
+        Extract frames from video at specified intervals, handing each one
+        over as soon as it is saved
+        
+        Consumers can start on the first frames while later ones are still
+        being decoded. Uses keyframe seeking via PyAV when it is installed and
+        the video has a constant frame rate, OpenCV otherwise.
+        
+        Args:
+            interval_seconds: Time interval between frame extractions
+            
+        Yields:
+            (timestamp in seconds, path to the frame image), in order
+        """
+        frames = self._iter_frames_pyav(interval_seconds)
+        if frames is None:
+            frames = self._iter_frames_opencv(interval_seconds)
+        
+        self.saved_frames = []
+        for timestamp, frame_path in frames:
+            self.saved_frames.append(frame_path)
+            yield timestamp, frame_path
+        print(f"Total frames extracted: {len(self.saved_frames)}")
+    
     def extract_frames(self, interval_seconds: int = 5) -> List[str]:
         """
         Extract frames from video at specified intervals
         
+        Collects iter_frames().
+        
         Args:
             interval_seconds: Time interval between frame extractions
             
         Returns:
             List of paths to extracted frame images
         """
-        cap = cv2.VideoCapture(self.video_path)
+        return [frame_path for _, frame_path in self.iter_frames(interval_seconds)]
+    
+    def extract_frames_batch(self, timestamps: List[float],
+                             size: Optional[Tuple[int, int]] = None) -> Optional[List[str]]:
+        """
+        Extract the frames at the given timestamps with a single ffmpeg run
         
-        if not cap.isOpened():
-            raise ValueError(f"Unable to open video file: {self.video_path}")
+        One select filter picks the first frame at or after each timestamp,
+        so the container is opened and parsed once instead of once per frame.
+        Input seeking (-ss) skips straight to the keyframe before the first
+        timestamp.
         
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        frame_interval = int(fps * interval_seconds)
-        frame_count = 0
-        saved_frames = []
+        Args:
+            timestamps: Times in seconds, ascending
+            size: Optional (width, height) to scale frames to
+            
+        Returns:
+            List of paths to extracted frame images, or None if ffmpeg is
+            unavailable or fails
+        """
+        if not timestamps:
+            return []
+        
+        start = timestamps[0]
+        # With input seeking, frame timestamps restart at zero at the seek point
+        terms = []
+        for timestamp in timestamps:
+            offset = timestamp - start
+            if offset <= 0:
+                terms.append("eq(n\\,0)")
+            else:
+                terms.append(f"gte(t\\,{offset:.3f})*lt(prev_pts*TB\\,{offset:.3f})")
+        video_filter = "select='" + "+".join(terms) + "'"
+        if size:
+            video_filter += f",scale={size[0]}:{size[1]}"
+        
+        pattern = os.path.join(self.output_dir, "frame_batch_%04d.jpg")
+        saved_frames = [pattern % i for i in range(len(timestamps))]
+        for frame_path in saved_frames:
+            if os.path.exists(frame_path):
+                os.remove(frame_path)
+        
+        cmd = [
+            "ffmpeg", *_FFMPEG_QUIET_FLAGS, "-y", "-ss", f"{start:.3f}", "-i", self.video_path,
+            "-vf", video_filter, "-vsync", "vfr",
+            "-frames:v", str(len(timestamps)), "-q:v", "2",
+            "-start_number", "0", pattern
+        ]
+        
+        print(f"Extracting {len(timestamps)} frames from video with ffmpeg...")
+        try:
+            subprocess.run(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                           stderr=subprocess.PIPE, check=True)
+        except FileNotFoundError:
+            return None
+        except subprocess.CalledProcessError as e:
+            print(f"  ffmpeg frame extraction failed: {e.stderr.decode('utf-8', errors='replace')[-500:]}")
+            return None
+        
+        # Timestamps past the end of the video produce no frame
+        saved_frames = [frame_path for frame_path in saved_frames if os.path.exists(frame_path)]
+        for frame_path, timestamp in zip(saved_frames, timestamps):
+            print(f"  Extracted frame at {timestamp:.2f}s")
+        print(f"Total frames extracted: {len(saved_frames)}")
+        self.saved_frames = saved_frames
+        return saved_frames
+    
+    def _is_constant_frame_rate(self) -> Optional[bool]:
+        """
+        Check with ffprobe whether the video stream has a constant frame rate
         
-        print(f"Extracting frames from video (FPS: {fps}, Interval: {interval_seconds}s)...")
+        Returns:
+            True for CFR, False for VFR, None if ffprobe is unavailable or fails
+        """
+        cmd = [
+            "ffprobe", "-v", "error", "-select_streams", "v:0",
+            "-show_entries", "stream=r_frame_rate,avg_frame_rate",
+            "-of", "json", self.video_path
+        ]
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            streams = json.loads(result.stdout).get("streams", [])
+        except (FileNotFoundError, subprocess.CalledProcessError, ValueError):
+            return None
+        if not streams:
+            return None
+        rates = streams[0]
+        return rates.get("r_frame_rate") == rates.get("avg_frame_rate") != "0/0"
+    
+    def _extract_key_frames_nokey(self, threshold: float, max_frames: int) -> Optional[List[str]]:
+        """
+        Detect scene changes among the video's keyframes (I-frames) only
+        
+        ffmpeg is told to skip decoding every non-keyframe, which cuts
+        decode work by roughly the GOP size.
         
-        while True:
-            ret, frame = cap.read()
+        Args:
+            threshold: Threshold for detecting scene changes
+            max_frames: Maximum number of frames to extract
             
-            if not ret:
-                break
+        Returns:
+            List of paths to key frame images, or None if ffmpeg is unavailable
+            or the video is not constant frame rate
+        """
+        if not self._is_constant_frame_rate():
+            return None
+        
+        import cv2
+        
+        keyframe_dir = tempfile.mkdtemp(prefix="keyframes_", dir=self.output_dir)
+        try:
+            cmd = [
+                "ffmpeg", *_FFMPEG_QUIET_FLAGS, "-skip_frame", "nokey", "-i", self.video_path,
+                "-vsync", "vfr", "-frame_pts", "true", "-q:v", "2",
+                os.path.join(keyframe_dir, "kf_%010d.jpg")
+            ]
+            try:
+                subprocess.run(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                               stderr=subprocess.DEVNULL, check=True)
+            except (FileNotFoundError, subprocess.CalledProcessError):
+                return None
             
-            if frame_count % frame_interval == 0:
-                frame_path = os.path.join(
-                    self.output_dir, 
-                    f"frame_{frame_count:06d}.jpg"
-                )
-                cv2.imwrite(frame_path, frame)
-                saved_frames.append(frame_path)
-                self.frames.append(frame)
-                print(f"  Extracted frame at {frame_count/fps:.2f}s")
+            prev_gray = None
+            saved_frames = []
+            print(f"Extracting key frames based on scene changes (keyframes only)...")
             
-            frame_count += 1
+            with os.scandir(keyframe_dir) as it:
+                keyframe_paths = sorted(entry.path for entry in it)
+            for keyframe_path in keyframe_paths:
+                if len(saved_frames) >= max_frames:
+                    break
+                # The JPEG decoder scales by 1/8 itself, so full size is never decoded
+                reduced = cv2.imread(keyframe_path, cv2.IMREAD_REDUCED_GRAYSCALE_8)
+                if reduced is None:
+                    continue
+                gray = _scene_thumbnail(reduced)
+                
+                if prev_gray is not None:
+                    diff_score = _scene_score(gray, prev_gray)
+                    
+                    if diff_score > threshold:
+                        frame_path = os.path.join(
+                            self.output_dir,
+                            f"keyframe_{len(saved_frames):04d}.jpg"
+                        )
+                        # Already a JPEG; move it instead of re-encoding
+                        os.replace(keyframe_path, frame_path)
+                        saved_frames.append(frame_path)
+                        print(f"  Key frame {Path(keyframe_path).stem} (diff: {diff_score:.2f})")
+                
+                prev_gray = gray
+        finally:
+            shutil.rmtree(keyframe_dir, ignore_errors=True)
         
-        cap.release()
-        print(f"Total frames extracted: {len(saved_frames)}")
+        print(f"Total key frames extracted: {len(saved_frames)}")
         return saved_frames
     
     def extract_key_frames(self, threshold: float = 30.0, max_frames: int = 20) -> List[str]:
         """
         Extract key frames based on scene changes
         
+        For constant frame rate video, only the encoded keyframes are decoded
+        and compared (requires ffmpeg/ffprobe); otherwise every frame is
+        decoded with OpenCV, see extract_key_frames_parallel().
+        
         Args:
             threshold: Threshold for detecting scene changes
             max_frames: Maximum number of frames to extract
@@ -82,74 +640,114 @@ class VideoProcessor:
         Returns:
             List of paths to key frame images
         """
-        cap = cv2.VideoCapture(self.video_path)
-        
-        if not cap.isOpened():
-            raise ValueError(f"Unable to open video file: {self.video_path}")
+        saved_frames = self._extract_key_frames_nokey(threshold, max_frames)
+        if saved_frames is not None:
+            self.saved_frames = saved_frames
+            return saved_frames
         
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        prev_frame = None
-        frame_count = 0
-        saved_frames = []
+        return self.extract_key_frames_parallel(threshold, max_frames)
+    
+    def extract_key_frames_parallel(self, threshold: float = 30.0, max_frames: int = 20,
+                                    workers: Optional[int] = None) -> List[str]:
+        """
+        Extract key frames based on scene changes, decoding every frame with OpenCV
         
-        print(f"Extracting key frames based on scene changes...")
+        The video is split into up to `workers` windows of consecutive frames
+        that are scanned at the same time. The result is the same as one
+        sequential scan: the first max_frames scene changes in time order.
+        Window boundaries are only frame-exact for constant frame rate video.
         
-        while len(saved_frames) < max_frames:
-            ret, frame = cap.read()
-            
-            if not ret:
-                break
-            
-            if prev_frame is not None:
-                # Calculate frame difference
-                diff = cv2.absdiff(
-                    cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY),
-                    cv2.cvtColor(prev_frame, cv2.COLOR_BGR2GRAY)
-                )
-                diff_score = np.mean(diff)
-                
-                if diff_score > threshold:
-                    frame_path = os.path.join(
-                        self.output_dir,
-                        f"keyframe_{len(saved_frames):04d}.jpg"
-                    )
-                    cv2.imwrite(frame_path, frame)
-                    saved_frames.append(frame_path)
-                    print(f"  Key frame at {frame_count/fps:.2f}s (diff: {diff_score:.2f})")
+        Args:
+            threshold: Threshold for detecting scene changes
+            max_frames: Maximum number of frames to extract
+            workers: Maximum number of windows scanned at once (default: CPU count)
             
-            prev_frame = frame
-            frame_count += 1
+        Returns:
+            List of paths to key frame images
+        """
+        metadata = self.get_video_metadata()
+        fps = metadata["fps"] or 1.0
+        total_frames = metadata["frame_count"]
+        
+        windows = max(1, min(workers or os.cpu_count() or 1, total_frames // _MIN_SCAN_WINDOW_FRAMES))
+        # The frame count is only an estimate for some containers, so the
+        # last window runs to the end of the stream
+        bounds = [total_frames * i // windows for i in range(windows)] + [None]
+        
+        print(f"Extracting key frames based on scene changes ({windows} window(s))...")
+        
+        with ThreadPoolExecutor(max_workers=windows) as pool:
+            futures = [
+                pool.submit(_scan_scene_changes, self.video_path, bounds[i], bounds[i + 1],
+                            threshold, max_frames)
+                for i in range(windows)
+            ]
+            # Windows are in time order, so the first hits overall come first
+            hits = [hit for future in futures for hit in future.result()][:max_frames]
+        
+        saved_frames = []
+        for frame_index, diff_score, encoded in hits:
+            frame_path = os.path.join(
+                self.output_dir,
+                f"keyframe_{len(saved_frames):04d}.jpg"
+            )
+            with open(frame_path, "wb") as f:
+                f.write(encoded)
+            saved_frames.append(frame_path)
+            print(f"  Key frame at {frame_index/fps:.2f}s (diff: {diff_score:.2f})")
         
-        cap.release()
         print(f"Total key frames extracted: {len(saved_frames)}")
+        self.saved_frames = saved_frames
         return saved_frames
     
     def get_video_metadata(self) -> dict:
         """
         Get video metadata
         
+        The video is only opened if no extraction has opened it yet.
+        
         Returns:
             Dictionary with video metadata
         """
-        cap = cv2.VideoCapture(self.video_path)
-        
-        if not cap.isOpened():
-            raise ValueError(f"Unable to open video file: {self.video_path}")
+        if self._metadata is None:
+            self._metadata = self._probe_metadata_pyav()
+        if self._metadata is None:
+            self._open_capture().release()
+        return dict(self._metadata)
+    
+    def _probe_metadata_pyav(self) -> Optional[dict]:
+        """
+        Read the video metadata from the container headers with PyAV
         
-        metadata = {
-            "fps": cap.get(cv2.CAP_PROP_FPS),
-            "frame_count": int(cap.get(cv2.CAP_PROP_FRAME_COUNT)),
-            "width": int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
-            "height": int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
-        }
+        Unlike a VideoCapture, this sets up no decoder, hardware or otherwise.
         
-        # Calculate duration, handling zero FPS case
-        fps = metadata["fps"]
-        frame_count = metadata["frame_count"]
-        if fps > 0:
-            metadata["duration_seconds"] = frame_count / fps
-        else:
-            metadata["duration_seconds"] = 0
+        Returns:
+            Dictionary with video metadata, or None if PyAV is not installed
+            or cannot read the file
+        """
+        try:
+            import av
+        except ImportError:
+            return None
         
-        cap.release()
-        return metadata
+        try:
+            with av.open(self.video_path) as container:
+                if not container.streams.video:
+                    return None
+                stream = container.streams.video[0]
+                rate = stream.average_rate or stream.guessed_rate
+                fps = float(rate) if rate else 0.0
+                frame_count = stream.frames
+                # Some containers (e.g. Matroska) do not store a frame count
+                if not frame_count and fps > 0 and container.duration is not None:
+                    frame_count = int(round(container.duration / av.time_base * fps))
+                return {
+                    "fps": fps,
+                    "frame_count": frame_count,
+                    "width": stream.width,
+                    "height": stream.height,
+                    # Same definition as the OpenCV path
+                    "duration_seconds": frame_count / fps if fps > 0 else 0,
+                }
+        except Exception:
+            return None
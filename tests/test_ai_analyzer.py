@@ -0,0 +1,199 @@
+"""
+Tests for the AI analyzer, against a stubbed OpenAI client
+"""
+
+import unittest
+import os
+import sys
+import io
+import re
+import base64
+import shutil
+import asyncio
+import tempfile
+from types import SimpleNamespace
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from meeting_analyzer import ai_analyzer
+from meeting_analyzer.ai_analyzer import AIAnalyzer, TRANSCRIPT_SUMMARY_PROMPT
+
+
+def _response(content):
+    """Build a chat completion response carrying content"""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class _BadRequestError(Exception):
+    """Stands in for openai.BadRequestError"""
+
+
+class _StubClient:
+    """Synchronous client; replies come from a function of the request"""
+    
+    def __init__(self, reply):
+        self.requests = []
+        self._reply = reply
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+    
+    def _create(self, **request):
+        self.requests.append(request)
+        return _response(self._reply(request))
+
+
+class _StubAsyncClient:
+    """Async client for frame requests; answers with the frame's file content"""
+    
+    def __init__(self, delays):
+        self.requests = 0
+        self._delays = delays
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+    
+    async def _create(self, **request):
+        self.requests += 1
+        url = request["messages"][1]["content"][1]["image_url"]["url"]
+        content = base64.b64decode(url.partition(",")[2]).decode('ascii')
+        # Later frames answer sooner, so completions arrive out of order
+        await asyncio.sleep(self._delays.get(content, 0))
+        return _response(f"analysis of {content}")
+    
+    async def close(self):
+        pass
+
+
+class AIAnalyzerTestCase(unittest.TestCase):
+    """Builds analyzers whose clients are stubs"""
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        openai = SimpleNamespace(BadRequestError=_BadRequestError)
+        for patcher in (mock.patch.object(ai_analyzer, "_get_client"),
+                        mock.patch.object(ai_analyzer, "_import_openai", return_value=openai),
+                        mock.patch("sys.stdout", new_callable=io.StringIO)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+    
+    def make_analyzer(self, **kwargs):
+        """Create an analyzer; frames are sent as they are, without resizing"""
+        kwargs.setdefault("max_image_side", None)
+        return AIAnalyzer(**kwargs)
+    
+    def make_frames(self, count):
+        """Write count fake frame files, returning their paths"""
+        paths = []
+        for i in range(count):
+            path = os.path.join(self.tmp_dir, f"frame_{i}.jpg")
+            with open(path, 'wb') as f:
+                f.write(f"frame {i}".encode('ascii'))
+            paths.append(path)
+        return paths
+    
+    def analyze(self, analyzer, frame_paths, aclient):
+        """Analyze frames with aclient answering the vision requests"""
+        with mock.patch.object(AIAnalyzer, "_get_aclient", return_value=aclient):
+            return analyzer.analyze_frames(frame_paths)
+
+
+class TestAnalyzeFrames(AIAnalyzerTestCase):
+    """Test concurrent frame analysis and the frame cache"""
+    
+    def test_results_in_input_order(self):
+        """Test that results follow the input order, not completion order"""
+        frames = self.make_frames(6)
+        aclient = _StubAsyncClient({f"frame {i}": (6 - i) * 0.01 for i in range(6)})
+        results = self.analyze(self.make_analyzer(max_concurrency=6), frames, aclient)
+        
+        self.assertEqual([r["frame"] for r in results], frames)
+        self.assertEqual([r["analysis"] for r in results],
+                         [f"analysis of frame {i}" for i in range(6)])
+    
+    def test_frame_cache_hit_and_miss(self):
+        """Test that cached frames are not sent again, unless the model changes"""
+        frames = self.make_frames(3)
+        cache_dir = os.path.join(self.tmp_dir, "cache")
+        
+        first = _StubAsyncClient({})
+        results = self.analyze(self.make_analyzer(cache_dir=cache_dir), frames, first)
+        self.assertEqual(first.requests, 3)
+        
+        cached = _StubAsyncClient({})
+        self.assertEqual(self.analyze(self.make_analyzer(cache_dir=cache_dir), frames, cached), results)
+        self.assertEqual(cached.requests, 0)
+        
+        other_model = _StubAsyncClient({})
+        self.analyze(self.make_analyzer(cache_dir=cache_dir, vision_model="other"), frames, other_model)
+        self.assertEqual(other_model.requests, 3)
+        self.assertFalse([name for name in os.listdir(cache_dir) if name.endswith(".tmp")])
+
+
+class TestGenerateRequirements(AIAnalyzerTestCase):
+    """Test the requirements prompt and request"""
+    
+    def test_failed_frames_are_skipped(self):
+        """Test that frames without an analysis are left out of the prompt"""
+        analyzer = self.make_analyzer()
+        analyzer.client = _StubClient(lambda request: '{"project_overview": "ok"}')
+        frame_analyses = [
+            {"frame": "a.jpg", "analysis": "whiteboard"},
+            {"frame": "b.jpg", "analysis": None, "error": "timeout"},
+            {"frame": "c.jpg", "analysis": "slides"},
+        ]
+        
+        requirements = analyzer.generate_requirements({"text": "hello"}, frame_analyses)
+        
+        self.assertEqual(requirements, {"project_overview": "ok"})
+        prompt = analyzer.client.requests[0]["messages"][1]["content"]
+        self.assertIn("Frame 1: whiteboard", prompt)
+        self.assertIn("Frame 3: slides", prompt)
+        self.assertNotIn("Frame 2", prompt)
+        self.assertNotIn("None", prompt)
+    
+    def test_retries_without_response_format(self):
+        """Test that a rejected response_format is dropped, then not sent again"""
+        def reply(request):
+            if "response_format" in request:
+                raise _BadRequestError("json_schema not supported")
+            return '{"project_overview": "ok"}'
+        analyzer = self.make_analyzer()
+        analyzer.client = _StubClient(reply)
+        
+        self.assertEqual(analyzer.generate_requirements({"text": "hello"}, []),
+                         {"project_overview": "ok"})
+        self.assertFalse(analyzer.structured_output)
+        self.assertEqual(len(analyzer.client.requests), 2)
+        
+        analyzer.generate_requirements({"text": "hello"}, [])
+        self.assertEqual(len(analyzer.client.requests), 3)
+        self.assertNotIn("response_format", analyzer.client.requests[2])
+    
+    def test_long_transcript_is_summarized_in_order(self):
+        """Test that a transcript over budget is replaced by its part summaries, in order"""
+        def reply(request):
+            system, user = (message["content"] for message in request["messages"])
+            if system == TRANSCRIPT_SUMMARY_PROMPT:
+                # A part may begin mid-word; name it by its first whole word
+                first_word = re.search(r"\bw\d+", user).group()
+                return f"summary from {first_word}"
+            return '{}'
+        analyzer = self.make_analyzer(max_input_tokens=1000, summary_chunk_tokens=200,
+                                      max_concurrency=4)
+        analyzer.client = _StubClient(reply)
+        transcript = " ".join(f"w{i}" for i in range(5000))
+        
+        analyzer.generate_requirements({"text": transcript}, [])
+        
+        summaries = [r for r in analyzer.client.requests
+                     if r["messages"][0]["content"] == TRANSCRIPT_SUMMARY_PROMPT]
+        self.assertGreater(len(summaries), 1)
+        prompt = analyzer.client.requests[-1]["messages"][1]["content"]
+        self.assertNotIn(transcript, prompt)
+        starts = [int(n) for n in re.findall(r"summary from w(\d+)", prompt)]
+        self.assertEqual(len(starts), len(summaries))
+        self.assertEqual(starts, sorted(starts))
+
+
+if __name__ == '__main__':
+    unittest.main()
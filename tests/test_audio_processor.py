@@ -0,0 +1,33 @@
+"""
+Tests for the audio processor module
+"""
+
+import unittest
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from meeting_analyzer import audio_processor
+from meeting_analyzer.audio_processor import AudioProcessor
+
+
+class TestAudioProcessor(unittest.TestCase):
+    """Test the AudioProcessor interface"""
+    
+    def test_single_audio_processor_definition(self):
+        """Test that the module defines AudioProcessor exactly once"""
+        with open(audio_processor.__file__, 'r') as f:
+            content = f.read()
+        self.assertEqual(content.count('class AudioProcessor'), 1)
+        self.assertEqual(audio_processor.__all__, ['AudioProcessor'])
+    
+    def test_transcription_methods_exist(self):
+        """Test that both local and OpenAI transcription are available"""
+        self.assertTrue(callable(getattr(AudioProcessor, 'transcribe_audio_local', None)))
+        self.assertTrue(callable(getattr(AudioProcessor, 'transcribe_audio_openai', None)))
+
+
+if __name__ == '__main__':
+    unittest.main()
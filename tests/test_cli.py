@@ -0,0 +1,136 @@
+"""
+Tests for command-line argument parsing
+"""
+
+import unittest
+import os
+import sys
+import io
+import logging
+import contextlib
+from unittest import mock
+
+import dotenv
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from meeting_analyzer import cli
+from meeting_analyzer.cli import _fast_parse, _build_parser, _FAST_OPTIONS, _configure_logging
+
+
+class TestFastParse(unittest.TestCase):
+    """Test that the fast-path parser agrees with argparse"""
+    
+    def assertSameAsArgparse(self, argv):
+        """Check that both parsers produce the same arguments"""
+        fast = _fast_parse(argv)
+        self.assertIsNotNone(fast, argv)
+        self.assertEqual(vars(fast), vars(_build_parser().parse_args(argv)))
+    
+    def test_option_table_matches_parser(self):
+        """Test that the fast-path table lists exactly the argparse options"""
+        options = {
+            option for action in _build_parser()._actions
+            for option in action.option_strings if option not in ('-h', '--help')
+        }
+        self.assertEqual(set(_FAST_OPTIONS), options)
+    
+    def test_defaults(self):
+        """Test that defaults match with only the required option"""
+        self.assertSameAsArgparse(['--video', 'meeting.mp4'])
+    
+    def test_all_value_kinds(self):
+        """Test lists, strings, integers, flags and --option=value"""
+        self.assertSameAsArgparse([
+            '--video', 'a.mp4', 'b.mp4', '--profile', 'laptop', '--interval=5',
+            '--no-key-frames', '--project', 'My Project', '--whisper-beam-size', '5'
+        ])
+    
+    def test_falls_back_to_argparse(self):
+        """Test that help and malformed command lines are left to argparse"""
+        for argv in (
+            ['--help'],
+            ['--video', 'a.mp4', '-h'],
+            ['--video', 'a.mp4', '--unknown'],
+            ['--video', 'a.mp4', '--interval', 'ten'],
+            ['--video', 'a.mp4', '--profile', 'server'],
+            ['--video'],
+            ['--profile', 'pc'],
+        ):
+            self.assertIsNone(_fast_parse(argv), argv)
+
+
+class TestEnv(unittest.TestCase):
+    """Test that .env is only read once a setting is missing"""
+    
+    # Every setting that falls back to the environment
+    ALL_SETTINGS = [
+        "--profile", "custom", "--lm-studio-url", "http://localhost:1234/v1",
+        "--text-model", "phi-3-mini", "--vision-model", "llava-7b-q4",
+        "--whisper-model", "small", "--whisper-compute-type", "int8",
+        "--api-key", "key", "--model", "gpt-4o-mini",
+    ]
+    
+    def setUp(self):
+        cli._load_dotenv.cache_clear()
+        self.addCleanup(cli._load_dotenv.cache_clear)
+        for patcher in (mock.patch("dotenv.load_dotenv"),
+                        mock.patch.object(cli, "_configure_logging")):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+    
+    def run_main(self, options):
+        """Run the CLI up to the video check, returning how often .env was read"""
+        argv = ["meeting-analyzer", "--video", "missing.mp4", *options]
+        with mock.patch.object(sys, "argv", argv), \
+                contextlib.redirect_stdout(io.StringIO()), \
+                self.assertRaises(SystemExit):
+            cli.main()
+        return dotenv.load_dotenv.call_count
+    
+    def test_dotenv_skipped_when_all_settings_given(self):
+        """Test that .env is not read when argv gives every setting"""
+        self.assertEqual(self.run_main(self.ALL_SETTINGS), 0)
+    
+    def test_dotenv_read_for_missing_setting(self):
+        """Test that .env is read once when a single setting is left out"""
+        self.assertEqual(self.run_main(self.ALL_SETTINGS[:-2]), 1)
+    
+    def test_env_reads_dotenv_once(self):
+        """Test that repeated lookups read .env only the first time"""
+        with mock.patch.dict(os.environ, {"WHISPER_MODEL": "medium"}):
+            self.assertEqual(cli._env("WHISPER_MODEL", "small"), "medium")
+            self.assertEqual(cli._env("MEETING_ANALYZER_UNSET", "default"), "default")
+        dotenv.load_dotenv.assert_called_once_with()
+
+
+class TestLogging(unittest.TestCase):
+    """Test that only the package's own progress messages are printed"""
+    
+    def setUp(self):
+        package_logger = logging.getLogger("meeting_analyzer")
+        saved = (list(package_logger.handlers), package_logger.level, package_logger.propagate)
+        
+        def restore():
+            package_logger.handlers[:] = saved[0]
+            package_logger.setLevel(saved[1])
+            package_logger.propagate = saved[2]
+        self.addCleanup(restore)
+    
+    def test_third_party_info_stays_hidden(self):
+        """Test that the root logger is not lowered to INFO"""
+        root_level = logging.getLogger().level
+        _configure_logging()
+        _configure_logging()
+        
+        package_logger = logging.getLogger("meeting_analyzer")
+        self.assertEqual(len(package_logger.handlers), 1)
+        self.assertFalse(package_logger.propagate)
+        self.assertTrue(logging.getLogger("meeting_analyzer.ai_analyzer").isEnabledFor(logging.INFO))
+        self.assertEqual(logging.getLogger().level, root_level)
+        self.assertFalse(logging.getLogger("httpx").isEnabledFor(logging.INFO))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Tests for the analysis server client
+"""
+
+import unittest
+import os
+import sys
+import json
+import shutil
+import socket
+import tempfile
+import threading
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from meeting_analyzer import daemon
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "needs UNIX sockets")
+class TestRequestAnalysis(unittest.TestCase):
+    """Test which servers the client talks to and what it sends"""
+    
+    def setUp(self):
+        # mkdtemp() creates the directory with mode 0700
+        self.runtime_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.runtime_dir)
+        patcher = mock.patch.dict(os.environ, {"XDG_RUNTIME_DIR": self.runtime_dir})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.addCleanup(self.server.close)
+        self.server.bind(daemon.socket_path())
+        self.server.listen()
+        self.server.settimeout(5)
+        self.requests = []
+    
+    def serve_one(self):
+        """Answer one request in the background, recording it"""
+        def run():
+            conn, _ = self.server.accept()
+            with conn:
+                request = json.loads(conn.makefile("rb").readline())
+                self.requests.append(request)
+                results = {video: {} for video in request["video_paths"]}
+                conn.sendall(json.dumps({"results": results}).encode() + b"\n")
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        return thread
+    
+    def test_api_key_is_not_sent(self):
+        """Test that the OpenAI API key stays out of the request"""
+        thread = self.serve_one()
+        results = daemon.request_analysis(
+            ["meeting.mp4"], "output", {"openai_api_key": "secret", "text_model": "m"}, {}
+        )
+        thread.join(5)
+        self.assertEqual(results, {"meeting.mp4": {}})
+        self.assertEqual(self.requests[0]["analyzer_kwargs"], {"text_model": "m"})
+    
+    def test_ignores_socket_in_shared_directory(self):
+        """Test that a socket in a directory other users can access is not used"""
+        os.chmod(self.runtime_dir, 0o755)
+        self.assertIsNone(daemon.request_analysis(["meeting.mp4"], "output", {}, {}))
+    
+    def test_ignores_symlinked_socket(self):
+        """Test that a symlink in place of the socket is not followed"""
+        path = daemon.socket_path()
+        os.rename(path, path + ".real")
+        os.symlink(path + ".real", path)
+        self.assertIsNone(daemon.request_analysis(["meeting.mp4"], "output", {}, {}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,6 +5,8 @@ Tests for GUI functionality
 import unittest
 import os
 import sys
+import tempfile
+from unittest import mock
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -71,6 +73,7 @@ class TestGUIIntegration(unittest.TestCase):
             'analysis_complete',
             'open_file',
             'open_output_folder',
+            'save_log',
         ]
         
         for method_name in required_methods:
@@ -78,6 +81,22 @@ class TestGUIIntegration(unittest.TestCase):
                 hasattr(MeetingAnalyzerGUI, method_name),
                 f"GUI class missing required method: {method_name}"
             )
+    
+    def test_dialog_directories_are_remembered(self):
+        """Test that each file dialog's last directory survives a restart"""
+        from meeting_analyzer import gui
+        
+        with tempfile.TemporaryDirectory() as config_dir, \
+                mock.patch.object(gui, '_config_dir', return_value=config_dir):
+            app = gui.MeetingAnalyzerGUI.__new__(gui.MeetingAnalyzerGUI)
+            app._last_dirs = app._load_dialog_dirs()
+            self.assertEqual(app._last_dirs, {})
+            app._remember_dialog_dir('video', config_dir)
+            
+            restarted = gui.MeetingAnalyzerGUI.__new__(gui.MeetingAnalyzerGUI)
+            restarted._last_dirs = restarted._load_dialog_dirs()
+            self.assertEqual(restarted._initial_dir('video', None), config_dir)
+            self.assertEqual(restarted._initial_dir('output', None), os.path.expanduser('~'))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,94 @@
+"""
+Tests for the JSON helpers
+"""
+
+import unittest
+import os
+import sys
+import json
+import shutil
+import tempfile
+from unittest import mock
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from meeting_analyzer import json_utils
+
+
+# Keys out of order, non-ASCII text and integer keys, as in analysis results
+SAMPLE = {
+    "zeta": [1, 2.5, None, True],
+    "alpha": {"text": "Grüße, 会议", 3: "frame"},
+    "segments": [{"start": 0.0, "end": 1.25, "text": "hello"}],
+}
+
+
+class TestJsonUtils(unittest.TestCase):
+    """Test that the orjson and json module backends agree"""
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+    
+    def backends(self):
+        """Yield (name, patcher) for each backend; the patcher makes it the active one"""
+        yield "json", mock.patch.object(json_utils, "orjson", None)
+        if json_utils.orjson is not None:
+            yield "orjson", mock.patch.object(json_utils, "orjson", json_utils.orjson)
+    
+    def dumps_both(self, obj, **kwargs):
+        """Serialize with each backend, returning {backend: bytes}"""
+        results = {}
+        for name, patcher in self.backends():
+            with patcher:
+                results[name] = json_utils.dumps(obj, **kwargs)
+        return results
+    
+    def test_dumps_parity(self):
+        """Test that both backends serialize to the same document"""
+        for name, data in self.dumps_both(SAMPLE).items():
+            self.assertEqual(json.loads(data), json.loads(json.dumps(SAMPLE)), name)
+    
+    def test_sort_keys(self):
+        """Test that sort_keys gives identical bytes for equal objects"""
+        # The json module cannot sort integer keys among string keys
+        sample = {"zeta": SAMPLE["zeta"], "alpha": {"text": "Grüße"}, "segments": SAMPLE["segments"]}
+        reordered = dict(reversed(list(sample.items())))
+        for name, patcher in self.backends():
+            with patcher:
+                self.assertEqual(json_utils.dumps(sample, sort_keys=True),
+                                 json_utils.dumps(reordered, sort_keys=True), name)
+                keys = list(json_utils.loads(json_utils.dumps(reordered, sort_keys=True)))
+                self.assertEqual(keys, sorted(keys), name)
+    
+    def test_numpy_values(self):
+        """Test that NumPy scalars and arrays serialize as plain numbers and lists"""
+        data = {"score": np.float32(0.5), "count": np.int64(3), "values": np.arange(3)}
+        for name, result in self.dumps_both(data).items():
+            self.assertEqual(json.loads(result), {"score": 0.5, "count": 3, "values": [0, 1, 2]}, name)
+    
+    def test_dump_indent(self):
+        """Test that dump() writes compact or two-space indented JSON and a newline"""
+        for name, patcher in self.backends():
+            for indent in (False, True):
+                path = os.path.join(self.tmp_dir, f"{name}_{indent}.json")
+                with patcher:
+                    json_utils.dump(SAMPLE, path, indent=indent)
+                with open(path, 'rb') as f:
+                    data = f.read()
+                self.assertTrue(data.endswith(b"}\n"), name)
+                self.assertEqual(json.loads(data), json.loads(json.dumps(SAMPLE)), name)
+                self.assertEqual(b'\n  "zeta"' in data, indent, name)
+    
+    def test_loads_error(self):
+        """Test that malformed input raises JSONDecodeError, a json.JSONDecodeError"""
+        self.assertTrue(issubclass(json_utils.JSONDecodeError, json.JSONDecodeError))
+        with self.assertRaises(json_utils.JSONDecodeError):
+            json_utils.loads(b"{not json")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,6 +5,7 @@ Tests for hardware profile configuration
 import unittest
 import os
 import sys
+from dataclasses import FrozenInstanceError
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -27,51 +28,49 @@ class TestProfiles(unittest.TestCase):
         profile = get_profile('laptop')
         
         # Check required fields
-        self.assertIn('whisper_model', profile)
-        self.assertIn('vision_model', profile)
-        self.assertIn('text_model', profile)
-        self.assertIn('vision_on_cpu', profile)
-        self.assertIn('description', profile)
+        self.assertTrue(hasattr(profile, 'whisper_model'))
+        self.assertTrue(hasattr(profile, 'vision_model'))
+        self.assertTrue(hasattr(profile, 'text_model'))
+        self.assertTrue(hasattr(profile, 'vision_on_cpu'))
+        self.assertTrue(hasattr(profile, 'description'))
         
         # Check values
-        self.assertEqual(profile['whisper_model'], 'small')
-        self.assertEqual(profile['vision_on_cpu'], True)
-        self.assertIsInstance(profile['description'], str)
+        self.assertEqual(profile.whisper_model, 'small')
+        self.assertEqual(profile.compute_type, 'int8')
+        self.assertEqual(profile.vision_on_cpu, True)
+        self.assertIsInstance(profile.description, str)
     
     def test_pc_profile_structure(self):
         """Test PC profile has required fields"""
         profile = get_profile('pc')
         
         # Check required fields
-        self.assertIn('whisper_model', profile)
-        self.assertIn('vision_model', profile)
-        self.assertIn('text_model', profile)
-        self.assertIn('vision_on_cpu', profile)
-        self.assertIn('description', profile)
+        self.assertTrue(hasattr(profile, 'whisper_model'))
+        self.assertTrue(hasattr(profile, 'vision_model'))
+        self.assertTrue(hasattr(profile, 'text_model'))
+        self.assertTrue(hasattr(profile, 'vision_on_cpu'))
+        self.assertTrue(hasattr(profile, 'description'))
         
         # Check values
-        self.assertEqual(profile['whisper_model'], 'large-v3')
-        self.assertEqual(profile['vision_on_cpu'], False)
-        self.assertIsInstance(profile['description'], str)
+        self.assertEqual(profile.whisper_model, 'large-v3')
+        self.assertEqual(profile.compute_type, 'float16')
+        self.assertEqual(profile.vision_on_cpu, False)
+        self.assertIsInstance(profile.description, str)
     
     def test_get_invalid_profile(self):
         """Test that getting invalid profile raises ValueError"""
         with self.assertRaises(ValueError):
             get_profile('nonexistent')
     
-    def test_get_profile_returns_copy(self):
-        """Test that get_profile returns a copy, not original"""
-        profile1 = get_profile('laptop')
-        profile2 = get_profile('laptop')
-        
-        # Modify one copy
-        profile1['whisper_model'] = 'modified'
+    def test_profiles_are_immutable(self):
+        """Test that callers cannot modify the shared profile settings"""
+        profile = get_profile('laptop')
         
-        # Check that other copy is unchanged
-        self.assertEqual(profile2['whisper_model'], 'small')
+        with self.assertRaises(FrozenInstanceError):
+            profile.whisper_model = 'modified'
         
         # Check that original is unchanged
-        self.assertEqual(PROFILES['laptop']['whisper_model'], 'small')
+        self.assertEqual(PROFILES['laptop'].whisper_model, 'small')
     
     def test_get_profile_description(self):
         """Test profile descriptions"""
@@ -92,15 +91,15 @@ class TestProfiles(unittest.TestCase):
         """Test that all model names are strings"""
         for profile_name in list_profiles():
             profile = get_profile(profile_name)
-            self.assertIsInstance(profile['whisper_model'], str)
-            self.assertIsInstance(profile['vision_model'], str)
-            self.assertIsInstance(profile['text_model'], str)
+            self.assertIsInstance(profile.whisper_model, str)
+            self.assertIsInstance(profile.vision_model, str)
+            self.assertIsInstance(profile.text_model, str)
     
     def test_profile_vision_on_cpu_is_bool(self):
         """Test that vision_on_cpu is boolean"""
         for profile_name in list_profiles():
             profile = get_profile(profile_name)
-            self.assertIsInstance(profile['vision_on_cpu'], bool)
+            self.assertIsInstance(profile.vision_on_cpu, bool)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,96 @@
+"""
+Tests for the SRS document generator
+"""
+
+import unittest
+import os
+import sys
+import io
+import shutil
+import tempfile
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from meeting_analyzer.srs_generator import SRSGenerator
+
+
+REQUIREMENTS = {
+    "project_overview": "Meeting notes tool",
+    "functional_requirements": ["Record meetings", "Export notes"],
+}
+
+
+class TestDigestCache(unittest.TestCase):
+    """Test that documents are only rewritten when their inputs change"""
+    
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.output_dir)
+        patcher = mock.patch("sys.stdout", new_callable=io.StringIO)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def generate(self, generator, requirements, project_name="Project"):
+        """Write all three documents, returning {path: mtime_ns}"""
+        paths = [
+            generator.generate_markdown(requirements, project_name),
+            generator.generate_docx(requirements, project_name),
+            generator.save_json(requirements, project_name),
+        ]
+        return {path: os.stat(path).st_mtime_ns for path in paths if path}
+    
+    def rewind(self, mtimes):
+        """Backdate the files, so a rewrite shows up as a new mtime"""
+        for path, mtime_ns in mtimes.items():
+            os.utime(path, ns=(mtime_ns - 10**9, mtime_ns - 10**9))
+        return {path: os.stat(path).st_mtime_ns for path in mtimes}
+    
+    def test_unchanged_inputs_skip_writing(self):
+        """Test that equal requirements, in any key order, are not written again"""
+        generator = SRSGenerator(self.output_dir)
+        mtimes = self.rewind(self.generate(generator, REQUIREMENTS))
+        
+        reordered = dict(reversed(list(REQUIREMENTS.items())))
+        self.assertEqual(self.generate(generator, reordered), mtimes)
+    
+    def test_changed_inputs_are_written(self):
+        """Test that new requirements or a new project name rewrite the documents"""
+        generator = SRSGenerator(self.output_dir)
+        mtimes = self.rewind(self.generate(generator, REQUIREMENTS))
+        
+        changed = dict(REQUIREMENTS, project_overview="Meeting analysis tool")
+        for path, mtime_ns in self.generate(generator, changed).items():
+            self.assertNotEqual(mtime_ns, mtimes[path], path)
+        
+        # "My Project" and "My_Project" share output paths but not digests
+        first = self.rewind(self.generate(generator, REQUIREMENTS, "My Project"))
+        for path, mtime_ns in self.generate(generator, REQUIREMENTS, "My_Project").items():
+            self.assertNotEqual(mtime_ns, first[path], path)
+    
+    def test_deleted_output_is_regenerated(self):
+        """Test that a cached document is written again if it was removed"""
+        generator = SRSGenerator(self.output_dir)
+        path = generator.generate_markdown(REQUIREMENTS)
+        os.remove(path)
+        self.assertEqual(generator.generate_markdown(REQUIREMENTS), path)
+        self.assertTrue(os.path.exists(path))
+    
+    def test_docx_digest_survives_restart(self):
+        """Test that a new generator reuses a DOCX written from the same inputs"""
+        path = SRSGenerator(self.output_dir).generate_docx(REQUIREMENTS)
+        if path is None:
+            self.skipTest("python-docx not installed")
+        mtime_ns = self.rewind({path: os.stat(path).st_mtime_ns})[path]
+        
+        generator = SRSGenerator(self.output_dir)
+        generator.generate_docx(REQUIREMENTS)
+        self.assertEqual(os.stat(path).st_mtime_ns, mtime_ns)
+        
+        generator.generate_docx(dict(REQUIREMENTS, project_overview="Changed"))
+        self.assertNotEqual(os.stat(path).st_mtime_ns, mtime_ns)
+
+
+if __name__ == '__main__':
+    unittest.main()
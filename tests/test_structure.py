@@ -173,6 +173,35 @@ class TestModuleStructure(unittest.TestCase):
                 content,
                 f"Class {class_name} not found in {file_path}"
             )
+    
+    def test_package_import_is_lazy(self):
+        """Test that importing the package does not load heavy dependencies"""
+        import subprocess
+        
+        code = (
+            "import sys, meeting_analyzer; "
+            "print(sorted(m for m in ('cv2', 'openai', 'faster_whisper', 'docx') if m in sys.modules))"
+        )
+        output = subprocess.run(
+            [sys.executable, '-c', code], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        ).stdout
+        self.assertEqual(output.strip(), '[]')
+    
+    def test_cli_import_is_lazy(self):
+        """Test that importing the CLI defers the analyzer stack until main() runs"""
+        import subprocess
+        
+        code = (
+            "import sys, meeting_analyzer.cli; "
+            "print(sorted(m for m in ('meeting_analyzer.analyzer', 'dotenv', 'openai', 'cv2') "
+            "if m in sys.modules))"
+        )
+        output = subprocess.run(
+            [sys.executable, '-c', code], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        ).stdout
+        self.assertEqual(output.strip(), '[]')
 
 
 if __name__ == '__main__':